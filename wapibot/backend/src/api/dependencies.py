@@ -0,0 +1,20 @@
+"""Shared FastAPI dependencies.
+
+Resources created once in the app lifespan (main.py) and handed to
+endpoints via Depends().
+"""
+
+from fastapi import Request
+
+from clients.frappe_yawlit import YawlitClient
+
+
+def get_yawlit(request: Request) -> YawlitClient:
+    """Return the app-wide YawlitClient created at startup.
+
+    Example:
+        >>> @router.get("/profile")
+        ... async def profile(yawlit: YawlitClient = Depends(get_yawlit)):
+        ...     return await yawlit.customer_profile.get_profile()
+    """
+    return request.app.state.yawlit
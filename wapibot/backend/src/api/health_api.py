@@ -8,14 +8,15 @@ Provides both lightweight K8s probes and comprehensive test-based health checks.
 - /health - Full test suite health check
 """
 
+import asyncio
 import logging
-import subprocess
 from datetime import datetime
 from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse
 
 from core.config import settings
 from core.health_monitor import health_monitor
+from core.health_suite import health_suite, HEALTH_TIMEOUT
 from api.health_checks import (
     check_redis_health,
     check_celery_health,
@@ -44,44 +45,31 @@ async def health_check():
 
     Executes the test suite in tests/ and returns a concise health report.
     This is the honest health check that actually validates the system.
+    Results are cached for HEALTH_TTL seconds so frequent probes stay cheap.
 
     Returns:
         Concise test results with pass/fail status
     """
-    start_time = datetime.now()
-
     try:
-        result = subprocess.run(
-            ["python", "-m", "pytest", "tests/", "-v", "--tb=short"],
-            capture_output=True,
-            text=True,
-            timeout=60,
-            cwd="."
-        )
-
-        # Parse pytest output for summary
-        output_lines = result.stdout.strip().split('\n')
-        summary_line = next((line for line in reversed(output_lines)
-                           if 'passed' in line or 'failed' in line), "")
-
-        test_passed = result.returncode == 0
-        elapsed = (datetime.now() - start_time).total_seconds()
+        report = await health_suite.run()
 
         return {
-            "status": "healthy" if test_passed else "unhealthy",
-            "timestamp": datetime.now().isoformat(),
-            "check_duration_seconds": round(elapsed, 3),
-            "test_summary": summary_line.strip(),
-            "exit_code": result.returncode,
+            "status": "healthy" if report["exit_code"] == 0 else "unhealthy",
+            "timestamp": report["timestamp"],
+            "check_duration_seconds": report["duration"],
+            "test_summary": report["summary"],
+            "slowest_tests": report["slowest_tests"],
+            "exit_code": report["exit_code"],
+            "cached": report["cached"],
             "service": settings.app_name,
             "version": settings.app_version
         }
 
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         return {
             "status": "unhealthy",
             "timestamp": datetime.now().isoformat(),
-            "error": "Test suite timed out after 60 seconds",
+            "error": f"Test suite timed out after {HEALTH_TIMEOUT} seconds",
             "service": settings.app_name,
             "version": settings.app_version
         }
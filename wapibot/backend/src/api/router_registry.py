@@ -8,6 +8,7 @@ from fastapi import FastAPI
 from api.health_api import router as health_router
 from api.v1.chat_endpoint import router as chat_router
 from api.v1.wapi_webhook import router as wapi_router
+from api.v1.frappe_webhook import router as frappe_router
 from api.v1.admin_payment_endpoint import router as payment_router
 from api.v1.qr_endpoint import router as qr_router
 from api.v1.brain_endpoint import router as brain_router
@@ -31,6 +32,7 @@ def register_all_routes(app: FastAPI) -> None:
     # V1 API routes
     app.include_router(chat_router)
     app.include_router(wapi_router)
+    app.include_router(frappe_router)
     app.include_router(payment_router)
     app.include_router(qr_router)
     app.include_router(brain_router)
@@ -1,62 +1,71 @@
 """Brain Control API endpoints."""
 
 import logging
-from fastapi import APIRouter, HTTPException
+from uuid import uuid4
+from fastapi import APIRouter, BackgroundTasks, Header, HTTPException
 from models.brain_schemas import (
     DreamTriggerRequest,
     TrainTriggerRequest,
     BrainStatusResponse
 )
 from services.brain_service import get_brain_service
+from utils.etag_cache import ETagCache
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/brain", tags=["Brain Control"])
 
+# Polled by dashboards - serve from a 5s cache and honour If-None-Match
+BRAIN_POLL_TTL = 5
+_status_cache = ETagCache(ttl=BRAIN_POLL_TTL)
+_features_cache = ETagCache(ttl=BRAIN_POLL_TTL)
+
 
 @router.post(
     "/dream",
     summary="Trigger brain dream cycle",
     responses={
-        200: {"description": "Dream cycle triggered successfully"},
-        500: {"description": "Dream trigger failed"},
+        200: {"description": "Dream cycle queued"},
     },
 )
-async def trigger_dream_cycle(request: DreamTriggerRequest):
+async def trigger_dream_cycle(request: DreamTriggerRequest, background: BackgroundTasks):
     """Manually trigger brain dream cycle.
 
     Brain "dreams" by analyzing conversation patterns and updating decision strategies.
     Normally runs every 6 hours with 50+ conversations, but can be manually triggered.
+    Returns immediately with the task ID; the Celery task is enqueued after the
+    response is sent. Poll /brain/status for the task's outcome.
     """
-    try:
-        service = get_brain_service()
-        result = await service.trigger_dream(request.force, request.min_conversations)
-        return result
-    except Exception as e:
-        logger.error(f"Dream trigger failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    service = get_brain_service()
+    task_id = uuid4().hex
+    service.track(task_id)
+    background.add_task(
+        service.run_task, task_id, service.trigger_dream, request.force, request.min_conversations
+    )
+    return {"task_id": task_id, "status": "queued"}
 
 
 @router.post(
     "/train",
     summary="Trigger GEPA optimization",
     responses={
-        200: {"description": "Training triggered successfully"},
-        500: {"description": "Training trigger failed"},
+        200: {"description": "Training queued"},
     },
 )
-async def trigger_training(request: TrainTriggerRequest):
+async def trigger_training(request: TrainTriggerRequest, background: BackgroundTasks):
     """Trigger GEPA optimization for brain decision-making.
 
     Optimizes brain's DSPy signatures using GEPA optimizer.
     Use after significant template changes or to improve extraction accuracy.
+    Returns immediately with the task ID; the Celery task is enqueued after the
+    response is sent. Poll /brain/status for the task's outcome.
     """
-    try:
-        service = get_brain_service()
-        result = await service.trigger_training(request.optimizer, request.num_iterations)
-        return result
-    except Exception as e:
-        logger.error(f"Training trigger failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    service = get_brain_service()
+    task_id = uuid4().hex
+    service.track(task_id)
+    background.add_task(
+        service.run_task, task_id, service.trigger_training, request.optimizer, request.num_iterations
+    )
+    return {"task_id": task_id, "status": "queued"}
 
 
 @router.get(
@@ -65,17 +74,19 @@ async def trigger_training(request: TrainTriggerRequest):
     summary="Get brain system status",
     responses={
         200: {"description": "Brain status retrieved successfully"},
+        304: {"description": "Status unchanged since the ETag in If-None-Match"},
         500: {"description": "Status fetch failed"},
     },
 )
-async def get_brain_status():
+async def get_brain_status(if_none_match: str | None = Header(None)):
     """Get brain system status and metrics.
 
     Returns current operation mode, feature toggles, decision counts, and last dream time.
+    Cached for BRAIN_POLL_TTL seconds; send If-None-Match to get 304 when unchanged.
     """
     try:
         service = get_brain_service()
-        return await service.get_brain_status()
+        return await _status_cache.respond(service.get_brain_status, if_none_match)
     except Exception as e:
         logger.error(f"Status fetch failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -86,17 +97,23 @@ async def get_brain_status():
     summary="Get feature toggle states",
     responses={
         200: {"description": "Feature toggles retrieved successfully"},
+        304: {"description": "Toggles unchanged since the ETag in If-None-Match"},
         500: {"description": "Feature fetch failed"},
     },
 )
-async def get_feature_toggles():
+async def get_feature_toggles(if_none_match: str | None = Header(None)):
     """Get all feature toggle states.
 
     Returns current enabled/disabled state of brain_enabled, rl_gym_enabled, dream_enabled, etc.
+    Cached for BRAIN_POLL_TTL seconds; send If-None-Match to get 304 when unchanged.
     """
     try:
         service = get_brain_service()
-        return service.get_feature_toggles()
+
+        async def produce():
+            return service.get_feature_toggles()
+
+        return await _features_cache.respond(produce, if_none_match)
     except Exception as e:
         logger.error(f"Feature fetch failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -7,13 +7,33 @@ This endpoint uses the full V2 workflow with:
 
 import logging
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from models.chat_schemas import ChatRequest, ChatResponse
 from workflows.shared.state import BookingState
 from workflows.v2_full_workflow import v2_full_workflow
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/api/v1", tags=["Chat"])
+router = APIRouter(prefix="/api/v1", tags=["Chat"], default_response_class=ORJSONResponse)
+
+# Static initial-state fields, copied per request. Mutable values (errors,
+# history) are NOT stored here - they are created fresh in the handler so
+# requests never share a list.
+_STATE_TEMPLATE: BookingState = {
+    "customer": None,
+    "vehicle": None,
+    "appointment": None,
+    "sentiment": None,
+    "intent": None,
+    "intent_confidence": 0.0,
+    "current_step": "extract_name",
+    "completeness": 0.0,
+    "response": "",
+    "should_confirm": False,
+    "should_proceed": True,
+    "service_request_id": None,
+    "service_request": None
+}
 
 
 @router.post("/chat", response_model=ChatResponse)
@@ -103,25 +123,13 @@ async def process_chat(request: ChatRequest) -> ChatResponse:
         else:
             logger.info("[Chat] Using simple format")
 
-        # Create initial state
+        # Create initial state from the static template
         state: BookingState = {
+            **_STATE_TEMPLATE,
             "conversation_id": conversation_id,
             "user_message": user_message,
             "history": request.history or [],
-            "customer": None,
-            "vehicle": None,
-            "appointment": None,
-            "sentiment": None,
-            "intent": None,
-            "intent_confidence": 0.0,
-            "current_step": "extract_name",
-            "completeness": 0.0,
-            "errors": [],
-            "response": "",
-            "should_confirm": False,
-            "should_proceed": True,
-            "service_request_id": None,
-            "service_request": None
+            "errors": []
         }
 
         # Run V2 full workflow (atomic nodes composition)
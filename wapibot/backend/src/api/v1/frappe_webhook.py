@@ -0,0 +1,85 @@
+"""Frappe webhook endpoint for subscription lifecycle events."""
+
+import hmac
+import logging
+from fastapi import APIRouter, HTTPException, Request, Header
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import ValidationError
+from typing import Optional
+
+from clients.frappe_yawlit import get_yawlit_client
+from clients.frappe_yawlit.subscription import SubscriptionManageClient
+from clients.frappe_yawlit.subscription.events import subscription_events
+from models.frappe_webhook_schemas import SubscriptionEventPayload, SubscriptionEventResponse
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/api/v1/frappe", tags=["Frappe"], default_response_class=ORJSONResponse)
+
+
+def verify_frappe_signature(payload_body: bytes, signature: str) -> bool:
+    """Verify a Frappe webhook body signed with HMAC-SHA256 of the API secret.
+
+    Args:
+        payload_body: Raw request body bytes
+        signature: Hex digest from X-Frappe-Signature header
+
+    Returns:
+        True if signature is valid, False otherwise (including no API secret)
+    """
+    if not signature:
+        return False
+    try:
+        expected = get_yawlit_client().config.sign(payload_body)
+    except ValueError as e:
+        logger.warning("Cannot verify Frappe webhook: %s", e)
+        return False
+    return hmac.compare_digest(signature, expected)
+
+
+@router.post(
+    "/subscription-events",
+    response_model=SubscriptionEventResponse,
+    summary="Handle subscription lifecycle events from Frappe",
+    responses={
+        200: {"description": "Event applied"},
+        401: {
+            "description": "Invalid webhook signature",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Invalid webhook signature"}
+                }
+            },
+        },
+    },
+)
+async def subscription_event_webhook(
+    request: Request,
+    x_frappe_signature: Optional[str] = Header(None, alias="X-Frappe-Signature")
+) -> SubscriptionEventResponse:
+    """Apply a pause/cancel/renew event pushed by Frappe.
+
+    Evicts the cached subscription details and wakes every
+    SubscriptionManageClient.watch() iterator for the subscription, so
+    nothing has to poll Frappe for status changes.
+    """
+    raw_body = await request.body()
+    if not verify_frappe_signature(raw_body, x_frappe_signature or ""):
+        logger.warning(
+            "Invalid Frappe webhook signature from %s",
+            request.client.host if request.client else "unknown"
+        )
+        raise HTTPException(status_code=401, detail="Invalid webhook signature")
+
+    try:
+        payload = SubscriptionEventPayload.model_validate_json(raw_body)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False), body=raw_body)
+
+    SubscriptionManageClient.invalidate_subscription(payload.subscription_id)
+    delivered = subscription_events.publish(payload.model_dump())
+    logger.info(
+        "Subscription %s %s (status %s) - %d watcher(s) notified",
+        payload.subscription_id, payload.event, payload.status, delivered
+    )
+    return SubscriptionEventResponse(status="ok", delivered=delivered)
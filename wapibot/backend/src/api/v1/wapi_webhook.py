@@ -4,16 +4,26 @@ import logging
 import hmac
 import hashlib
 from fastapi import APIRouter, HTTPException, Request, Header
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import ValidationError
 from typing import Optional
 
 from core.config import settings
 from core.brain_config import get_brain_settings
 from models.wapi_schemas import WAPIWebhookPayload, WAPIResponse
 from workflows.shared.state import BookingState
-from workflows.node_groups.brain_group import create_brain_workflow
+from workflows.node_groups.brain_group import get_brain_workflow
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/api/v1/wapi", tags=["WAPI"])
+router = APIRouter(prefix="/api/v1/wapi", tags=["WAPI"], default_response_class=ORJSONResponse)
+
+# Keyed HMAC prototype built once at import - each request copies it instead
+# of re-encoding the secret and re-running the HMAC key schedule.
+# hashlib.sha256 is OpenSSL-backed, so hashing stays in C (using the CPU's
+# SHA extensions where available).
+_SECRET_BYTES = settings.wapi_webhook_secret.encode('utf-8') if settings.wapi_webhook_secret else None
+_HMAC_PROTO = hmac.new(_SECRET_BYTES, b"", hashlib.sha256) if _SECRET_BYTES else None
 
 
 def get_active_workflow():
@@ -59,24 +69,27 @@ def verify_webhook_signature(payload_body: bytes, signature: str) -> bool:
         signature: Signature from X-WAPI-Signature header
 
     Returns:
-        True if signature is valid, False otherwise
+        True if signature is valid, False otherwise (including non-hex headers)
     """
-    if not settings.wapi_webhook_secret:
+    if _HMAC_PROTO is None:
         logger.warning("WAPI webhook secret not configured - skipping signature verification")
         return True  # Allow in development when secret not set
 
     if not signature:
         return False
 
-    # Compute HMAC-SHA256 signature
-    expected_signature = hmac.new(
-        settings.wapi_webhook_secret.encode('utf-8'),
-        payload_body,
-        hashlib.sha256
-    ).hexdigest()
+    # Decode the hex header once and compare raw 32-byte digests
+    try:
+        signature_bytes = bytes.fromhex(signature)
+    except ValueError:
+        return False
+
+    # Compute HMAC-SHA256 signature from the pre-keyed prototype
+    mac = _HMAC_PROTO.copy()
+    mac.update(payload_body)
 
     # Constant-time comparison to prevent timing attacks
-    return hmac.compare_digest(signature, expected_signature)
+    return hmac.compare_digest(signature_bytes, mac.digest())
 
 
 @router.post(
@@ -105,13 +118,15 @@ def verify_webhook_signature(payload_body: bytes, signature: str) -> bool:
 )
 async def wapi_webhook(
     request: Request,
-    payload: WAPIWebhookPayload,
     x_wapi_signature: Optional[str] = Header(None, alias="X-WAPI-Signature")
 ) -> WAPIResponse:
     """Handle incoming WhatsApp messages from WAPI with signature validation.
 
     Validates HMAC-SHA256 signature, processes message through LangGraph workflow,
     and sends response via WAPI API. Security: Rejects invalid signatures in production.
+
+    The body is read raw and only parsed into WAPIWebhookPayload after the
+    signature checks out, so unsigned requests never pay for JSON parsing.
     """
     try:
         # Security: Verify webhook signature
@@ -123,6 +138,11 @@ async def wapi_webhook(
                 detail="Invalid webhook signature"
             )
 
+        try:
+            payload = WAPIWebhookPayload.model_validate_json(raw_body)
+        except ValidationError as e:
+            raise RequestValidationError(e.errors(include_url=False), body=raw_body)
+
         phone = payload.contact.phone_number
         message_id = payload.message.whatsapp_message_id
         body = payload.message.body or ""
@@ -228,7 +248,7 @@ async def wapi_webhook(
         if brain_settings.brain_enabled:
             try:
                 logger.info(f"🧠 Running brain in {brain_settings.brain_mode} mode")
-                brain_workflow = create_brain_workflow()
+                brain_workflow = get_brain_workflow()
                 # Brain observes the completed conversation (with response)
                 brain_result = await brain_workflow.ainvoke(result)
                 # Update state with brain observations
@@ -255,8 +275,9 @@ async def wapi_webhook(
             message_id=message_id
         )
 
-    except HTTPException:
+    except (HTTPException, RequestValidationError):
         # Re-raise HTTP exceptions (like 401 signature validation failure)
+        # and payload validation errors (422)
         raise
     except Exception as e:
         logger.error(f"WAPI webhook failed: {e}", exc_info=True)
@@ -29,50 +29,40 @@ Example:
     ...         "service_id": "service_id",
     ...         "slot_id": "slot_id"
     ...     })
+
+Note:
+    Don't construct YawlitClient per request - each instance owns its own
+    connection pool, so every request would pay a fresh TCP/TLS handshake.
+    The FastAPI app creates one client at startup (see main.py lifespan);
+    endpoints get it via api.dependencies.get_yawlit, everything else via
+    get_yawlit_client().
 """
 
+import importlib
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from clients.frappe_yawlit.config import FrappeClientConfig
 from clients.frappe_yawlit.utils.http_client import AsyncHTTPClient
 
-# Auth
-from clients.frappe_yawlit.auth import AuthClient
-
-# Customer
-from clients.frappe_yawlit.customer import (
-    ProfileClient,
-    AddressClient,
-    CustomerLookupClient
-)
-
-# Booking
-from clients.frappe_yawlit.booking import (
-    BookingCreateClient,
-    BookingManageClient,
-    ServiceCatalogClient,
-    SlotAvailabilityClient
-)
-
-# Subscription
-from clients.frappe_yawlit.subscription import (
-    SubscriptionPlansClient,
-    SubscriptionManageClient,
-    SubscriptionUsageClient
-)
-
-# Payment
-from clients.frappe_yawlit.payment import PaymentClient
-
-# Vendor
-from clients.frappe_yawlit.vendor import VendorPortalClient
-
-# Admin
-from clients.frappe_yawlit.admin import (
-    AdminDashboardClient,
-    AdminBookingClient
-)
+if TYPE_CHECKING:
+    from clients.frappe_yawlit.auth import AuthClient
+    from clients.frappe_yawlit.customer import ProfileClient, AddressClient, CustomerLookupClient
+    from clients.frappe_yawlit.booking import (
+        BookingCreateClient,
+        BookingManageClient,
+        ServiceCatalogClient,
+        SlotAvailabilityClient
+    )
+    from clients.frappe_yawlit.subscription import (
+        SubscriptionPlansClient,
+        SubscriptionManageClient,
+        SubscriptionUsageClient,
+        SubscriptionFacade
+    )
+    from clients.frappe_yawlit.payment import PaymentClient
+    from clients.frappe_yawlit.vendor import VendorPortalClient
+    from clients.frappe_yawlit.admin import AdminDashboardClient, AdminBookingClient
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +72,9 @@ class YawlitClient:
 
     Provides async access to all Yawlit backend services through specialized sub-clients.
     Automatically reads configuration from .env.txt via core.config settings.
+    Sub-clients (and their modules) are imported and constructed on first
+    attribute access, so code paths that only touch ``auth`` never import
+    the rest of the package.
 
     Attributes:
         auth: Authentication operations
@@ -95,12 +88,57 @@ class YawlitClient:
         subscription_plans: Subscription plans
         subscription_manage: Subscription management
         subscription_usage: Subscription usage tracking
+        subscription_view: Combined subscription reads
         payment: Payment operations
         vendor_portal: Vendor portal operations
         admin_dashboard: Admin dashboard
         admin_booking: Admin booking management
     """
 
+    # attribute -> (module, class), resolved lazily by __getattr__
+    _SUBCLIENT_SPECS = {
+        "auth": ("clients.frappe_yawlit.auth", "AuthClient"),
+        "customer_profile": ("clients.frappe_yawlit.customer", "ProfileClient"),
+        "customer_address": ("clients.frappe_yawlit.customer", "AddressClient"),
+        "customer_lookup": ("clients.frappe_yawlit.customer", "CustomerLookupClient"),
+        "booking_create": ("clients.frappe_yawlit.booking", "BookingCreateClient"),
+        "booking_manage": ("clients.frappe_yawlit.booking", "BookingManageClient"),
+        "service_catalog": ("clients.frappe_yawlit.booking", "ServiceCatalogClient"),
+        "slot_availability": ("clients.frappe_yawlit.booking", "SlotAvailabilityClient"),
+        "subscription_plans": ("clients.frappe_yawlit.subscription", "SubscriptionPlansClient"),
+        "subscription_manage": ("clients.frappe_yawlit.subscription", "SubscriptionManageClient"),
+        "subscription_usage": ("clients.frappe_yawlit.subscription", "SubscriptionUsageClient"),
+        "subscription_view": ("clients.frappe_yawlit.subscription", "SubscriptionFacade"),
+        "payment": ("clients.frappe_yawlit.payment", "PaymentClient"),
+        "vendor_portal": ("clients.frappe_yawlit.vendor", "VendorPortalClient"),
+        "admin_dashboard": ("clients.frappe_yawlit.admin", "AdminDashboardClient"),
+        "admin_booking": ("clients.frappe_yawlit.admin", "AdminBookingClient"),
+    }
+
+    # attribute -> sub-clients passed to its constructor after the HTTP client
+    _SUBCLIENT_DEPS = {
+        "customer_profile": ("customer_lookup",),
+    }
+
+    __slots__ = ("config", "http_client", *_SUBCLIENT_SPECS)
+
+    auth: "AuthClient"
+    customer_profile: "ProfileClient"
+    customer_address: "AddressClient"
+    customer_lookup: "CustomerLookupClient"
+    booking_create: "BookingCreateClient"
+    booking_manage: "BookingManageClient"
+    service_catalog: "ServiceCatalogClient"
+    slot_availability: "SlotAvailabilityClient"
+    subscription_plans: "SubscriptionPlansClient"
+    subscription_manage: "SubscriptionManageClient"
+    subscription_usage: "SubscriptionUsageClient"
+    subscription_view: "SubscriptionFacade"
+    payment: "PaymentClient"
+    vendor_portal: "VendorPortalClient"
+    admin_dashboard: "AdminDashboardClient"
+    admin_booking: "AdminBookingClient"
+
     def __init__(
         self,
         base_url: str | None = None,
@@ -139,24 +177,23 @@ class YawlitClient:
         # Create HTTP client
         self.http_client = AsyncHTTPClient(self.config, max_retries=max_retries)
 
-        # Initialize all sub-clients
-        self.auth = AuthClient(self.http_client)
-        self.customer_profile = ProfileClient(self.http_client)
-        self.customer_address = AddressClient(self.http_client)
-        self.customer_lookup = CustomerLookupClient(self.http_client)
-        self.booking_create = BookingCreateClient(self.http_client)
-        self.booking_manage = BookingManageClient(self.http_client)
-        self.service_catalog = ServiceCatalogClient(self.http_client)
-        self.slot_availability = SlotAvailabilityClient(self.http_client)
-        self.subscription_plans = SubscriptionPlansClient(self.http_client)
-        self.subscription_manage = SubscriptionManageClient(self.http_client)
-        self.subscription_usage = SubscriptionUsageClient(self.http_client)
-        self.payment = PaymentClient(self.http_client)
-        self.vendor_portal = VendorPortalClient(self.http_client)
-        self.admin_dashboard = AdminDashboardClient(self.http_client)
-        self.admin_booking = AdminBookingClient(self.http_client)
-
-        logger.info(f"YawlitClient initialized for {self.config.base_url}")
+        logger.info("YawlitClient initialized for %s", self.config.base_url)
+
+    def __getattr__(self, name: str) -> Any:
+        """Import and construct a sub-client on first access.
+
+        Only called when normal lookup fails, i.e. while the sub-client's slot
+        is still empty. The instance is stored in the slot, so later accesses
+        are plain attribute reads.
+        """
+        spec = type(self)._SUBCLIENT_SPECS.get(name)
+        if spec is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        module = importlib.import_module(spec[0])
+        deps = [getattr(self, dep) for dep in type(self)._SUBCLIENT_DEPS.get(name, ())]
+        instance = getattr(module, spec[1])(self.http_client, *deps)
+        setattr(self, name, instance)
+        return instance
 
     async def close(self) -> None:
         """Close HTTP client session.
@@ -233,4 +270,16 @@ def get_yawlit_client() -> YawlitClient:
     return _yawlit_client
 
 
-__all__ = ["YawlitClient", "get_yawlit_client"]
+async def close_yawlit_client() -> None:
+    """Close and discard the global YawlitClient singleton.
+
+    Called from the FastAPI lifespan on shutdown. Safe to call when the
+    client was never created.
+    """
+    global _yawlit_client
+    if _yawlit_client is not None:
+        await _yawlit_client.close()
+        _yawlit_client = None
+
+
+__all__ = ["YawlitClient", "get_yawlit_client", "close_yawlit_client"]
@@ -6,8 +6,9 @@ Handles admin-level booking management operations including vendor assignment.
 from typing import Dict, Any, Optional, List
 import logging
 
-from clients.frappe_yawlit.utils.http_client import AsyncHTTPClient
+from clients.frappe_yawlit.utils.http_client import AsyncHTTPClient, EMPTY_BODY
 from clients.frappe_yawlit.utils.exceptions import NotFoundError, FrappeAPIError
+from clients.frappe_yawlit.utils.fan_out import FAN_OUT_CONCURRENCY, fan_out
 
 logger = logging.getLogger(__name__)
 
@@ -61,9 +62,14 @@ class AdminBookingClient:
             ... })
         """
         try:
+            if not filters:
+                return await self.http.post_raw(
+                    "/api/method/yawlit_automotive_services.api.admin_booking_api.get_all_bookings",
+                    EMPTY_BODY
+                )
             return await self.http.post(
                 "/api/method/yawlit_automotive_services.api.admin_booking_api.get_all_bookings",
-                filters or {}
+                filters
             )
         except (NotFoundError, FrappeAPIError) as e:
             logger.error(f"Error fetching all bookings: {e}")
@@ -201,12 +207,50 @@ class AdminBookingClient:
             >>> if result['failed'] > 0:
             ...     for error in result['errors']:
             ...         print(f"Error: {error}")
+
+        Note:
+            Falls back to bulk_assign_vendors_fanout() if the server does not
+            expose the bulk endpoint (404).
         """
         try:
             return await self.http.post(
                 "/api/method/yawlit_automotive_services.api.admin_booking_api.assign_vendor_bulk",
                 {"assignments": assignments}
             )
-        except (NotFoundError, FrappeAPIError) as e:
+        except NotFoundError:
+            logger.warning("Bulk vendor assignment endpoint unavailable - falling back to fan-out")
+            return await self.bulk_assign_vendors_fanout(assignments)
+        except FrappeAPIError as e:
             logger.error(f"Error performing bulk vendor assignment: {e}")
             raise
+
+    async def bulk_assign_vendors_fanout(
+        self,
+        assignments: List[Dict[str, str]],
+        concurrency: int = FAN_OUT_CONCURRENCY
+    ) -> Dict[str, Any]:
+        """Assign vendors with concurrent assign_vendor calls.
+
+        Client-side equivalent of bulk_assign_vendors for servers without the
+        bulk endpoint. Requests overlap, so latency is roughly the slowest
+        single assignment rather than the sum of all of them.
+
+        Args:
+            assignments: List of {"booking_id", "vendor_id"} dictionaries
+            concurrency: Maximum assignments in flight at once
+
+        Returns:
+            Same shape as bulk_assign_vendors (total, successful, failed,
+            results, errors)
+
+        Example:
+            >>> result = await client.admin_booking.bulk_assign_vendors_fanout(
+            ...     assignments, concurrency=8
+            ... )
+            >>> print(f"Successfully assigned: {result['successful']}/{result['total']}")
+        """
+        return await fan_out(
+            assignments,
+            lambda a: self.assign_vendor(a["booking_id"], a["vendor_id"]),
+            concurrency
+        )
@@ -0,0 +1,138 @@
+"""Same-tick request coalescer for admin dashboard sections.
+
+A dashboard load fires several independent section requests at once
+(stats, badges, inquiries, ...). Requests submitted within one event-loop
+tick are collected and answered by a single bundle POST, DataLoader-style.
+"""
+
+import asyncio
+import copy
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from clients.frappe_yawlit.utils.exceptions import NotFoundError
+
+logger = logging.getLogger(__name__)
+
+
+class BatchUnavailable(Exception):
+    """Batch was not sent - waiters should fall back to the direct endpoint."""
+
+
+def _fresh(error: BaseException) -> BaseException:
+    """Copy an exception for one waiter, keeping the original as __cause__.
+
+    Raising one instance in every waiter would append each waiter's frames
+    to the same shared traceback.
+    """
+    clone = copy.copy(error)
+    clone.__cause__ = error
+    return clone
+
+
+class DashboardBatcher:
+    """Collects section requests for one loop tick and resolves them from one bundle.
+
+    A lone request is not worth a bundle call, so single-section ticks are
+    answered with BatchUnavailable. If the server has no bundle endpoint (404)
+    batching is disabled for the lifetime of the batcher.
+    """
+
+    def __init__(self, fetch_bundle: Callable[[Optional[int]], Awaitable[Dict[str, Any]]]):
+        """Initialize batcher.
+
+        Args:
+            fetch_bundle: Coroutine function posting to the bundle endpoint
+                with the recent-bookings limit
+        """
+        self._fetch_bundle = fetch_bundle
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
+        self._limit: Optional[int] = None
+        self.supported = True
+
+    def submit(self, section: str, limit: Optional[int] = None) -> Optional[asyncio.Future]:
+        """Queue a section for the current tick's bundle.
+
+        Args:
+            section: Bundle key (stats, badges, inquiries, recent, unassigned, quotes)
+            limit: Recent-bookings limit (only meaningful for "recent")
+
+        Returns:
+            Future resolving to the section in the same {"message": ...}
+            envelope its individual endpoint returns (BatchUnavailable if the
+            bundle omitted it), or None if the request cannot join the batch
+            and should be made directly
+        """
+        if not self.supported:
+            return None
+        if section == "recent":
+            if "recent" in self._waiters and limit != self._limit:
+                return None
+            self._limit = limit
+
+        loop = asyncio.get_running_loop()
+        if not self._waiters:
+            loop.call_soon(self._dispatch)
+        future = loop.create_future()
+        self._waiters.setdefault(section, []).append(future)
+        return future
+
+    async def load(
+        self,
+        section: str,
+        limit: Optional[int],
+        direct: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Resolve a section from this tick's bundle, or call direct() instead.
+
+        Args:
+            section: Bundle key for the section
+            limit: Recent-bookings limit (only meaningful for "recent")
+            direct: Coroutine function calling the section's own endpoint
+
+        Returns:
+            The section in its {"message": ...} envelope
+        """
+        future = self.submit(section, limit)
+        if future is not None:
+            try:
+                return await future
+            except BatchUnavailable:
+                pass
+        return await direct()
+
+    def _dispatch(self) -> None:
+        """Detach the current batch and send it."""
+        waiters, limit = self._waiters, self._limit
+        self._waiters, self._limit = {}, None
+        asyncio.ensure_future(self._flush(waiters, limit))
+
+    async def _flush(self, waiters: Dict[str, List[asyncio.Future]], limit: Optional[int]) -> None:
+        """Fetch the bundle and resolve every waiting future."""
+        sections: Dict[str, Any] = {}
+        error: Optional[BaseException] = None
+
+        if len(waiters) == 1:
+            error = BatchUnavailable()
+        else:
+            try:
+                bundle = await self._fetch_bundle(limit)
+                sections = bundle.get("message") or {}
+            except NotFoundError:
+                logger.warning("Dashboard bundle endpoint unavailable - using individual calls")
+                self.supported = False
+                error = BatchUnavailable()
+            except Exception as e:
+                error = e
+
+        for section, futures in waiters.items():
+            for future in futures:
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(_fresh(error))
+                elif section not in sections:
+                    # Bundle left this section out - fetch it individually
+                    future.set_exception(BatchUnavailable())
+                else:
+                    future.set_result({"message": sections[section]})
@@ -3,17 +3,41 @@
 Handles admin dashboard statistics, counts, and overview data.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, AsyncIterator, Iterable, List, Optional, Final
+import asyncio
 import logging
 
 from clients.frappe_yawlit.utils.http_client import AsyncHTTPClient
-from clients.frappe_yawlit.utils.exceptions import NotFoundError, FrappeAPIError
+from clients.frappe_yawlit.utils.decorators import log_errors
+from clients.frappe_yawlit.admin.dashboard_batcher import DashboardBatcher
+from clients.frappe_yawlit.admin.dashboard_events import DASHBOARD_POLL_INTERVAL, dashboard_events
+from clients.frappe_yawlit.admin.dashboard_prefetch import PREFETCH_TTL, DashboardPrefetch
 
 logger = logging.getLogger(__name__)
 
+# Frappe endpoints
+_EP_EVENTS: Final = "/api/method/yawlit_automotive_services.api.admin_dashboard.stream_events"
+_EP_BUNDLE: Final = "/api/method/yawlit_automotive_services.api.admin_dashboard.get_bundle"
+_EP_STATS: Final = "/api/method/yawlit_automotive_services.api.admin_dashboard.get_dashboard_stats"
+_EP_BADGE_COUNTS: Final = "/api/method/yawlit_automotive_services.api.admin_dashboard.get_badge_counts"
+_EP_PENDING_INQUIRIES: Final = "/api/method/yawlit_automotive_services.api.admin_dashboard.get_pending_inquiries"
+_EP_RECENT_BOOKINGS: Final = "/api/method/yawlit_automotive_services.api.admin_dashboard.get_recent_bookings"
+_EP_UNASSIGNED_BOOKINGS: Final = "/api/method/yawlit_automotive_services.api.admin_dashboard.get_unassigned_bookings"
+_EP_SUBSCRIPTION_QUOTATIONS: Final = "/api/method/yawlit_automotive_services.api.admin_dashboard.get_subscription_quotations"
+
+
+def _limit_payload(limit: Optional[int]) -> Optional[Dict[str, Any]]:
+    """Send limit only when set - unset filters add noise to coalescing keys."""
+    return {"limit": limit} if limit is not None else None
+
 
 class AdminDashboardClient:
-    """Handle admin dashboard data and statistics operations."""
+    """Handle admin dashboard data and statistics operations.
+
+    Section getters issued in the same event-loop tick (e.g. a dashboard
+    page load) are coalesced into one get_bundle round-trip. warmup()
+    speculatively starts the list sections an admin usually opens next.
+    """
 
     def __init__(self, http_client: AsyncHTTPClient):
         """Initialize admin dashboard client.
@@ -22,6 +46,155 @@ class AdminDashboardClient:
             http_client: Async HTTP client instance
         """
         self.http = http_client
+        self._batcher = DashboardBatcher(
+            lambda limit: self.http.post(_EP_BUNDLE, _limit_payload(limit))
+        )
+        self._prefetch = DashboardPrefetch(PREFETCH_TTL)
+
+    async def warmup(self, limit: Optional[int] = 25) -> None:
+        """Speculatively start the list sections usually opened after the dashboard.
+
+        Kicks off recent bookings, unassigned bookings and pending inquiries
+        in the background. The next matching getter call within PREFETCH_TTL
+        seconds awaits that task instead of issuing a new request.
+
+        Args:
+            limit: Recent-bookings limit to prefetch
+
+        Example:
+            >>> await client.admin_dashboard.warmup(limit=25)
+            >>> stats = await client.admin_dashboard.get_stats()
+            >>> recent = await client.admin_dashboard.get_recent_bookings(25)  # prefetched
+        """
+        self._prefetch.start({
+            ("recent", limit): lambda: self.get_recent_bookings(limit),
+            ("unassigned", None): self.get_unassigned_bookings,
+            ("inquiries", None): self.get_pending_inquiries,
+        })
+
+    @log_errors("fetching {what}")
+    async def _load(
+        self,
+        section: str,
+        endpoint: str,
+        what: str,
+        payload: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Fetch one dashboard section, via the tick's bundle when possible.
+
+        Args:
+            section: Bundle key for this section
+            endpoint: Individual endpoint used when the section is not batched
+            what: Description used in the error log
+            payload: Request payload for the individual endpoint
+            limit: Recent-bookings limit forwarded to the bundle
+        """
+        prefetched = self._prefetch.take(section, limit)
+        if prefetched is not None:
+            return await prefetched
+        return await self._batcher.load(section, limit, lambda: self.http.post(endpoint, payload))
+
+    @log_errors("fetching dashboard bundle")
+    async def get_dashboard_bundle(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Get all dashboard sections in a single request.
+
+        Args:
+            limit: Maximum number of recent bookings (optional)
+
+        Returns:
+            Dictionary with keys stats, badges, inquiries, recent, unassigned
+            and quotes - each matching the corresponding individual getter
+
+        Example:
+            >>> bundle = await client.admin_dashboard.get_dashboard_bundle(limit=10)
+            >>> print(f"Total bookings: {bundle['stats']['total_bookings']}")
+        """
+        return await self.http.post(_EP_BUNDLE, _limit_payload(limit))
+
+    async def fetch_all(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Fetch every dashboard section concurrently.
+
+        The six getters are independent, so they are issued together with
+        asyncio.gather - one bundle round-trip when the server supports it,
+        otherwise six overlapping requests (httpx's default pool allows far
+        more than six connections, so they don't serialize at the connector).
+
+        Args:
+            limit: Maximum number of recent bookings (optional)
+
+        Returns:
+            Dictionary with keys stats, badges, inquiries, recent, unassigned
+            and quotes. A section that failed holds its exception instead of
+            data, so one bad section doesn't blank the whole dashboard.
+
+        Example:
+            >>> sections = await client.admin_dashboard.fetch_all(limit=10)
+            >>> if not isinstance(sections["stats"], Exception):
+            ...     print(f"Total bookings: {sections['stats']['total_bookings']}")
+        """
+        stats, badges, inquiries, recent, unassigned, quotes = await asyncio.gather(
+            self.get_stats(),
+            self.get_badge_counts(),
+            self.get_pending_inquiries(),
+            self.get_recent_bookings(limit),
+            self.get_unassigned_bookings(),
+            self.get_pending_quotes(),
+            return_exceptions=True
+        )
+        return {
+            "stats": stats,
+            "badges": badges,
+            "inquiries": inquiries,
+            "recent": recent,
+            "unassigned": unassigned,
+            "quotes": quotes
+        }
+
+    def subscribe_dashboard_events(
+        self,
+        limit: Optional[int] = None,
+        poll_interval: float = DASHBOARD_POLL_INTERVAL
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield dashboard sections as they change, instead of polling all six.
+
+        Sections named by the event stream are dropped from the prefetch
+        cache and re-fetched together, so they share one bundle round-trip.
+        Falls back to polling fetch_all() (see dashboard_events).
+
+        Args:
+            limit: Recent-bookings limit used when re-fetching
+            poll_interval: Seconds between polls in fallback mode
+
+        Example:
+            >>> async for changed in client.admin_dashboard.subscribe_dashboard_events():
+            ...     if "badges" in changed:
+            ...         render_badges(changed["badges"])
+        """
+        async def refresh(sections: List[str]) -> Dict[str, Any]:
+            self._prefetch.invalidate(sections)
+            return await self._refresh(sections, limit)
+
+        return dashboard_events(
+            self.http.stream_events(_EP_EVENTS), refresh, lambda: self.fetch_all(limit), poll_interval
+        )
+
+    async def _refresh(self, sections: Iterable[str], limit: Optional[int]) -> Dict[str, Any]:
+        """Re-fetch the given sections concurrently (one bundle tick)."""
+        getters = {
+            "stats": self.get_stats,
+            "badges": self.get_badge_counts,
+            "inquiries": self.get_pending_inquiries,
+            "recent": lambda: self.get_recent_bookings(limit),
+            "unassigned": self.get_unassigned_bookings,
+            "quotes": self.get_pending_quotes,
+        }
+        sections = list(sections)
+        results = await asyncio.gather(
+            *(getters[name]() for name in sections),
+            return_exceptions=True
+        )
+        return dict(zip(sections, results))
 
     async def get_stats(self) -> Dict[str, Any]:
         """Get comprehensive dashboard statistics.
@@ -44,13 +217,11 @@ class AdminDashboardClient:
             >>> print(f"Revenue today: ₹{stats['today_revenue']}")
             >>> print(f"Active subscriptions: {stats['active_subscriptions']}")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.admin_dashboard.get_dashboard_stats"
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching dashboard stats: {e}")
-            raise
+        return await self._load(
+            "stats",
+            _EP_STATS,
+            "dashboard stats"
+        )
 
     async def get_badge_counts(self) -> Dict[str, Any]:
         """Get badge notification counts for admin alerts.
@@ -71,13 +242,11 @@ class AdminDashboardClient:
             >>> if badges['unassigned_bookings'] > 0:
             ...     print(f"Bookings need assignment: {badges['unassigned_bookings']}")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.admin_dashboard.get_badge_counts"
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching badge counts: {e}")
-            raise
+        return await self._load(
+            "badges",
+            _EP_BADGE_COUNTS,
+            "badge counts"
+        )
 
     async def get_pending_inquiries(self) -> Dict[str, Any]:
         """Get list of pending customer inquiries.
@@ -97,13 +266,11 @@ class AdminDashboardClient:
             >>> for inquiry in inquiries:
             ...     print(f"[{inquiry['priority']}] {inquiry['customer_name']}: {inquiry['inquiry_type']}")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.admin_dashboard.get_pending_inquiries"
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching pending inquiries: {e}")
-            raise
+        return await self._load(
+            "inquiries",
+            _EP_PENDING_INQUIRIES,
+            "pending inquiries"
+        )
 
     async def get_recent_bookings(self, limit: Optional[int] = None) -> Dict[str, Any]:
         """Get recent bookings for quick overview.
@@ -128,14 +295,13 @@ class AdminDashboardClient:
             >>> for booking in recent:
             ...     print(f"{booking['booking_id']}: {booking['customer_name']} - {booking['status']}")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.admin_dashboard.get_recent_bookings",
-                {"limit": limit}
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching recent bookings: {e}")
-            raise
+        return await self._load(
+            "recent",
+            _EP_RECENT_BOOKINGS,
+            "recent bookings",
+            payload=_limit_payload(limit),
+            limit=limit
+        )
 
     async def get_unassigned_bookings(self) -> Dict[str, Any]:
         """Get bookings that need vendor assignment.
@@ -156,13 +322,11 @@ class AdminDashboardClient:
             >>> for booking in unassigned:
             ...     print(f"Urgent: {booking['booking_id']} - {booking['service_name']} on {booking['booking_date']}")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.admin_dashboard.get_unassigned_bookings"
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching unassigned bookings: {e}")
-            raise
+        return await self._load(
+            "unassigned",
+            _EP_UNASSIGNED_BOOKINGS,
+            "unassigned bookings"
+        )
 
     async def get_pending_quotes(self) -> Dict[str, Any]:
         """Get pending subscription quotations.
@@ -182,10 +346,8 @@ class AdminDashboardClient:
             >>> for quote in quotes:
             ...     print(f"{quote['quote_id']}: {quote['customer_name']} - {quote['plan_name']} (₹{quote['amount']})")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.admin_dashboard.get_subscription_quotations"
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching pending quotes: {e}")
-            raise
+        return await self._load(
+            "quotes",
+            _EP_SUBSCRIPTION_QUOTATIONS,
+            "pending quotes"
+        )
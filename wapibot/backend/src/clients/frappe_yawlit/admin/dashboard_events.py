@@ -0,0 +1,60 @@
+"""Push-based dashboard change feed with a polling fallback.
+
+Listens on Frappe's server-sent event stream; each event names the
+sections that changed (``{"sections": ["badges", "unassigned"]}``) and
+only those are re-fetched. If the stream is unavailable or drops, falls
+back to polling every section and yielding only those whose data changed.
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List
+
+from clients.frappe_yawlit.utils.exceptions import FrappeAPIError
+
+logger = logging.getLogger(__name__)
+
+DASHBOARD_POLL_INTERVAL = 30  # seconds - only used when the event stream is unavailable
+
+# Section names shared by fetch_all, get_bundle and the event stream
+SECTIONS = frozenset({"stats", "badges", "inquiries", "recent", "unassigned", "quotes"})
+
+
+async def dashboard_events(
+    stream: AsyncIterator[Dict[str, Any]],
+    refresh: Callable[[List[str]], Awaitable[Dict[str, Any]]],
+    fetch_all: Callable[[], Awaitable[Dict[str, Any]]],
+    poll_interval: float = DASHBOARD_POLL_INTERVAL
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield changed dashboard sections, from the event stream or by polling.
+
+    Args:
+        stream: Server-sent events from the dashboard events endpoint
+        refresh: Coroutine function re-fetching the named sections
+        fetch_all: Coroutine function fetching every section (fallback)
+        poll_interval: Seconds between polls in fallback mode
+
+    Yields:
+        Dictionary of changed section name -> fresh data (or the exception
+        that section raised)
+    """
+    try:
+        async for event in stream:
+            sections = [s for s in event.get("sections", ()) if s in SECTIONS]
+            if sections:
+                yield await refresh(sections)
+        logger.info("Dashboard event stream closed, falling back to polling")
+    except FrappeAPIError as e:
+        logger.warning("Dashboard event stream unavailable, falling back to polling: %s", e)
+
+    previous: Dict[str, Any] = {}
+    while True:
+        sections = await fetch_all()
+        changed = {
+            name: data for name, data in sections.items()
+            if isinstance(data, Exception) or previous.get(name) != data
+        }
+        previous.update(sections)
+        if changed:
+            yield changed
+        await asyncio.sleep(poll_interval)
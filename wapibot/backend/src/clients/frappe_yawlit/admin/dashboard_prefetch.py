@@ -0,0 +1,76 @@
+"""Speculative prefetch of admin dashboard sections.
+
+After the dashboard loads, an admin usually opens one of the list views
+next. warmup() starts those loads in the background; a matching getter
+call within PREFETCH_TTL seconds awaits the running task instead of
+issuing its own request.
+"""
+
+import asyncio
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+PREFETCH_TTL = 30  # seconds a speculative result may be served
+
+# (section, recent-bookings limit)
+PrefetchKey = Tuple[str, Optional[int]]
+
+# Set inside prefetch-spawned tasks so they fetch instead of awaiting themselves
+_prefetching: ContextVar[bool] = ContextVar("dashboard_prefetching", default=False)
+
+
+def _consume_exception(task: asyncio.Task) -> None:
+    """Mark an unused prefetch failure as retrieved (it was already logged)."""
+    if not task.cancelled():
+        task.exception()
+
+
+class DashboardPrefetch:
+    """Holds in-flight or finished prefetch tasks until used or expired."""
+
+    def __init__(self, ttl: float = PREFETCH_TTL):
+        """Initialize with nothing prefetched.
+
+        Args:
+            ttl: Seconds a prefetched result may be served
+        """
+        self.ttl = ttl
+        self._tasks: Dict[PrefetchKey, Tuple[float, asyncio.Task]] = {}
+
+    def start(self, loaders: Dict[PrefetchKey, Callable[[], Awaitable[Any]]]) -> None:
+        """Start each loader as a background task, replacing older prefetches.
+
+        Args:
+            loaders: Coroutine functions keyed by (section, limit)
+        """
+        expires_at = asyncio.get_running_loop().time() + self.ttl
+        token = _prefetching.set(True)
+        try:
+            tasks = {key: asyncio.create_task(load()) for key, load in loaders.items()}
+        finally:
+            _prefetching.reset(token)
+
+        for key, task in tasks.items():
+            task.add_done_callback(_consume_exception)
+            self._tasks[key] = (expires_at, task)
+
+    def take(self, section: str, limit: Optional[int]) -> Optional[asyncio.Task]:
+        """Pop a still-fresh prefetch task for this section, if any.
+
+        Always None inside a prefetch task, which must do the actual fetch.
+        """
+        if _prefetching.get():
+            return None
+        entry = self._tasks.pop((section, limit), None)
+        if entry is None:
+            return None
+        expires_at, task = entry
+        if asyncio.get_running_loop().time() > expires_at:
+            return None
+        return task
+
+    def invalidate(self, sections: Iterable[str]) -> None:
+        """Drop prefetched results for sections that changed server-side."""
+        sections = set(sections)
+        for key in [key for key in self._tasks if key[0] in sections]:
+            del self._tasks[key]
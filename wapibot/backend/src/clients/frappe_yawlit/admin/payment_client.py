@@ -46,7 +46,7 @@ class AdminPaymentClient:
             Payment details if found in Frappe, None otherwise
         """
         # TODO: Implement Frappe payment lookup
-        logger.warning(f"Payment check not implemented yet: {session_id}")
+        logger.warning("Payment check not implemented yet: %s", session_id)
         return None
 
     async def get_payment_receipt(self, payment_id: str) -> Optional[Dict[str, Any]]:
@@ -62,7 +62,7 @@ class AdminPaymentClient:
             Payment receipt details if found
         """
         # TODO: Implement payment receipt fetch
-        logger.warning(f"Receipt fetch not implemented yet: {payment_id}")
+        logger.warning("Receipt fetch not implemented yet: %s", payment_id)
         return None
 
     async def setup_webhook(self, webhook_url: str) -> bool:
@@ -78,5 +78,5 @@ class AdminPaymentClient:
             True if webhook setup successful
         """
         # TODO: Implement webhook registration
-        logger.warning(f"Webhook setup not implemented yet: {webhook_url}")
+        logger.warning("Webhook setup not implemented yet: %s", webhook_url)
         return False
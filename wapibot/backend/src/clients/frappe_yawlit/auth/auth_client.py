@@ -3,10 +3,22 @@
 Handles user authentication, registration, and profile management.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Final
 
+from clients.frappe_yawlit.payloads import ProfilePayload
 from clients.frappe_yawlit.utils.http_client import AsyncHTTPClient
 
+# Frappe endpoints
+_EP_LOGIN_WITH_EMAIL_OR_PHONE: Final = "/api/method/yawlit_automotive_services.api.auth.unified_login.login_with_email_or_phone"
+_EP_LOGIN_WITH_PHONE: Final = "/api/method/yawlit_automotive_services.api.auth.phone_password.login_with_phone"
+_EP_REGISTER_WITH_EMAIL_OR_PHONE: Final = "/api/method/yawlit_automotive_services.api.auth.unified_register.register_with_email_or_phone"
+_EP_COMPLETE_PROFILE: Final = "/api/method/yawlit_automotive_services.api.customer_portal.complete_profile"
+_EP_GET_USER_PREFILL_DATA: Final = "/api/method/yawlit_automotive_services.api.customer_portal.get_user_prefill_data"
+_EP_SEND_OTP: Final = "/api/method/yawlit_automotive_services.api.auth.phone_otp.send_otp"
+_EP_VERIFY_OTP_AND_LOGIN: Final = "/api/method/yawlit_automotive_services.api.auth.phone_otp.verify_otp_and_login"
+_EP_SEND_RESET_EMAIL: Final = "/api/method/yawlit_automotive_services.api.auth.password_reset.send_reset_email"
+_EP_LOGOUT: Final = "/api/method/logout"
+
 
 class AuthClient:
     """Handle authentication operations for customers and vendors."""
@@ -34,7 +46,7 @@ class AuthClient:
             >>> print(result["message"])  # Login successful
         """
         return await self.http.post(
-            "/api/method/yawlit_automotive_services.api.auth.unified_login.login_with_email_or_phone",
+            _EP_LOGIN_WITH_EMAIL_OR_PHONE,
             {
                 "username": email,
                 "password": password
@@ -55,7 +67,7 @@ class AuthClient:
             >>> result = await client.auth.login_phone("9876543210", "password123")
         """
         return await self.http.post(
-            "/api/method/yawlit_automotive_services.api.auth.phone_password.login_with_phone",
+            _EP_LOGIN_WITH_PHONE,
             {
                 "phone_number": phone,
                 "password": password
@@ -81,7 +93,7 @@ class AuthClient:
             ... )
         """
         return await self.http.post(
-            "/api/method/yawlit_automotive_services.api.auth.unified_register.register_with_email_or_phone",
+            _EP_REGISTER_WITH_EMAIL_OR_PHONE,
             {
                 "customer_name": name,
                 "email_or_phone": email_or_phone,
@@ -89,11 +101,11 @@ class AuthClient:
             }
         )
 
-    async def complete_profile(self, profile_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def complete_profile(self, profile_data: ProfilePayload | Dict[str, Any]) -> Dict[str, Any]:
         """Complete customer profile after registration.
 
         Args:
-            profile_data: Profile information including:
+            profile_data: ProfilePayload, or a dict of profile information including:
                 - customer_name: Full name
                 - email: Email address
                 - phone_number: Phone number
@@ -126,7 +138,7 @@ class AuthClient:
             ... })
         """
         return await self.http.post(
-            "/api/method/yawlit_automotive_services.api.customer_portal.complete_profile",
+            _EP_COMPLETE_PROFILE,
             {"data": profile_data}
         )
 
@@ -141,7 +153,7 @@ class AuthClient:
             >>> print(data.get("email"))  # Pre-filled email
         """
         return await self.http.post(
-            "/api/method/yawlit_automotive_services.api.customer_portal.get_user_prefill_data"
+            _EP_GET_USER_PREFILL_DATA
         )
 
     async def send_otp(self, phone: str) -> Dict[str, Any]:
@@ -158,7 +170,7 @@ class AuthClient:
             >>> print(result["message"])  # OTP sent successfully
         """
         return await self.http.post(
-            "/api/method/yawlit_automotive_services.api.auth.phone_otp.send_otp",
+            _EP_SEND_OTP,
             {"phone_number": phone}
         )
 
@@ -176,7 +188,7 @@ class AuthClient:
             >>> result = await client.auth.verify_otp("9876543210", "123456")
         """
         return await self.http.post(
-            "/api/method/yawlit_automotive_services.api.auth.phone_otp.verify_otp_and_login",
+            _EP_VERIFY_OTP_AND_LOGIN,
             {
                 "phone_number": phone,
                 "otp": otp
@@ -197,7 +209,7 @@ class AuthClient:
             >>> print(result["message"])  # Reset link sent
         """
         return await self.http.post(
-            "/api/method/yawlit_automotive_services.api.auth.password_reset.send_reset_email",
+            _EP_SEND_RESET_EMAIL,
             {"email": email}
         )
 
@@ -210,6 +222,6 @@ class AuthClient:
         Example:
             >>> result = await client.auth.logout()
         """
-        result = await self.http.post("/api/method/logout")
+        result = await self.http.post(_EP_LOGOUT)
         self.http.config.clear_session()
         return result
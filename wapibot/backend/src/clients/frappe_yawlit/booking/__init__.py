@@ -1,13 +1,14 @@
 """Booking management client modules."""
 
 from clients.frappe_yawlit.booking.create_client import BookingCreateClient
-from clients.frappe_yawlit.booking.manage_client import BookingManageClient
+from clients.frappe_yawlit.booking.manage_client import BatchCall, BookingManageClient
 from clients.frappe_yawlit.booking.catalog_client import ServiceCatalogClient
 from clients.frappe_yawlit.booking.slot_client import SlotAvailabilityClient
 
 __all__ = [
     "BookingCreateClient",
     "BookingManageClient",
+    "BatchCall",
     "ServiceCatalogClient",
     "SlotAvailabilityClient"
 ]
@@ -3,13 +3,20 @@
 Handles service browsing, filtering, and vehicle type management.
 """
 
-from typing import Dict, Any, Optional
-import logging
+from typing import Dict, Any, Optional, Final
 
 from clients.frappe_yawlit.utils.http_client import AsyncHTTPClient
-from clients.frappe_yawlit.utils.exceptions import NotFoundError, FrappeAPIError
+from clients.frappe_yawlit.utils.decorators import log_errors
+from clients.frappe_yawlit.utils.cache import ttl_cache
 
-logger = logging.getLogger(__name__)
+# Frappe endpoints
+_EP_GET_LIST: Final = "/api/method/frappe.client.get_list"
+_EP_GET_FILTERED_SERVICES: Final = "/api/method/yawlit_automotive_services.api.customer_portal.get_filtered_services"
+_EP_GET_OPTIONAL_ADDONS: Final = "/api/method/yawlit_automotive_services.api.booking.get_optional_addons"
+_EP_GET_ACTIVE_VEHICLE_TYPES_LIST: Final = "/api/method/yawlit_automotive_services.customer_management.doctype.vehicle_type.vehicle_type.get_active_vehicle_types_list"
+
+# Categories and vehicle types are reference data that rarely change
+CATALOG_CACHE_TTL = 300  # seconds
 
 
 class ServiceCatalogClient:
@@ -23,9 +30,14 @@ class ServiceCatalogClient:
         """
         self.http = http_client
 
+    @ttl_cache(ttl=CATALOG_CACHE_TTL)
+    @log_errors("fetching service categories")
     async def get_categories(self) -> Dict[str, Any]:
         """Get all active service categories.
 
+        Cached for CATALOG_CACHE_TTL seconds; call
+        ``ServiceCatalogClient.get_categories.cache_clear()`` after edits.
+
         Returns:
             List of service categories with:
                 - name: Category ID
@@ -39,20 +51,17 @@ class ServiceCatalogClient:
             >>> for cat in categories:
             ...     print(cat["category_name"], cat["description"])
         """
-        try:
-            return await self.http.post(
-                "/api/method/frappe.client.get_list",
-                {
-                    "doctype": "ServiceCategory",
-                    "fields": ["name", "category_name", "category_slug", "icon", "description"],
-                    "filters": {"active": 1},
-                    "order_by": "display_order asc"
-                }
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching service categories: {e}")
-            raise
-
+        return await self.http.post(
+            _EP_GET_LIST,
+            {
+                "doctype": "ServiceCategory",
+                "fields": ["name", "category_name", "category_slug", "icon", "description"],
+                "filters": {"active": 1},
+                "order_by": "display_order asc"
+            }
+        )
+
+    @log_errors("fetching filtered services")
     async def get_filtered_services(
         self,
         category: Optional[str] = None,
@@ -88,19 +97,18 @@ class ServiceCatalogClient:
             ...     vehicle_type="Sedan"
             ... )
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.customer_portal.get_filtered_services",
-                {
-                    "category": category,
-                    "frequency_type": frequency_type,
-                    "vehicle_type": vehicle_type
-                }
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching filtered services: {e}")
-            raise
-
+        return await self.http.post(
+            _EP_GET_FILTERED_SERVICES,
+            {
+                k: v for k, v in (
+                    ("category", category),
+                    ("frequency_type", frequency_type),
+                    ("vehicle_type", vehicle_type)
+                ) if v is not None
+            }
+        )
+
+    @log_errors("fetching optional addons for {service_id}")
     async def get_optional_addons(self, service_id: str) -> Dict[str, Any]:
         """Get optional add-ons available for a service.
 
@@ -120,18 +128,19 @@ class ServiceCatalogClient:
             >>> for addon in addons:
             ...     print(f"{addon['addon_name']}: ₹{addon['price']}")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.booking.get_optional_addons",
-                {"product_id": service_id}
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching optional addons for {service_id}: {e}")
-            raise
+        return await self.http.post(
+            _EP_GET_OPTIONAL_ADDONS,
+            {"product_id": service_id}
+        )
 
+    @ttl_cache(ttl=CATALOG_CACHE_TTL)
+    @log_errors("fetching vehicle types")
     async def get_vehicle_types(self) -> Dict[str, Any]:
         """Get list of active vehicle types.
 
+        Cached for CATALOG_CACHE_TTL seconds; call
+        ``ServiceCatalogClient.get_vehicle_types.cache_clear()`` after edits.
+
         Returns:
             List of vehicle types with:
                 - vehicle_type: Type identifier
@@ -144,10 +153,6 @@ class ServiceCatalogClient:
             >>> for vtype in vehicle_types:
             ...     print(vtype["display_name"])
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.customer_management.doctype.vehicle_type.vehicle_type.get_active_vehicle_types_list"
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching vehicle types: {e}")
-            raise
+        return await self.http.post(
+            _EP_GET_ACTIVE_VEHICLE_TYPES_LIST
+        )
@@ -7,13 +7,16 @@ Authorization header (configured in .env.txt: FRAPPE_API_KEY, FRAPPE_API_SECRET)
 Phone-based methods are secured at the Frappe backend level.
 """
 
-from typing import Dict, Any
-import logging
+from typing import Dict, Any, Final
 
+from clients.frappe_yawlit.payloads import BookingPayload, PricePayload
 from clients.frappe_yawlit.utils.http_client import AsyncHTTPClient
-from clients.frappe_yawlit.utils.exceptions import NotFoundError, FrappeAPIError
+from clients.frappe_yawlit.utils.decorators import log_errors
 
-logger = logging.getLogger(__name__)
+# Frappe endpoints
+_EP_CREATE_BOOKING: Final = "/api/method/yawlit_automotive_services.api.booking.create_booking"
+_EP_CREATE_BOOKING_BY_PHONE: Final = "/api/method/yawlit_automotive_services.api.booking.create_booking_by_phone"
+_EP_CALCULATE_BOOKING_PRICE: Final = "/api/method/yawlit_automotive_services.api.booking.calculate_booking_price"
 
 
 class BookingCreateClient:
@@ -27,11 +30,12 @@ class BookingCreateClient:
         """
         self.http = http_client
 
-    async def create_booking(self, booking_data: Dict[str, Any]) -> Dict[str, Any]:
+    @log_errors("creating booking")
+    async def create_booking(self, booking_data: BookingPayload | Dict[str, Any]) -> Dict[str, Any]:
         """Create new one-time booking.
 
         Args:
-            booking_data: Booking information including:
+            booking_data: BookingPayload, or a dict including:
                 - service_id: Service to book
                 - vehicle_id: Vehicle for service
                 - slot_id: Time slot ID
@@ -55,15 +59,12 @@ class BookingCreateClient:
             ... })
             >>> print(result["booking_id"])
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.booking.create_booking",
-                booking_data
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error creating booking: {e}")
-            raise
+        return await self.http.post(
+            _EP_CREATE_BOOKING,
+            booking_data
+        )
 
+    @log_errors("creating booking by phone {phone_number}")
     async def create_booking_by_phone(
         self,
         phone_number: str,
@@ -129,23 +130,20 @@ class BookingCreateClient:
             ... )
             >>> print(result["message"]["booking_id"])
         """
-        try:
-            # Add phone number to booking data
-            data = {**booking_data, "phone_number": phone_number}
-
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.booking.create_booking_by_phone",
-                data
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error creating booking by phone {phone_number}: {e}")
-            raise
-
-    async def calculate_price(self, price_data: Dict[str, Any]) -> Dict[str, Any]:
+        # Add phone number to booking data
+        data = {**booking_data, "phone_number": phone_number}
+
+        return await self.http.post(
+            _EP_CREATE_BOOKING_BY_PHONE,
+            data
+        )
+
+    @log_errors("calculating booking price")
+    async def calculate_price(self, price_data: PricePayload | Dict[str, Any]) -> Dict[str, Any]:
         """Calculate booking price before creating booking.
 
         Args:
-            price_data: Price calculation parameters including:
+            price_data: PricePayload, or a dict of parameters including:
                 - service_id: Service ID
                 - vehicle_type: Vehicle type
                 - optional_addons: List of addon IDs (optional)
@@ -168,11 +166,7 @@ class BookingCreateClient:
             ... })
             >>> print(f"Total: ₹{price['total_price']}")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.booking.calculate_booking_price",
-                price_data
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error calculating booking price: {e}")
-            raise
\ No newline at end of file
+        return await self.http.post(
+            _EP_CALCULATE_BOOKING_PRICE,
+            price_data
+        )
@@ -3,18 +3,54 @@
 Handles booking retrieval, rescheduling, and cancellation operations.
 """
 
-from typing import Dict, Any, Optional
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Final
+import asyncio
 import logging
 
-from clients.frappe_yawlit.utils.http_client import AsyncHTTPClient
-from clients.frappe_yawlit.utils.exceptions import NotFoundError, FrappeAPIError
+from clients.frappe_yawlit.utils.http_client import AsyncHTTPClient, EMPTY_BODY
+from clients.frappe_yawlit.utils.decorators import wrap_errors
+from clients.frappe_yawlit.utils.exceptions import NotFoundError
+from clients.frappe_yawlit.utils.cache import session_scope, ttl_cache
 
 logger = logging.getLogger(__name__)
 
+# Frappe endpoints
+_EP_GET_CUSTOMER_BOOKINGS: Final = "/api/method/yawlit_automotive_services.api.booking.get_customer_bookings"
+_EP_GET_BOOKING_DETAILS: Final = "/api/method/yawlit_automotive_services.api.booking.get_booking_details"
+_EP_RESCHEDULE_BOOKING: Final = "/api/method/yawlit_automotive_services.api.booking_management.reschedule_booking"
+_EP_REQUEST_CANCELLATION: Final = "/api/method/yawlit_automotive_services.api.cancellation.request_cancellation"
+_EP_CHECK_CANCELLATION_ELIGIBILITY: Final = "/api/method/yawlit_automotive_services.api.cancellation.check_cancellation_eligibility"
+_EP_BATCH: Final = "/api/method/yawlit_automotive_services.api.booking.batch"
+
+# Bots re-render the same booking within a turn or two; short enough that
+# status changes made outside this client still show up quickly
+BOOKING_DETAILS_TTL = 15  # seconds
+
+
+@dataclass(slots=True)
+class BatchCall:
+    """One step of a BookingManageClient.batch() request.
+
+    Attributes:
+        call_id: Key of this call's response in the batch result
+        endpoint: Frappe method path, e.g. the get_booking_details endpoint
+        payload: Request body
+        input_from: Index of an earlier call whose result ("message") is
+            merged under this payload, or -1 to use the payload alone
+    """
+
+    call_id: str
+    endpoint: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    input_from: int = -1
+
 
 class BookingManageClient:
     """Handle booking management and lifecycle operations."""
 
+    __slots__ = ("http",)
+
     def __init__(self, http_client: AsyncHTTPClient):
         """Initialize booking manage client.
 
@@ -23,6 +59,7 @@ class BookingManageClient:
         """
         self.http = http_client
 
+    @wrap_errors("fetching bookings")
     async def get_bookings(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get customer bookings with optional filters.
 
@@ -46,18 +83,18 @@ class BookingManageClient:
             ...     {"status": "Confirmed"}
             ... )
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.booking.get_customer_bookings",
-                filters or {}
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching bookings: {e}")
-            raise
+        if not filters:
+            return await self.http.post_raw(_EP_GET_CUSTOMER_BOOKINGS, EMPTY_BODY)
+        return await self.http.post(_EP_GET_CUSTOMER_BOOKINGS, filters)
 
+    @ttl_cache(ttl=BOOKING_DETAILS_TTL, maxsize=512, scope=session_scope)
+    @wrap_errors("fetching booking details for {booking_id}")
     async def get_booking_details(self, booking_id: str) -> Dict[str, Any]:
         """Get detailed information for a specific booking.
 
+        Cached per session for BOOKING_DETAILS_TTL seconds; reschedule_booking and
+        cancel_booking evict it for every session via invalidate_booking().
+
         Args:
             booking_id: Booking document ID
 
@@ -76,15 +113,21 @@ class BookingManageClient:
             >>> print(details["service_name"])
             >>> print(details["status"])
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.booking.get_booking_details",
-                {"booking_id": booking_id}
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching booking details for {booking_id}: {e}")
-            raise
+        return await self.http.post(
+            _EP_GET_BOOKING_DETAILS,
+            {"booking_id": booking_id}
+        )
+
+    @staticmethod
+    def invalidate_booking(booking_id: str) -> None:
+        """Evict cached details for a booking after it changes.
 
+        Args:
+            booking_id: Booking ID whose details are stale
+        """
+        BookingManageClient.get_booking_details.invalidate(booking_id)
+
+    @wrap_errors("rescheduling booking {booking_id}")
     async def reschedule_booking(self, booking_id: str, new_slot: Dict[str, Any]) -> Dict[str, Any]:
         """Reschedule existing booking to a new slot.
 
@@ -94,6 +137,7 @@ class BookingManageClient:
                 - slot_id: New time slot ID
                 - date: New booking date
                 - Additional slot parameters
+                (a "booking_id" key here is ignored - booking_id wins)
 
         Returns:
             Reschedule confirmation with updated booking details
@@ -107,18 +151,15 @@ class BookingManageClient:
             ...     }
             ... )
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.booking_management.reschedule_booking",
-                {
-                    "booking_id": booking_id,
-                    **new_slot
-                }
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error rescheduling booking {booking_id}: {e}")
-            raise
+        # One C-level copy; never mutates the caller's dict
+        result = await self.http.post(
+            _EP_RESCHEDULE_BOOKING,
+            dict(new_slot, booking_id=booking_id)
+        )
+        self.invalidate_booking(booking_id)
+        return result
 
+    @wrap_errors("canceling booking {booking_id}")
     async def cancel_booking(self, booking_id: str, reason: Optional[str] = None) -> Dict[str, Any]:
         """Request cancellation of a booking.
 
@@ -136,18 +177,17 @@ class BookingManageClient:
             ... )
             >>> print(result["refund_amount"])
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.cancellation.request_cancellation",
-                {
-                    "booking_id": booking_id,
-                    "reason": reason
-                }
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error canceling booking {booking_id}: {e}")
-            raise
+        result = await self.http.post(
+            _EP_REQUEST_CANCELLATION,
+            {
+                "booking_id": booking_id,
+                "reason": reason
+            }
+        )
+        self.invalidate_booking(booking_id)
+        return result
 
+    @wrap_errors("checking cancellation eligibility for {booking_id}")
     async def check_cancellation_eligibility(self, booking_id: str) -> Dict[str, Any]:
         """Check if booking can be cancelled and refund amount.
 
@@ -169,11 +209,72 @@ class BookingManageClient:
             >>> if eligibility["can_cancel"]:
             ...     print(f"Refund: ₹{eligibility['refund_amount']}")
         """
+        return await self.http.post(
+            _EP_CHECK_CANCELLATION_ELIGIBILITY,
+            {"booking_id": booking_id}
+        )
+
+    @wrap_errors("running booking batch")
+    async def batch(self, calls: List[BatchCall]) -> Dict[str, Any]:
+        """Run a chain of booking calls in a single round-trip.
+
+        Conversational flows often go list -> details -> eligibility, each
+        step needing the previous answer. The server-side dispatcher
+        resolves the whole chain, so the bot waits ~1 RTT instead of N.
+
+        Args:
+            calls: Calls in order; input_from may only point backwards
+
+        Returns:
+            Dictionary of call_id -> the response that call would have
+            returned on its own
+
+        Example:
+            >>> results = await client.booking_manage.batch([
+            ...     BatchCall("details", _EP_GET_BOOKING_DETAILS, {"booking_id": "BKG-2025-001"}),
+            ...     BatchCall("eligibility", _EP_CHECK_CANCELLATION_ELIGIBILITY, input_from=0),
+            ... ])
+            >>> print(results["eligibility"]["message"]["can_cancel"])
+
+        Note:
+            Falls back to client-side execution if the server does not expose
+            the batch endpoint (404): independent calls run concurrently, and
+            each dependent call runs once its input is available.
+        """
+        for index, call in enumerate(calls):
+            if call.input_from >= index:
+                raise ValueError(f"Batch call {call.call_id!r} depends on a later call")
+
         try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.cancellation.check_cancellation_eligibility",
-                {"booking_id": booking_id}
+            response = await self.http.post(
+                _EP_BATCH,
+                {"calls": calls}
             )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error checking cancellation eligibility for {booking_id}: {e}")
+            return response["message"]
+        except NotFoundError:
+            logger.warning("Batch endpoint unavailable - running calls client-side")
+
+        return await self._batch_local(calls)
+
+    async def _batch_local(self, calls: List[BatchCall]) -> Dict[str, Any]:
+        """Client-side batch: each call starts as soon as its input is ready."""
+        tasks: List[asyncio.Task] = []
+
+        async def _run(call: BatchCall) -> Any:
+            payload = call.payload
+            if call.input_from >= 0:
+                forwarded = (await tasks[call.input_from]).get("message")
+                if isinstance(forwarded, dict):
+                    # Frappe drops keys a method doesn't accept
+                    payload = {**forwarded, **payload}
+            return await self.http.post(call.endpoint, payload)
+
+        for call in calls:
+            tasks.append(asyncio.create_task(_run(call)))
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
             raise
+        return {call.call_id: result for call, result in zip(calls, results)}
@@ -65,7 +65,7 @@ class SlotAvailabilityClient:
                 }
             )
         except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching available slots for {service_id} on {date}: {e}")
+            logger.error("Error fetching available slots for %s on %s: %s", service_id, date, e)
             raise
 
     async def get_calendar_availability(
@@ -109,7 +109,7 @@ class SlotAvailabilityClient:
                 }
             )
         except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching calendar availability for {service_id}: {e}")
+            logger.error("Error fetching calendar availability for %s: %s", service_id, e)
             raise
 
     async def check_slot_availability(self, slot_id: str) -> Dict[str, Any]:
@@ -139,5 +139,5 @@ class SlotAvailabilityClient:
                 {"slot_id": slot_id}
             )
         except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error checking slot availability for {slot_id}: {e}")
+            logger.error("Error checking slot availability for %s: %s", slot_id, e)
             raise
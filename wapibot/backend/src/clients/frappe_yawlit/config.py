@@ -3,8 +3,11 @@
 Reads from .env.txt via core.config settings.
 """
 
+import hashlib
+import hmac
 import logging
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
 
 from core.config import settings
 
@@ -14,6 +17,17 @@ logger = logging.getLogger(__name__)
 class FrappeClientConfig:
     """Configuration manager for Frappe API client."""
 
+    __slots__ = (
+        "base_url",
+        "api_key",
+        "api_secret",
+        "timeout",
+        "session_token",
+        "_headers_cache",
+        "_identity",
+        "_hmac_base",
+    )
+
     def __init__(
         self,
         base_url: str | None = None,
@@ -38,14 +52,49 @@ class FrappeClientConfig:
         # Session token (set after login)
         self.session_token: str | None = None
 
-        logger.info(f"Frappe client configured for: {self.base_url}")
+        # Built on first use, dropped when the session changes
+        self._headers_cache: Mapping[str, str] | None = None
+        self._identity: tuple[str, str] | None = None
+
+        # Keyed HMAC-SHA256 state, built once; sign() copies it per payload
+        self._hmac_base: hmac.HMAC | None = None
+
+        logger.info("Frappe client configured for: %s", self.base_url)
+
+    @property
+    def auth_headers(self) -> Mapping[str, str]:
+        """Authentication headers, built once per session state."""
+        if self._headers_cache is None:
+            self._headers_cache = self._build_auth_headers()
+        return self._headers_cache
 
-    def get_auth_headers(self) -> Dict[str, str]:
+    @property
+    def identity(self) -> tuple[str, str]:
+        """Who requests are made as: (base_url, hashed credential).
+
+        Changes on login/logout. Used to scope caches of per-customer data,
+        so one session never receives another session's cached response.
+        The session token is hashed so it is not kept around in cache keys.
+        """
+        if self._identity is None:
+            if self.session_token:
+                credential = "sid:" + hashlib.sha256(self.session_token.encode()).hexdigest()
+            else:
+                credential = f"key:{self.api_key or ''}"
+            self._identity = (self.base_url, credential)
+        return self._identity
+
+    def get_auth_headers(self) -> Mapping[str, str]:
         """Get authentication headers for requests.
 
         Returns:
-            Dict of headers with authentication
+            Read-only mapping of headers with authentication (shared between
+            requests - copy before modifying)
         """
+        return self.auth_headers
+
+    def _build_auth_headers(self) -> Mapping[str, str]:
+        """Build the headers for the current session/API-key state."""
         headers = {
             "Content-Type": "application/json",
             "Accept": "application/json"
@@ -59,7 +108,34 @@ class FrappeClientConfig:
         elif self.api_key and self.api_secret:
             headers["Authorization"] = f"token {self.api_key}:{self.api_secret}"
 
-        return headers
+        return MappingProxyType(headers)
+
+    def sign(self, payload: bytes) -> str:
+        """HMAC-SHA256 signature of a payload, keyed with the API secret.
+
+        The key schedule runs once; each call copies the keyed state, and
+        hashing runs in OpenSSL via hashlib.
+
+        Args:
+            payload: Raw request/webhook body bytes
+
+        Returns:
+            Lowercase hex digest
+
+        Raises:
+            ValueError: No API secret configured
+
+        Example:
+            >>> signature = config.sign(body)
+            >>> hmac.compare_digest(signature, request.headers["X-Signature"])
+        """
+        if self._hmac_base is None:
+            if not self.api_secret:
+                raise ValueError("Cannot sign payload: Frappe API secret is not configured")
+            self._hmac_base = hmac.new(self.api_secret.encode(), digestmod="sha256")
+        mac = self._hmac_base.copy()
+        mac.update(payload)
+        return mac.hexdigest()
 
     def set_session(self, token: str) -> None:
         """Set session token after successful login.
@@ -68,9 +144,13 @@ class FrappeClientConfig:
             token: Session token from login response
         """
         self.session_token = token
+        self._headers_cache = None
+        self._identity = None
         logger.debug("Session token updated")
 
     def clear_session(self) -> None:
         """Clear session token (logout)."""
         self.session_token = None
+        self._headers_cache = None
+        self._identity = None
         logger.debug("Session cleared")
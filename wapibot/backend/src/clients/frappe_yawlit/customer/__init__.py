@@ -1,11 +1,40 @@
-"""Customer management client modules."""
+"""Customer management client modules.
 
-from clients.frappe_yawlit.customer.profile_client import CustomerProfileClient
-from clients.frappe_yawlit.customer.address_client import CustomerAddressClient
-from clients.frappe_yawlit.customer.lookup_client import CustomerLookupClient
+Client classes are imported on first attribute access (PEP 562), so
+``from clients.frappe_yawlit.customer import CustomerLookupClient`` loads
+only lookup_client, not the profile and address modules.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from clients.frappe_yawlit.customer.profile_client import CustomerProfileClient
+    from clients.frappe_yawlit.customer.address_client import CustomerAddressClient
+    from clients.frappe_yawlit.customer.lookup_client import CustomerLookupClient
+
+    # Aliases for backward compatibility
+    ProfileClient = CustomerProfileClient
+    AddressClient = CustomerAddressClient
+
+_LAZY = {
+    "CustomerProfileClient": ("clients.frappe_yawlit.customer.profile_client", "CustomerProfileClient"),
+    "CustomerAddressClient": ("clients.frappe_yawlit.customer.address_client", "CustomerAddressClient"),
+    "CustomerLookupClient": ("clients.frappe_yawlit.customer.lookup_client", "CustomerLookupClient"),
+    # Aliases for backward compatibility
+    "ProfileClient": ("clients.frappe_yawlit.customer.profile_client", "CustomerProfileClient"),
+    "AddressClient": ("clients.frappe_yawlit.customer.address_client", "CustomerAddressClient"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a client class on first access and cache it on the package."""
+    spec = _LAZY.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(spec[0]), spec[1])
+    globals()[name] = value
+    return value
 
-# Aliases for backward compatibility
-ProfileClient = CustomerProfileClient
-AddressClient = CustomerAddressClient
 
 __all__ = ["ProfileClient", "AddressClient", "CustomerLookupClient"]
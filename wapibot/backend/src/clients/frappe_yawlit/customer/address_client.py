@@ -3,26 +3,56 @@
 Handles customer address operations including CRUD operations and geocoding.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Final, List
 import logging
 
+import orjson
+
+from clients.frappe_yawlit.utils.cache_backends import MemoryResponseCache, ResponseCache
 from clients.frappe_yawlit.utils.http_client import AsyncHTTPClient
-from clients.frappe_yawlit.utils.exceptions import NotFoundError, FrappeAPIError
+from clients.frappe_yawlit.utils.decorators import wrap_errors
+from clients.frappe_yawlit.utils.fan_out import fan_out
+from clients.frappe_yawlit.utils.exceptions import NotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Frappe endpoints
+_EP_GET_CUSTOMER_ADDRESSES: Final = "/api/method/yawlit_automotive_services.api.customer_portal.get_customer_addresses"
+_EP_ADD_ADDRESS: Final = "/api/method/yawlit_automotive_services.api.customer_portal.add_address"
+_EP_UPDATE_ADDRESS: Final = "/api/method/yawlit_automotive_services.api.customer_portal.update_address"
+_EP_BULK_UPSERT_ADDRESSES: Final = "/api/method/yawlit_automotive_services.api.customer_portal.bulk_upsert_addresses"
+_EP_DELETE_ADDRESS: Final = "/api/method/yawlit_automotive_services.api.customer_portal.delete_address"
+_EP_REVERSE_GEOCODE: Final = "/api/method/yawlit_automotive_services.api.customer_portal.reverse_geocode"
+
+# Reverse geocoding is cached per ~11 m tile (4 decimal places); repeat
+# "share location" messages from the same spot skip Frappe and Google.
+GEOCODE_PRECISION = 4
+GEOCODE_CACHE_TTL = 86400  # seconds
+
+
+def _geocode_key(latitude: float, longitude: float) -> str:
+    """Cache key for an already-rounded coordinate pair."""
+    return f"geo:{latitude}:{longitude}"
+
 
 class CustomerAddressClient:
     """Handle customer address management operations."""
 
-    def __init__(self, http_client: AsyncHTTPClient):
+    __slots__ = ("http", "cache")
+
+    def __init__(self, http_client: AsyncHTTPClient, cache: ResponseCache | None = None):
         """Initialize customer address client.
 
         Args:
             http_client: Async HTTP client instance
+            cache: Backend for reverse geocoding results - pass a
+                RedisResponseCache to share hits across workers (defaults
+                to per-process memory)
         """
         self.http = http_client
+        self.cache = cache if cache is not None else MemoryResponseCache(maxsize=10_000)
 
+    @wrap_errors("fetching addresses")
     async def get_addresses(self) -> Dict[str, Any]:
         """Get all customer addresses.
 
@@ -34,14 +64,11 @@ class CustomerAddressClient:
             >>> for addr in addresses.get("addresses", []):
             ...     print(addr["address_line1"], addr["city"])
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.customer_portal.get_customer_addresses"
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching addresses: {e}")
-            raise
+        return await self.http.post(
+            _EP_GET_CUSTOMER_ADDRESSES
+        )
 
+    @wrap_errors("adding address")
     async def add_address(self, address_data: Dict[str, Any]) -> Dict[str, Any]:
         """Add new address to customer profile.
 
@@ -70,15 +97,12 @@ class CustomerAddressClient:
             ...     "is_primary": True
             ... })
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.customer_portal.add_address",
-                {"address_data": address_data}
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error adding address: {e}")
-            raise
+        return await self.http.post(
+            _EP_ADD_ADDRESS,
+            {"address_data": address_data}
+        )
 
+    @wrap_errors("updating address {address_name}")
     async def update_address(self, address_name: str, address_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update existing address.
 
@@ -95,18 +119,62 @@ class CustomerAddressClient:
             ...     {"address_line1": "456 New Street", "pincode": "560002"}
             ... )
         """
+        return await self.http.post(
+            _EP_UPDATE_ADDRESS,
+            {
+                "address_name": address_name,
+                "address_data": address_data
+            }
+        )
+
+    @wrap_errors("upserting addresses in bulk")
+    async def bulk_upsert_addresses(self, ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Add and/or update several addresses in one request.
+
+        Onboarding typically saves home and office (plus corrections) back
+        to back; this costs one round-trip instead of one per address.
+
+        Args:
+            ops: Operations, each {"data": {...}} to add an address or
+                {"name": "ADDR-...", "data": {...}} to update one. Data
+                fields are the same as add_address()/update_address().
+
+        Returns:
+            Bulk results with:
+                - total: Operations submitted
+                - successful: Operations applied
+                - failed: Operations rejected
+                - results: Added/updated address details
+                - errors: Per-operation errors (if any)
+
+        Example:
+            >>> result = await client.customer_address.bulk_upsert_addresses([
+            ...     {"data": {"address_line1": "123 Main Street", "city": "Bangalore",
+            ...               "state": "Karnataka", "pincode": "560001", "is_primary": True}},
+            ...     {"name": "ADDR-2025-001", "data": {"pincode": "560002"}}
+            ... ])
+            >>> print(f"Saved {result['successful']}/{result['total']}")
+
+        Note:
+            Falls back to concurrent add_address()/update_address() calls if
+            the server does not expose the bulk endpoint (404).
+        """
         try:
             return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.customer_portal.update_address",
-                {
-                    "address_name": address_name,
-                    "address_data": address_data
-                }
+                _EP_BULK_UPSERT_ADDRESSES,
+                {"ops": ops}
             )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error updating address {address_name}: {e}")
-            raise
+        except NotFoundError:
+            logger.warning("Bulk address endpoint unavailable - falling back to fan-out")
+
+        async def _upsert(op: Dict[str, Any]) -> Dict[str, Any]:
+            if "name" in op:
+                return await self.update_address(op["name"], op["data"])
+            return await self.add_address(op["data"])
+
+        return await fan_out(ops, _upsert)
 
+    @wrap_errors("deleting address {address_name}")
     async def delete_address(self, address_name: str) -> Dict[str, Any]:
         """Delete address from customer profile.
 
@@ -119,18 +187,18 @@ class CustomerAddressClient:
         Example:
             >>> result = await client.customer_address.delete_address("ADDR-2025-001")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.customer_portal.delete_address",
-                {"address_name": address_name}
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error deleting address {address_name}: {e}")
-            raise
+        return await self.http.post(
+            _EP_DELETE_ADDRESS,
+            {"address_name": address_name}
+        )
 
+    @wrap_errors("reverse geocoding ({latitude}, {longitude})")
     async def reverse_geocode(self, latitude: float, longitude: float) -> Dict[str, Any]:
         """Get address from GPS coordinates using reverse geocoding.
 
+        Coordinates are rounded to GEOCODE_PRECISION decimal places and the
+        result is cached per tile for GEOCODE_CACHE_TTL seconds.
+
         Args:
             latitude: Latitude coordinate
             longitude: Longitude coordinate
@@ -150,14 +218,19 @@ class CustomerAddressClient:
             ... )
             >>> print(address["city"])  # Bangalore
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.customer_portal.reverse_geocode",
-                {
-                    "latitude": latitude,
-                    "longitude": longitude
-                }
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error reverse geocoding ({latitude}, {longitude}): {e}")
-            raise
+        latitude = round(latitude, GEOCODE_PRECISION)
+        longitude = round(longitude, GEOCODE_PRECISION)
+        key = _geocode_key(latitude, longitude)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return orjson.loads(cached)
+
+        result = await self.http.post(
+            _EP_REVERSE_GEOCODE,
+            {
+                "latitude": latitude,
+                "longitude": longitude
+            }
+        )
+        await self.cache.set(key, orjson.dumps(result), GEOCODE_CACHE_TTL)
+        return result
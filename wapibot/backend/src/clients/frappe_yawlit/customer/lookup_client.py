@@ -3,14 +3,63 @@
 Provides methods to check customer existence and retrieve customer data.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Final
+import asyncio
+import hashlib
 import logging
+import re
 
+import orjson
+
+from clients.frappe_yawlit.utils.cache_backends import MemoryResponseCache, ResponseCache
+from clients.frappe_yawlit.utils.decorators import singleflight
 from clients.frappe_yawlit.utils.http_client import AsyncHTTPClient
 from clients.frappe_yawlit.utils.exceptions import NotFoundError, FrappeAPIError
 
 logger = logging.getLogger(__name__)
 
+# Frappe endpoints
+_EP_GET_VALUE: Final = "/api/method/frappe.client.get_value"
+_EP_GET: Final = "/api/method/frappe.client.get"
+_EP_GET_CUSTOMER_PROFILE: Final = "/api/method/yawlit_automotive_services.api.customer_portal.get_customer_profile"
+_EP_GET_CUSTOMER_BOOKINGS: Final = "/api/method/yawlit_automotive_services.api.booking.get_customer_bookings"
+_EP_GET_ACTIVE_SUBSCRIPTION: Final = "/api/method/yawlit_automotive_services.api.customer_portal.get_active_subscription"
+
+# Fixed get_value field lists, built once (orjson encodes tuples as arrays)
+_EMAIL_FIELDS: Final = ("name", "customer_uuid", "enabled")
+_PHONE_FIELDS: Final = ("customer_uuid", "customer_name", "user", "customer_status")
+
+# Existence checks repeat on every chat turn; cache them briefly. Misses are
+# cached for less time so a just-registered customer is found quickly.
+EXISTS_CACHE_TTL = 60  # seconds
+NOT_FOUND_CACHE_TTL = 10  # seconds
+
+
+# Identifier type in one anchored scan. Same precedence as before: any "@"
+# means email, then a CUST- prefix means UUID; anything else is a phone.
+_ID_RE = re.compile(r"(?P<email>[^@]*@)|(?P<uuid>CUST-)")
+
+
+# Shared "not found" result, returned by every miss instead of a new dict.
+# Read-only, like every check_customer_exists result.
+_EXISTS_FALSE: Final[Dict[str, Any]] = {"exists": False}
+
+# Returned when the lookup itself failed (server error, timeout, network,
+# open breaker). Callers see a miss, as before, but check_customer_exists
+# recognises it by identity and does not cache it.
+_EXISTS_UNKNOWN: Final[Dict[str, Any]] = {"exists": False}
+
+
+def _to_exists(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Wrap a get_value/get response as an existence result (one lookup)."""
+    message = result.get("message")
+    return {"exists": True, "data": message} if message else _EXISTS_FALSE
+
+
+def _exists_key(identifier: str) -> str:
+    """Cache key for an identifier (hashed - keeps emails/phones out of Redis keys)."""
+    return "cust:exists:" + hashlib.sha1(identifier.encode()).hexdigest()
+
 
 class CustomerLookupClient:
     """Handle customer lookup and verification operations.
@@ -19,17 +68,29 @@ class CustomerLookupClient:
     customer existence before processing requests.
     """
 
-    def __init__(self, http_client: AsyncHTTPClient):
+    __slots__ = ("http", "cache")
+
+    def __init__(self, http_client: AsyncHTTPClient, cache: ResponseCache | None = None):
         """Initialize customer lookup client.
 
         Args:
             http_client: Async HTTP client instance
+            cache: Backend for existence results - pass a RedisResponseCache
+                to share hits across workers (defaults to per-process memory)
         """
         self.http = http_client
+        self.cache = cache if cache is not None else MemoryResponseCache()
 
+    @singleflight
     async def check_customer_exists(self, identifier: str) -> Dict[str, Any]:
         """Check if customer exists by email, phone, or UUID.
 
+        Results are cached for EXISTS_CACHE_TTL seconds (NOT_FOUND_CACHE_TTL
+        when Frappe reported no such customer; a failed lookup is not
+        cached); call invalidate() after changing a customer's identifiers.
+        Concurrent checks for the same identifier share one lookup - treat
+        the result as read-only.
+
         Args:
             identifier: Customer email, phone number, or UUID
 
@@ -48,13 +109,37 @@ class CustomerLookupClient:
             >>> # Check by UUID
             >>> result = await client.customer_lookup.check_customer_exists("CUST-2025-001")
         """
+        key = _exists_key(identifier)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return orjson.loads(cached)
+
         # Route to appropriate check method based on identifier format
-        if "@" in identifier:
-            return await self._check_by_email(identifier)
-        elif identifier.startswith("CUST-"):
-            return await self._check_by_uuid(identifier)
+        match = _ID_RE.match(identifier)
+        kind = match.lastgroup if match else "phone"
+        if kind == "email":
+            result = await self._check_by_email(identifier)
+        elif kind == "uuid":
+            result = await self._check_by_uuid(identifier)
         else:
-            return await self._check_by_phone(identifier)
+            result = await self._check_by_phone(identifier)
+
+        if result is _EXISTS_UNKNOWN:
+            return result
+        ttl = EXISTS_CACHE_TTL if result["exists"] else NOT_FOUND_CACHE_TTL
+        await self.cache.set(key, orjson.dumps(result), ttl)
+        return result
+
+    async def invalidate(self, identifier: str) -> None:
+        """Forget the cached existence result for an identifier.
+
+        Args:
+            identifier: Customer email, phone number, or UUID
+
+        Example:
+            >>> await client.customer_lookup.invalidate("9876543210")
+        """
+        await self.cache.delete(_exists_key(identifier))
 
     async def _check_by_email(self, email: str) -> Dict[str, Any]:
         """Check customer existence by email.
@@ -67,24 +152,22 @@ class CustomerLookupClient:
         """
         try:
             result = await self.http.post(
-                "/api/method/frappe.client.get_value",
+                _EP_GET_VALUE,
                 {
                     "doctype": "User",
                     "filters": {"email": email},
-                    "fieldname": ["name", "customer_uuid", "enabled"]
+                    "fieldname": _EMAIL_FIELDS
                 }
             )
-            if result.get("message"):
-                return {"exists": True, "data": result["message"]}
-            return {"exists": False}
+            return _to_exists(result)
 
         except NotFoundError:
-            logger.debug(f"Customer not found with email: {email}")
-            return {"exists": False}
+            logger.debug("Customer not found with email: %s", email)
+            return _EXISTS_FALSE
 
         except FrappeAPIError as e:
-            logger.warning(f"API error checking customer by email: {e}")
-            return {"exists": False}
+            logger.warning("API error checking customer by email: %s", e)
+            return _EXISTS_UNKNOWN
 
     async def _check_by_phone(self, phone: str) -> Dict[str, Any]:
         """Check customer existence by phone number.
@@ -100,26 +183,21 @@ class CustomerLookupClient:
         """
         try:
             result = await self.http.post(
-                "/api/method/frappe.client.get_value",
+                _EP_GET_VALUE,
                 {
                     "doctype": "CustomerProfile",
                     "filters": {"phone_number": phone},
-                    "fieldname": [
-                        "customer_uuid",
-                        "customer_name",
-                        "user",
-                        "customer_status"
-                    ]
+                    "fieldname": _PHONE_FIELDS
                 }
             )
-            if result.get("message"):
-                cp_data = result["message"]
+            cp_data = result.get("message")
+            if cp_data:
                 # Split customer_name into first/last
                 name_parts = (cp_data.get("customer_name") or "").split(" ", 1)
                 first_name = name_parts[0] if name_parts else ""
                 last_name = name_parts[1] if len(name_parts) > 1 else ""
 
-                logger.info(f"Customer found: {first_name} {last_name}")
+                logger.info("Customer found: %s %s", first_name, last_name)
                 return {
                     "exists": True,
                     "data": {
@@ -130,15 +208,15 @@ class CustomerLookupClient:
                         "name": cp_data.get("user")
                     }
                 }
-            return {"exists": False}
+            return _EXISTS_FALSE
 
         except NotFoundError:
-            logger.debug(f"Customer not found with phone: {phone}")
-            return {"exists": False}
+            logger.debug("Customer not found with phone: %s", phone)
+            return _EXISTS_FALSE
 
         except FrappeAPIError as e:
-            logger.warning(f"API error checking customer by phone: {e}")
-            return {"exists": False}
+            logger.warning("API error checking customer by phone: %s", e)
+            return _EXISTS_UNKNOWN
 
     async def _check_by_uuid(self, uuid: str) -> Dict[str, Any]:
         """Check customer existence by UUID.
@@ -151,23 +229,21 @@ class CustomerLookupClient:
         """
         try:
             result = await self.http.post(
-                "/api/method/frappe.client.get",
+                _EP_GET,
                 {
                     "doctype": "CustomerProfile",
                     "name": uuid
                 }
             )
-            if result.get("message"):
-                return {"exists": True, "data": result["message"]}
-            return {"exists": False}
+            return _to_exists(result)
 
         except NotFoundError:
-            logger.debug(f"Customer not found with UUID: {uuid}")
-            return {"exists": False}
+            logger.debug("Customer not found with UUID: %s", uuid)
+            return _EXISTS_FALSE
 
         except FrappeAPIError as e:
-            logger.warning(f"API error checking customer by UUID: {e}")
-            return {"exists": False}
+            logger.warning("API error checking customer by UUID: %s", e)
+            return _EXISTS_UNKNOWN
 
     async def get_customer_data(self, uuid: str | None = None) -> Dict[str, Any]:
         """Get complete customer profile data.
@@ -189,7 +265,7 @@ class CustomerLookupClient:
         # The API endpoint returns current user's profile
         # TODO: Add support for admin fetching specific customer profile
         return await self.http.post(
-            "/api/method/yawlit_automotive_services.api.customer_portal.get_customer_profile"
+            _EP_GET_CUSTOMER_PROFILE
         )
 
     async def get_customer_bookings(self, uuid: str | None = None, limit: int = 10) -> Dict[str, Any]:
@@ -211,7 +287,7 @@ class CustomerLookupClient:
         # The API endpoint returns current user's bookings
         # TODO: Add support for admin fetching specific customer bookings
         return await self.http.post(
-            "/api/method/yawlit_automotive_services.api.booking.get_customer_bookings",
+            _EP_GET_CUSTOMER_BOOKINGS,
             {"limit": limit}
         )
 
@@ -233,5 +309,41 @@ class CustomerLookupClient:
         # The API endpoint returns current user's subscription
         # TODO: Add support for admin fetching specific customer subscription
         return await self.http.post(
-            "/api/method/yawlit_automotive_services.api.customer_portal.get_active_subscription"
+            _EP_GET_ACTIVE_SUBSCRIPTION
+        )
+
+    async def get_customer_snapshot(self, uuid: str | None = None, limit: int = 10) -> Dict[str, Any]:
+        """Get profile, bookings and subscription in one concurrent round.
+
+        The three calls are independent, so the "show my account" view
+        waits for the slowest one instead of all three in sequence.
+
+        Args:
+            uuid: Customer UUID (optional, uses current session user if not provided)
+            limit: Maximum number of bookings to return
+
+        Returns:
+            Dictionary with keys profile, bookings and subscription. A part
+            that failed is None (and logged) so the rest still renders.
+
+        Example:
+            >>> snapshot = await client.customer_lookup.get_customer_snapshot()
+            >>> if snapshot["subscription"]:
+            ...     print(snapshot["subscription"]["subscription"]["plan_name"])
+        """
+        parts = ("profile", "bookings", "subscription")
+        results = await asyncio.gather(
+            self.get_customer_data(uuid),
+            self.get_customer_bookings(uuid, limit),
+            self.get_customer_subscriptions(uuid),
+            return_exceptions=True
         )
+        snapshot: Dict[str, Any] = {}
+        for part, result in zip(parts, results):
+            if isinstance(result, FrappeAPIError):
+                logger.warning("Customer snapshot: %s unavailable: %s", part, result)
+                result = None
+            elif isinstance(result, BaseException):
+                raise result
+            snapshot[part] = result
+        return snapshot
@@ -7,25 +7,55 @@ Authorization header (configured in .env.txt: FRAPPE_API_KEY, FRAPPE_API_SECRET)
 Phone-based methods are secured at the Frappe backend level.
 """
 
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, List, Final
 import logging
 
 from clients.frappe_yawlit.utils.http_client import AsyncHTTPClient
 from clients.frappe_yawlit.utils.exceptions import NotFoundError, FrappeAPIError
+from clients.frappe_yawlit.utils.fan_out import fan_out
+
+if TYPE_CHECKING:
+    from clients.frappe_yawlit.customer.lookup_client import CustomerLookupClient
 
 logger = logging.getLogger(__name__)
 
+# Frappe endpoints
+_EP_ADD_VEHICLES_BULK: Final = "/api/method/yawlit_automotive_services.api.customer_portal.add_vehicles_bulk"
+
+# Profile fields CustomerLookupClient.check_customer_exists is keyed or answered by
+_LOOKUP_FIELDS: Final = ("phone_number", "email", "customer_uuid")
+
 
 class CustomerProfileClient:
     """Handle customer profile and vehicle management operations."""
 
-    def __init__(self, http_client: AsyncHTTPClient):
+    def __init__(self, http_client: AsyncHTTPClient, lookup: "CustomerLookupClient | None" = None):
         """Initialize customer profile client.
 
         Args:
             http_client: Async HTTP client instance
+            lookup: Lookup client whose cached existence results are
+                invalidated after profile writes
         """
         self.http = http_client
+        self.lookup = lookup
+
+    async def _current_identifiers(self, data: Dict[str, Any]) -> List[str]:
+        """Phone/email/UUID before an update that changes them (best effort)."""
+        if self.lookup is None or not any(data.get(field) for field in _LOOKUP_FIELDS):
+            return []
+        try:
+            profile = (await self.get_profile()).get("message") or {}
+        except FrappeAPIError:
+            return []
+        return [profile[field] for field in _LOOKUP_FIELDS if profile.get(field)]
+
+    async def _invalidate_lookups(self, identifiers: List[str]) -> None:
+        """Drop cached existence results for these identifiers."""
+        if self.lookup is None:
+            return
+        for identifier in dict.fromkeys(filter(None, identifiers)):
+            await self.lookup.invalidate(identifier)
 
     async def get_profile(self) -> Dict[str, Any]:
         """Get customer profile (requires session).
@@ -42,7 +72,7 @@ class CustomerProfileClient:
                 "/api/method/yawlit_automotive_services.api.customer_portal.get_customer_profile"
             )
         except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching customer profile: {e}")
+            logger.error("Error fetching customer profile: %s", e)
             raise
 
     async def get_profile_by_phone(self, phone_number: str) -> Dict[str, Any]:
@@ -99,7 +129,7 @@ class CustomerProfileClient:
                 {"phone_number": phone_number}
             )
         except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching customer profile by phone {phone_number}: {e}")
+            logger.error("Error fetching customer profile by phone %s: %s", phone_number, e)
             raise
 
     async def complete_profile(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -131,17 +161,24 @@ class CustomerProfileClient:
             ... })
         """
         try:
-            return await self.http.post(
+            result = await self.http.post(
                 "/api/method/yawlit_automotive_services.api.customer_portal.complete_profile",
                 {"data": data}
             )
         except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error completing profile: {e}")
+            logger.error("Error completing profile: %s", e)
             raise
+        # A just-registered phone/email may be cached as "not found"
+        await self._invalidate_lookups([data.get(field) for field in _LOOKUP_FIELDS])
+        return result
 
     async def update_profile(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Update customer profile.
 
+        When the update touches phone_number, email or customer_uuid, the
+        current profile is read first so that cached lookups for both the
+        old and new identifiers can be invalidated.
+
         Args:
             data: Profile fields to update (same structure as complete_profile)
 
@@ -154,14 +191,19 @@ class CustomerProfileClient:
             ...     "phone_number": "9876543211"
             ... })
         """
+        previous = await self._current_identifiers(data)
         try:
-            return await self.http.post(
+            result = await self.http.post(
                 "/api/method/yawlit_automotive_services.api.customer_portal.update_profile",
                 {"data": data}
             )
         except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error updating profile: {e}")
+            logger.error("Error updating profile: %s", e)
             raise
+        # Both the old identifiers (cached as found) and the new ones
+        # (possibly cached as not found) are now stale
+        await self._invalidate_lookups(previous + [data.get(field) for field in _LOOKUP_FIELDS])
+        return result
 
     async def get_vehicles(self) -> Dict[str, Any]:
         """Get customer vehicles.
@@ -179,7 +221,7 @@ class CustomerProfileClient:
                 "/api/method/yawlit_automotive_services.api.customer_portal.get_customer_vehicles"
             )
         except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching vehicles: {e}")
+            logger.error("Error fetching vehicles: %s", e)
             raise
 
     async def add_vehicle(self, vehicle_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -210,9 +252,52 @@ class CustomerProfileClient:
                 {"vehicle_data": vehicle_data}
             )
         except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error adding vehicle: {e}")
+            logger.error("Error adding vehicle: %s", e)
+            raise
+
+    async def add_vehicles_bulk(self, vehicles: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Add several vehicles to the customer profile in one request.
+
+        Prefer this over repeated add_vehicle() calls when the list is known
+        up front (e.g. an onboarding wizard): N vehicles cost one round-trip.
+
+        Args:
+            vehicles: List of vehicle dicts, same fields as add_vehicle()
+
+        Returns:
+            Bulk results with:
+                - total: Vehicles submitted
+                - successful: Vehicles added
+                - failed: Vehicles rejected
+                - results: Added vehicle details
+                - errors: Per-vehicle errors (if any)
+
+        Example:
+            >>> result = await client.customer_profile.add_vehicles_bulk([
+            ...     {"vehicle_make": "Honda", "vehicle_model": "City",
+            ...      "vehicle_number": "KA01AB1234", "vehicle_type": "Sedan"},
+            ...     {"vehicle_make": "Hyundai", "vehicle_model": "Creta",
+            ...      "vehicle_number": "KA01CD5678", "vehicle_type": "SUV"}
+            ... ])
+            >>> print(f"Added {result['successful']}/{result['total']}")
+
+        Note:
+            Falls back to concurrent add_vehicle() calls if the server does
+            not expose the bulk endpoint (404).
+        """
+        try:
+            return await self.http.post(
+                _EP_ADD_VEHICLES_BULK,
+                {"vehicles": vehicles}
+            )
+        except NotFoundError:
+            logger.warning("Bulk vehicle endpoint unavailable - falling back to fan-out")
+        except FrappeAPIError as e:
+            logger.error("Error adding vehicles in bulk: %s", e)
             raise
 
+        return await fan_out(vehicles, self.add_vehicle)
+
     async def update_vehicle(self, vehicle_name: str, vehicle_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update vehicle information.
 
@@ -238,7 +323,7 @@ class CustomerProfileClient:
                 }
             )
         except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error updating vehicle {vehicle_name}: {e}")
+            logger.error("Error updating vehicle %s: %s", vehicle_name, e)
             raise
 
     async def delete_vehicle(self, vehicle_name: str) -> Dict[str, Any]:
@@ -259,5 +344,5 @@ class CustomerProfileClient:
                 {"vehicle_name": vehicle_name}
             )
         except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error deleting vehicle {vehicle_name}: {e}")
+            logger.error("Error deleting vehicle %s: %s", vehicle_name, e)
             raise
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""Typed request payloads for Frappe write endpoints.
+
+Slotted dataclasses for the hot booking/profile/pricing calls. orjson serializes
+dataclasses natively, so these go straight to the wire without being
+converted to a dict first. Plain dicts are still accepted everywhere.
+
+Example:
+    >>> from clients.frappe_yawlit.payloads import BookingPayload
+    >>> await client.booking_create.create_booking(BookingPayload(
+    ...     service_id="SRV-2025-001",
+    ...     vehicle_id="VEH-2025-001",
+    ...     slot_id="SLOT-2025-001",
+    ...     date="2025-01-15",
+    ...     address_id="ADDR-2025-001"
+    ... ))
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+
+@dataclass(slots=True)
+class BookingPayload:
+    """Body for BookingCreateClient.create_booking."""
+
+    service_id: str
+    vehicle_id: str
+    slot_id: str
+    date: str  # YYYY-MM-DD
+    address_id: str
+    optional_addons: List[str] = field(default_factory=list)
+    special_instructions: str | None = None
+
+
+@dataclass(slots=True)
+class PricePayload:
+    """Body for BookingCreateClient.calculate_price."""
+
+    service_id: str
+    vehicle_type: str
+    optional_addons: List[str] = field(default_factory=list)
+    coupon_code: str | None = None
+
+
+@dataclass(slots=True)
+class SubscriptionPricePayload:
+    """Body for SubscriptionPlansClient.calculate_price."""
+
+    plan_id: str
+    vehicle_count: int
+    coupon_code: str | None = None
+    addon_services: List[str] = field(default_factory=list)
+    billing_frequency: str | None = None  # Annual/Monthly
+
+    def to_body(self) -> Dict[str, Any]:
+        """Request body without unset optional fields.
+
+        An explicit null would override Frappe's defaults (billing_frequency),
+        so optional fields are sent only when set.
+        """
+        body: Dict[str, Any] = {"plan_id": self.plan_id, "vehicle_count": self.vehicle_count}
+        if self.coupon_code:
+            body["coupon_code"] = self.coupon_code
+        if self.addon_services:
+            body["addon_services"] = self.addon_services
+        if self.billing_frequency:
+            body["billing_frequency"] = self.billing_frequency
+        return body
+
+
+@dataclass(slots=True)
+class ProfilePayload:
+    """Body for AuthClient.complete_profile."""
+
+    customer_name: str
+    email: str
+    phone_number: str
+    default_address: str
+    city: str
+    state: str
+    pincode: str
+    geo_latitude: float | None = None
+    geo_longitude: float | None = None
+    vehicles: List[Dict[str, Any]] = field(default_factory=list)
@@ -3,27 +3,91 @@
 Handles payment order creation and verification for bookings and subscriptions.
 """
 
-from typing import Dict, Any
-import logging
+from typing import Dict, Any, Final
+import hashlib
 
+import orjson
+
+from clients.frappe_yawlit.responses import BalancePaymentOrderResponse, PaymentOrderResponse, PaymentVerificationResponse, SubscriptionPaymentOrderResponse, SubscriptionPaymentVerificationResponse
+from clients.frappe_yawlit.utils.cache_backends import MemoryResponseCache, ResponseCache
 from clients.frappe_yawlit.utils.http_client import AsyncHTTPClient
-from clients.frappe_yawlit.utils.exceptions import NotFoundError, FrappeAPIError
+from clients.frappe_yawlit.utils.decorators import log_errors
+from clients.frappe_yawlit.utils.singleflight import SingleFlight
+
+# Frappe endpoints
+_EP_CREATE_PAYMENT_ORDER: Final = "/api/method/yawlit_automotive_services.api.payment_gateway_integration.create_payment_order"
+_EP_CREATE_SUBSCRIPTION_PAYMENT_ORDER: Final = "/api/method/yawlit_automotive_services.api.payment_api.create_subscription_payment_order"
+_EP_CREATE_BALANCE_PAYMENT: Final = "/api/method/yawlit_automotive_services.api.payment_api.create_balance_payment"
+_EP_VERIFY_PAYMENT: Final = "/api/method/yawlit_automotive_services.api.payment_gateway_integration.verify_payment"
+_EP_VERIFY_SUBSCRIPTION_PAYMENT: Final = "/api/method/yawlit_automotive_services.api.payment_api.verify_subscription_payment"
+
+# Gateway webhook redeliveries and "I've paid" retries verify the same payment
+# over and over. Verification is idempotent per (order, payment, signature),
+# so concurrent calls on one client share one request and verified results
+# are remembered.
+
+# Verified payments never change. Failures are not cached: the payment may
+# still be settling, and a request with a bad signature must not poison the
+# result for the genuine one.
+VERIFIED_CACHE_TTL = 3600  # seconds
+
+
+def _verify_key(endpoint: str, payment_data: Dict[str, Any]) -> str:
+    """Cache/coalescing key for a verification call (hashed, like customer keys)."""
+    raw = "|".join(
+        str(payment_data.get(field) or "") for field in ("order_id", "payment_id", "signature")
+    )
+    digest = hashlib.sha1(f"{endpoint}|{raw}".encode()).hexdigest()
+    return "pay:verify:" + digest
+
 
-logger = logging.getLogger(__name__)
+def _is_verified(result: Any) -> bool:
+    """Whether a verification response (with or without Frappe's "message" envelope) succeeded."""
+    if isinstance(result, dict) and isinstance(result.get("message"), dict):
+        result = result["message"]
+    return isinstance(result, dict) and bool(result.get("verified"))
 
 
 class PaymentClient:
     """Handle payment operations for bookings and subscriptions."""
 
-    def __init__(self, http_client: AsyncHTTPClient):
+    __slots__ = ("http", "cache", "_verifying")
+
+    def __init__(self, http_client: AsyncHTTPClient, cache: ResponseCache | None = None):
         """Initialize payment client.
 
         Args:
             http_client: Async HTTP client instance
+            cache: Backend for verification results - pass a
+                RedisResponseCache so webhook deliveries landing on different
+                workers are deduplicated (defaults to per-process memory)
         """
         self.http = http_client
-
-    async def create_order(self, booking_id: str, amount: float) -> Dict[str, Any]:
+        self.cache = cache if cache is not None else MemoryResponseCache(maxsize=10_000)
+        # Per client, so calls made through different HTTP clients (hosts,
+        # credentials) never share an in-flight result
+        self._verifying = SingleFlight()
+
+    async def _verify(self, endpoint: str, payment_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Post a verification once per (order, payment, signature), caching successes."""
+        if not (payment_data.get("order_id") and payment_data.get("payment_id")):
+            return await self.http.post(endpoint, payment_data)
+
+        key = _verify_key(endpoint, payment_data)
+
+        async def load() -> Dict[str, Any]:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                return orjson.loads(cached)
+            result = await self.http.post(endpoint, payment_data)
+            if _is_verified(result):
+                await self.cache.set(key, orjson.dumps(result), VERIFIED_CACHE_TTL)
+            return result
+
+        return await self._verifying.do(key, load)
+
+    @log_errors("creating payment order for booking {booking_id}")
+    async def create_order(self, booking_id: str, amount: float) -> PaymentOrderResponse:
         """Create payment order for one-time booking.
 
         Args:
@@ -43,21 +107,22 @@ class PaymentClient:
             >>> print(f"Order ID: {order['order_id']}")
             >>> print(f"Pay here: {order['payment_link']}")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.payment_gateway_integration.create_payment_order",
-                {
-                    "booking_id": booking_id,
-                    "amount": amount
-                }
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error creating payment order for booking {booking_id}: {e}")
-            raise
-
-    async def verify_payment(self, payment_data: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.http.post(
+            _EP_CREATE_PAYMENT_ORDER,
+            {
+                "booking_id": booking_id,
+                "amount": amount
+            }
+        )
+
+    @log_errors("verifying payment")
+    async def verify_payment(self, payment_data: Dict[str, Any]) -> PaymentVerificationResponse:
         """Verify payment completion for booking.
 
+        Concurrent calls for the same order_id/payment_id/signature share one
+        request, and a verified result is cached for VERIFIED_CACHE_TTL so
+        redelivered webhooks skip Frappe. Failed verifications are not cached.
+
         Args:
             payment_data: Payment verification data including:
                 - order_id: Payment gateway order ID
@@ -81,16 +146,10 @@ class PaymentClient:
             >>> if result["verified"]:
             ...     print(f"Payment successful for booking: {result['booking_id']}")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.payment_gateway_integration.verify_payment",
-                payment_data
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error verifying payment: {e}")
-            raise
-
-    async def create_subscription_order(self, quote_id: str) -> Dict[str, Any]:
+        return await self._verify(_EP_VERIFY_PAYMENT, payment_data)
+
+    @log_errors("creating subscription payment order for quote {quote_id}")
+    async def create_subscription_order(self, quote_id: str) -> SubscriptionPaymentOrderResponse:
         """Create payment order for subscription.
 
         Args:
@@ -110,18 +169,19 @@ class PaymentClient:
             >>> print(f"Subscription payment: ₹{order['amount']}")
             >>> print(f"Payment link: {order['payment_link']}")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.payment_api.create_subscription_payment_order",
-                {"quote_id": quote_id}
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error creating subscription payment order for quote {quote_id}: {e}")
-            raise
-
-    async def verify_subscription_payment(self, payment_data: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.http.post(
+            _EP_CREATE_SUBSCRIPTION_PAYMENT_ORDER,
+            {"quote_id": quote_id}
+        )
+
+    @log_errors("verifying subscription payment")
+    async def verify_subscription_payment(self, payment_data: Dict[str, Any]) -> SubscriptionPaymentVerificationResponse:
         """Verify subscription payment completion.
 
+        Concurrent calls for the same order_id/payment_id/signature share one
+        request, and a verified result is cached for VERIFIED_CACHE_TTL so
+        redelivered webhooks skip Frappe. Failed verifications are not cached.
+
         Args:
             payment_data: Payment verification data including:
                 - order_id: Payment gateway order ID
@@ -146,16 +206,10 @@ class PaymentClient:
             >>> if result["verified"]:
             ...     print(f"Subscription activated: {result['subscription_id']}")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.payment_api.verify_subscription_payment",
-                payment_data
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error verifying subscription payment: {e}")
-            raise
-
-    async def create_balance_payment(self, booking_id: str, amount: float) -> Dict[str, Any]:
+        return await self._verify(_EP_VERIFY_SUBSCRIPTION_PAYMENT, payment_data)
+
+    @log_errors("creating balance payment for booking {booking_id}")
+    async def create_balance_payment(self, booking_id: str, amount: float) -> BalancePaymentOrderResponse:
         """Create balance payment for partial/remaining amount.
 
         Args:
@@ -176,14 +230,10 @@ class PaymentClient:
             >>> print(f"Balance due: ₹{order['amount']}")
             >>> print(f"Pay here: {order['payment_link']}")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.payment_api.create_balance_payment",
-                {
-                    "booking_id": booking_id,
-                    "amount": amount
-                }
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error creating balance payment for booking {booking_id}: {e}")
-            raise
+        return await self.http.post(
+            _EP_CREATE_BALANCE_PAYMENT,
+            {
+                "booking_id": booking_id,
+                "amount": amount
+            }
+        )
@@ -0,0 +1,182 @@
+"""Typed response shapes for Frappe payment and subscription endpoints.
+
+TypedDicts describe the documented fields of the dicts AsyncHTTPClient
+returns (decoded with orjson). They cost nothing at runtime - responses
+stay plain dicts - but let callers and type checkers rely on key names
+instead of defensive .get() chains. Payload types are total=False: Frappe
+omits fields that do not apply.
+
+Client methods return Frappe's envelope unchanged, so each payload type
+has a matching ``...Response`` type whose ``message`` holds it.
+
+Example:
+    >>> from clients.frappe_yawlit.responses import PaymentVerificationResponse
+    >>> result: PaymentVerificationResponse = await client.payment.verify_payment(data)
+    >>> if result["message"]["verified"]:
+    ...     print(result["message"]["booking_id"])
+"""
+
+from typing import Any, Dict, List, TypedDict
+
+
+class PaymentOrder(TypedDict, total=False):
+    """Payload of PaymentClient.create_order."""
+
+    order_id: str
+    amount: float
+    currency: str
+    payment_link: str
+    gateway: str
+
+
+class PaymentOrderResponse(TypedDict):
+    """Response of PaymentClient.create_order."""
+
+    message: PaymentOrder
+
+
+class PaymentVerification(TypedDict, total=False):
+    """Payload of PaymentClient.verify_payment."""
+
+    verified: bool
+    booking_id: str
+    payment_status: str
+    transaction_id: str
+
+
+class PaymentVerificationResponse(TypedDict):
+    """Response of PaymentClient.verify_payment."""
+
+    message: PaymentVerification
+
+
+class SubscriptionPaymentOrder(TypedDict, total=False):
+    """Payload of PaymentClient.create_subscription_order."""
+
+    order_id: str
+    amount: float
+    currency: str
+    payment_link: str
+    subscription_id: str
+    validity: str
+
+
+class SubscriptionPaymentOrderResponse(TypedDict):
+    """Response of PaymentClient.create_subscription_order."""
+
+    message: SubscriptionPaymentOrder
+
+
+class SubscriptionPaymentVerification(TypedDict, total=False):
+    """Payload of PaymentClient.verify_subscription_payment."""
+
+    verified: bool
+    subscription_id: str
+    payment_status: str
+    activation_date: str
+    transaction_id: str
+
+
+class SubscriptionPaymentVerificationResponse(TypedDict):
+    """Response of PaymentClient.verify_subscription_payment."""
+
+    message: SubscriptionPaymentVerification
+
+
+class BalancePaymentOrder(TypedDict, total=False):
+    """Payload of PaymentClient.create_balance_payment."""
+
+    order_id: str
+    amount: float
+    original_amount: float
+    paid_amount: float
+    payment_link: str
+
+
+class BalancePaymentOrderResponse(TypedDict):
+    """Response of PaymentClient.create_balance_payment."""
+
+    message: BalancePaymentOrder
+
+
+class SubscriptionDetails(TypedDict, total=False):
+    """Payload of SubscriptionManageClient.get_subscription_details."""
+
+    subscription_id: str
+    plan_details: Dict[str, Any]
+    customer_info: Dict[str, Any]
+    payment_info: Dict[str, Any]
+    service_usage: Dict[str, Any]
+    renewal_info: Dict[str, Any]
+    vehicles: List[Dict[str, Any]]
+
+
+class SubscriptionDetailsResponse(TypedDict):
+    """Response of SubscriptionManageClient.get_subscription_details."""
+
+    message: SubscriptionDetails
+
+
+class SubscriptionUsage(TypedDict, total=False):
+    """Payload of SubscriptionUsageClient.get_usage."""
+
+    total_services: int
+    used_services: int
+    remaining_services: int
+    service_breakdown: List[Dict[str, Any]]
+    last_service_date: str
+
+
+class SubscriptionUsageResponse(TypedDict):
+    """Response of SubscriptionUsageClient.get_usage."""
+
+    message: SubscriptionUsage
+
+
+class RemainingWashes(TypedDict, total=False):
+    """Payload of SubscriptionUsageClient.get_remaining_washes."""
+
+    total_washes: int
+    used_washes: int
+    remaining_washes: int
+    reset_date: str
+    expires_on: str
+
+
+class RemainingWashesResponse(TypedDict):
+    """Response of SubscriptionUsageClient.get_remaining_washes."""
+
+    message: RemainingWashes
+
+
+class UsageSummary(TypedDict, total=False):
+    """Payload of SubscriptionUsageClient.get_usage_summary."""
+
+    subscription_info: Dict[str, Any]
+    usage_stats: Dict[str, Any]
+    service_utilization: List[Dict[str, Any]]
+    upcoming_services: List[Dict[str, Any]]
+    recommendations: List[str]
+
+
+class UsageSummaryResponse(TypedDict):
+    """Response of SubscriptionUsageClient.get_usage_summary."""
+
+    message: UsageSummary
+
+
+class PriceQuote(TypedDict, total=False):
+    """Payload of SubscriptionPlansClient.calculate_price."""
+
+    base_price: float
+    vehicle_price: float
+    addon_price: float
+    discount: float
+    tax: float
+    total_price: float
+
+
+class PriceQuoteResponse(TypedDict):
+    """Response of SubscriptionPlansClient.calculate_price."""
+
+    message: PriceQuote
@@ -3,9 +3,11 @@
 from clients.frappe_yawlit.subscription.plans_client import SubscriptionPlansClient
 from clients.frappe_yawlit.subscription.manage_client import SubscriptionManageClient
 from clients.frappe_yawlit.subscription.usage_client import SubscriptionUsageClient
+from clients.frappe_yawlit.subscription.facade import SubscriptionFacade
 
 __all__ = [
     "SubscriptionPlansClient",
     "SubscriptionManageClient",
-    "SubscriptionUsageClient"
+    "SubscriptionUsageClient",
+    "SubscriptionFacade"
 ]
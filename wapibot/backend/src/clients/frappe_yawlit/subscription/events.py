@@ -0,0 +1,69 @@
+"""In-process subscription status events.
+
+Frappe's subscription lifecycle hooks POST pause/cancel/renew changes to
+the Frappe webhook endpoint, which publishes them here. Callers that need
+to react to a status change await SubscriptionManageClient.watch()
+instead of polling get_subscription_details().
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, Set
+
+# Per-watcher backlog; a watcher that falls this far behind loses the oldest
+# events (only the latest status matters to a subscriber)
+WATCH_QUEUE_SIZE = 16
+
+
+class SubscriptionEvents:
+    """Fan out subscription events to per-subscription watchers."""
+
+    def __init__(self, queue_size: int = WATCH_QUEUE_SIZE):
+        """Initialize with no watchers.
+
+        Args:
+            queue_size: Maximum undelivered events kept per watcher
+        """
+        self.queue_size = queue_size
+        self._watchers: Dict[str, Set[asyncio.Queue]] = {}
+
+    def publish(self, event: Dict[str, Any]) -> int:
+        """Deliver an event to every watcher of its subscription.
+
+        Args:
+            event: Event payload; must contain "subscription_id"
+
+        Returns:
+            Number of watchers the event was delivered to
+        """
+        watchers = self._watchers.get(event["subscription_id"], ())
+        for queue in watchers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(event)
+        return len(watchers)
+
+    async def subscribe(self, subscription_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """Yield events for one subscription as they are published.
+
+        Runs until the consumer stops iterating (break, cancellation).
+
+        Args:
+            subscription_id: Subscription to watch
+
+        Yields:
+            Published event payloads, oldest first
+        """
+        queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        watchers = self._watchers.setdefault(subscription_id, set())
+        watchers.add(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            watchers.discard(queue)
+            if not watchers:
+                self._watchers.pop(subscription_id, None)
+
+
+# Global singleton - events only reach watchers in this process
+subscription_events = SubscriptionEvents()
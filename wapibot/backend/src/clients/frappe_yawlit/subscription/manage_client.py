@@ -3,18 +3,31 @@
 Handles subscription lifecycle operations including creation, cancellation, and pausing.
 """
 
-from typing import Dict, Any, Optional
-import logging
+from typing import Dict, Any, AsyncIterator, Optional, Final
 
+from clients.frappe_yawlit.responses import SubscriptionDetailsResponse
 from clients.frappe_yawlit.utils.http_client import AsyncHTTPClient
-from clients.frappe_yawlit.utils.exceptions import NotFoundError, FrappeAPIError
+from clients.frappe_yawlit.utils.decorators import log_errors
+from clients.frappe_yawlit.utils.cache import session_scope, ttl_cache
+from clients.frappe_yawlit.subscription.events import subscription_events
 
-logger = logging.getLogger(__name__)
+# Frappe endpoints
+_EP_GET_ACTIVE_SUBSCRIPTION: Final = "/api/method/yawlit_automotive_services.api.customer_portal.get_active_subscription"
+_EP_GET_SUBSCRIPTION_DETAILS: Final = "/api/method/yawlit_automotive_services.api.subscription_api.get_subscription_details"
+_EP_SUBMIT_SUBSCRIPTION_REQUEST: Final = "/api/method/yawlit_automotive_services.api.customer_portal.submit_subscription_request"
+_EP_CANCEL_MY_SUBSCRIPTION: Final = "/api/method/yawlit_automotive_services.api.subscription_api.cancel_my_subscription"
+_EP_PAUSE_SUBSCRIPTION: Final = "/api/method/yawlit_automotive_services.api.admin_subscription_lifecycle.pause_subscription"
+
+# Subscription state is re-read every turn of a subscription conversation;
+# kept short so changes made outside this client show up quickly
+SUBSCRIPTION_DETAILS_TTL = 10  # seconds
 
 
 class SubscriptionManageClient:
     """Handle subscription lifecycle management operations."""
 
+    __slots__ = ("http",)
+
     def __init__(self, http_client: AsyncHTTPClient):
         """Initialize subscription manage client.
 
@@ -23,6 +36,7 @@ class SubscriptionManageClient:
         """
         self.http = http_client
 
+    @log_errors("fetching active subscription")
     async def get_active_subscription(self) -> Dict[str, Any]:
         """Get customer's active subscription.
 
@@ -44,17 +58,18 @@ class SubscriptionManageClient:
             >>> else:
             ...     print("No active subscription")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.customer_portal.get_active_subscription"
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching active subscription: {e}")
-            raise
-
-    async def get_subscription_details(self, subscription_id: str) -> Dict[str, Any]:
+        return await self.http.get(
+            _EP_GET_ACTIVE_SUBSCRIPTION
+        )
+
+    @ttl_cache(ttl=SUBSCRIPTION_DETAILS_TTL, maxsize=512, scope=session_scope)
+    @log_errors("fetching subscription details for {subscription_id}")
+    async def get_subscription_details(self, subscription_id: str) -> SubscriptionDetailsResponse:
         """Get detailed information for a specific subscription.
 
+        Cached per session for SUBSCRIPTION_DETAILS_TTL seconds; cancel_subscription and
+        pause_subscription evict it for every session via invalidate_subscription().
+
         Args:
             subscription_id: Subscription ID to get details for
 
@@ -75,15 +90,43 @@ class SubscriptionManageClient:
             >>> print(details["plan_details"]["plan_name"])
             >>> print(f"Services used: {details['service_usage']['used_count']}/{details['service_usage']['total_count']}")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.subscription_api.get_subscription_details",
-                {"subscription_id": subscription_id}
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching subscription details for {subscription_id}: {e}")
-            raise
+        return await self.http.post(
+            _EP_GET_SUBSCRIPTION_DETAILS,
+            {"subscription_id": subscription_id}
+        )
+
+    @staticmethod
+    def invalidate_subscription(subscription_id: str) -> None:
+        """Evict cached details for a subscription after it changes.
+
+        Args:
+            subscription_id: Subscription ID whose details are stale
+        """
+        SubscriptionManageClient.get_subscription_details.invalidate(subscription_id)
+
+    @staticmethod
+    def watch(subscription_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """Stream status changes for a subscription as Frappe pushes them.
+
+        Replaces polling get_subscription_details(): events arrive via the
+        /api/v1/frappe/subscription-events webhook, which also evicts the
+        cached details before publishing.
+
+        Args:
+            subscription_id: Subscription to watch
+
+        Returns:
+            Async iterator of events (subscription_id, event, status,
+            occurred_at); runs until the caller stops iterating
+
+        Example:
+            >>> async for event in client.subscription_manage.watch("SUB-001"):
+            ...     if event["status"] == "Active":
+            ...         break
+        """
+        return subscription_events.subscribe(subscription_id)
 
+    @log_errors("submitting subscription request")
     async def submit_request(self, subscription_data: Dict[str, Any]) -> Dict[str, Any]:
         """Submit new subscription request.
 
@@ -112,15 +155,12 @@ class SubscriptionManageClient:
             ... })
             >>> print(f"Quotation ID: {result['quotation_id']}")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.customer_portal.submit_subscription_request",
-                {"subscription_data": subscription_data}
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error submitting subscription request: {e}")
-            raise
+        return await self.http.post(
+            _EP_SUBMIT_SUBSCRIPTION_REQUEST,
+            {"subscription_data": subscription_data}
+        )
 
+    @log_errors("canceling subscription {subscription_id}")
     async def cancel_subscription(self, subscription_id: str, reason: Optional[str] = None) -> Dict[str, Any]:
         """Cancel active subscription.
 
@@ -144,18 +184,17 @@ class SubscriptionManageClient:
             >>> if result.get("refund_amount"):
             ...     print(f"Refund: ₹{result['refund_amount']}")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.subscription_api.cancel_my_subscription",
-                {
-                    "subscription_id": subscription_id,
-                    "reason": reason
-                }
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error canceling subscription {subscription_id}: {e}")
-            raise
-
+        result = await self.http.post(
+            _EP_CANCEL_MY_SUBSCRIPTION,
+            {
+                "subscription_id": subscription_id,
+                "reason": reason
+            }
+        )
+        self.invalidate_subscription(subscription_id)
+        return result
+
+    @log_errors("pausing subscription {subscription_id}")
     async def pause_subscription(self, subscription_id: str) -> Dict[str, Any]:
         """Pause active subscription temporarily.
 
@@ -174,11 +213,9 @@ class SubscriptionManageClient:
             >>> print(f"Subscription paused from: {result['paused_from']}")
             >>> print(f"Can resume on: {result['can_resume_on']}")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.admin_subscription_lifecycle.pause_subscription",
-                {"subscription_id": subscription_id}
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error pausing subscription {subscription_id}: {e}")
-            raise
+        result = await self.http.post(
+            _EP_PAUSE_SUBSCRIPTION,
+            {"subscription_id": subscription_id}
+        )
+        self.invalidate_subscription(subscription_id)
+        return result
@@ -3,18 +3,35 @@
 Handles subscription plan browsing, details, and pricing calculations.
 """
 
-from typing import Dict, Any, Optional
-import logging
+from typing import Dict, Any, List, Optional, Final
+import asyncio
 
+import orjson
+
+from clients.frappe_yawlit.payloads import SubscriptionPricePayload
+from clients.frappe_yawlit.responses import PriceQuoteResponse
 from clients.frappe_yawlit.utils.http_client import AsyncHTTPClient
-from clients.frappe_yawlit.utils.exceptions import NotFoundError, FrappeAPIError
+from clients.frappe_yawlit.utils.decorators import log_errors
+from clients.frappe_yawlit.utils.exceptions import ServiceUnavailableError
+from clients.frappe_yawlit.utils.cache import ttl_cache
+from clients.frappe_yawlit.utils.singleflight import SingleFlight
+
+# Frappe endpoints
+_EP_GET_SUBSCRIPTION_PLANS: Final = "/api/method/yawlit_automotive_services.api.subscription_flow_api.get_subscription_plans"
+_EP_GET_PLANS_BY_VEHICLE_TYPE: Final = "/api/method/yawlit_automotive_services.api.subscription_flow_api.get_plans_by_vehicle_type"
+_EP_GET_PLAN_DETAILS: Final = "/api/method/yawlit_automotive_services.api.product_form.get_plan_details"
+_EP_GET_PLAN_SERVICES: Final = "/api/method/yawlit_automotive_services.api.subscription_flow_api.get_plan_services"
+_EP_CALCULATE_SUBSCRIPTION_PRICE_V2: Final = "/api/method/yawlit_automotive_services.api.subscription_pricing.calculate_subscription_price_v2"
 
-logger = logging.getLogger(__name__)
+# Plan catalogue changes on the order of minutes; shared by all instances
+PLANS_CACHE_TTL = 60  # seconds
 
 
 class SubscriptionPlansClient:
     """Handle subscription plan discovery and pricing operations."""
 
+    __slots__ = ("http", "_quoting")
+
     def __init__(self, http_client: AsyncHTTPClient):
         """Initialize subscription plans client.
 
@@ -22,9 +39,19 @@ class SubscriptionPlansClient:
             http_client: Async HTTP client instance
         """
         self.http = http_client
-
+        # Interactive flows re-quote on every tweak, often firing the same
+        # quote several times at once. Pricing is a POST (not coalesced by
+        # AsyncHTTPClient), so identical concurrent quotes on this client -
+        # one host and session - share one call here.
+        self._quoting = SingleFlight()
+
+    @ttl_cache(ttl=PLANS_CACHE_TTL, maxsize=512, stale_on=(ServiceUnavailableError,))
+    @log_errors("fetching subscription plans")
     async def get_plans(self, vehicle_type: Optional[str] = None) -> Dict[str, Any]:
-        """Get available subscription plans.
+        """Get available subscription plans (cached for PLANS_CACHE_TTL seconds).
+
+        While the endpoint's circuit breaker is open, the last good list is
+        returned instead of raising.
 
         Args:
             vehicle_type: Filter plans by vehicle type (optional)
@@ -48,16 +75,12 @@ class SubscriptionPlansClient:
             >>> # Get plans for specific vehicle type
             >>> sedan_plans = await client.subscription_plans.get_plans("Sedan")
         """
-        try:
-            endpoint = "/api/method/yawlit_automotive_services.api.subscription_flow_api.get_subscription_plans"
-            if vehicle_type:
-                endpoint = "/api/method/yawlit_automotive_services.api.subscription_flow_api.get_plans_by_vehicle_type"
-                return await self.http.post(endpoint, {"vehicle_type": vehicle_type})
-            return await self.http.post(endpoint)
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching subscription plans: {e}")
-            raise
+        if vehicle_type:
+            return await self.http.get(_EP_GET_PLANS_BY_VEHICLE_TYPE, {"vehicle_type": vehicle_type})
+        return await self.http.get(_EP_GET_SUBSCRIPTION_PLANS)
 
+    @ttl_cache(ttl=PLANS_CACHE_TTL, maxsize=512)
+    @log_errors("fetching plan details for {plan_id}")
     async def get_plan_details(self, plan_id: str) -> Dict[str, Any]:
         """Get detailed information for a specific plan.
 
@@ -81,15 +104,28 @@ class SubscriptionPlansClient:
             >>> for service in details["services"]:
             ...     print(service["service_name"], service["frequency"])
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.product_form.get_plan_details",
-                {"plan_id": plan_id}
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching plan details for {plan_id}: {e}")
-            raise
+        return await self.http.get(
+            _EP_GET_PLAN_DETAILS,
+            {"plan_id": plan_id}
+        )
+
+    async def get_plan_details_bulk(self, plan_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get details for several plans concurrently (each cached as usual).
 
+        Args:
+            plan_ids: Plan IDs to fetch
+
+        Returns:
+            Dictionary of plan_id -> get_plan_details() response
+
+        Example:
+            >>> plans = await client.subscription_plans.get_plan_details_bulk(["PLAN-2025-001", "PLAN-2025-002"])
+        """
+        results = await asyncio.gather(*[self.get_plan_details(plan_id) for plan_id in plan_ids])
+        return dict(zip(plan_ids, results))
+
+    @ttl_cache(ttl=PLANS_CACHE_TTL, maxsize=512)
+    @log_errors("fetching plan services for {plan_id}")
     async def get_plan_services(self, plan_id: str) -> Dict[str, Any]:
         """Get services included in a subscription plan.
 
@@ -109,25 +145,59 @@ class SubscriptionPlansClient:
             >>> for service in services:
             ...     print(f"{service['service_name']}: {service['quantity']}x {service['frequency']}")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.subscription_flow_api.get_plan_services",
-                {"plan_id": plan_id}
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching plan services for {plan_id}: {e}")
-            raise
-
-    async def calculate_price(self, plan_id: str, vehicle_count: int, **kwargs) -> Dict[str, Any]:
+        return await self.http.get(
+            _EP_GET_PLAN_SERVICES,
+            {"plan_id": plan_id}
+        )
+
+    async def get_plan_bundle(self, plan_id: str) -> Dict[str, Any]:
+        """Get a plan's details and services together.
+
+        The two reads run concurrently, so the bundle costs one round-trip
+        of latency instead of two. Both halves land in the same caches as
+        get_plan_details()/get_plan_services(), so later single calls for
+        this plan are hits.
+
+        Args:
+            plan_id: Plan ID to load
+
+        Returns:
+            Dictionary with:
+                - details: get_plan_details() response
+                - services: get_plan_services() response
+
+        Example:
+            >>> bundle = await client.subscription_plans.get_plan_bundle("PLAN-2025-001")
+            >>> print(bundle["details"]["plan_name"])
+            >>> for service in bundle["services"]:
+            ...     print(service["service_name"])
+        """
+        details, services = await asyncio.gather(
+            self.get_plan_details(plan_id),
+            self.get_plan_services(plan_id)
+        )
+        return {"details": details, "services": services}
+
+    @log_errors("calculating price for plan {plan_id}")
+    async def calculate_price(
+        self,
+        plan_id: str,
+        vehicle_count: int,
+        coupon_code: Optional[str] = None,
+        addon_services: Optional[List[str]] = None,
+        billing_frequency: Optional[str] = None
+    ) -> PriceQuoteResponse:
         """Calculate subscription price based on plan and parameters.
 
+        Concurrent calls with identical parameters share one request (and
+        result - treat it as read-only).
+
         Args:
             plan_id: Plan ID to calculate price for
             vehicle_count: Number of vehicles to include
-            **kwargs: Additional pricing parameters:
-                - coupon_code: Discount coupon (optional)
-                - addon_services: Additional services (optional)
-                - billing_frequency: Annual/Monthly (optional)
+            coupon_code: Discount coupon (optional)
+            addon_services: Additional services (optional)
+            billing_frequency: Annual/Monthly (optional)
 
         Returns:
             Price breakdown including:
@@ -147,15 +217,13 @@ class SubscriptionPlansClient:
             >>> print(f"Total: ₹{price['total_price']}")
             >>> print(f"Discount: ₹{price['discount']}")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.subscription_pricing.calculate_subscription_price_v2",
-                {
-                    "plan_id": plan_id,
-                    "vehicle_count": vehicle_count,
-                    **kwargs
-                }
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error calculating price for plan {plan_id}: {e}")
-            raise
+        payload = SubscriptionPricePayload(
+            plan_id, vehicle_count, coupon_code, addon_services or [], billing_frequency
+        )
+        # Serialized once: the bytes are both the coalescing key (key order
+        # is fixed, so they are canonical) and the request body
+        body = orjson.dumps(payload.to_body())
+        return await self._quoting.do(body, lambda: self.http.post_raw(
+            _EP_CALCULATE_SUBSCRIPTION_PRICE_V2,
+            body
+        ))
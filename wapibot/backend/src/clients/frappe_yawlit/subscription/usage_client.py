@@ -3,18 +3,26 @@
 Handles subscription usage tracking, wash history, and analytics.
 """
 
-from typing import Dict, Any
-import logging
+from typing import Dict, Any, Final, List
+import asyncio
 
+from clients.frappe_yawlit.responses import RemainingWashesResponse, SubscriptionUsageResponse, UsageSummaryResponse
 from clients.frappe_yawlit.utils.http_client import AsyncHTTPClient
-from clients.frappe_yawlit.utils.exceptions import NotFoundError, FrappeAPIError
+from clients.frappe_yawlit.utils.decorators import log_errors
 
-logger = logging.getLogger(__name__)
+# Frappe endpoints
+_EP_GET_SUBSCRIPTION_USAGE: Final = "/api/method/yawlit_automotive_services.api.subscription_usage_api.get_subscription_usage"
+_EP_GET_WASH_HISTORY: Final = "/api/method/yawlit_automotive_services.api.subscription_usage_api.get_wash_history"
+_EP_GET_REMAINING_WASHES: Final = "/api/method/yawlit_automotive_services.api.subscription_usage_api.get_remaining_washes"
+_EP_GET_SUBSCRIPTION_USAGE_SUMMARY: Final = "/api/method/yawlit_automotive_services.api.subscription_wash_cancellation.get_subscription_usage_summary"
+_EP_GET_SUBSCRIPTION_USAGE_ANALYTICS: Final = "/api/method/yawlit_automotive_services.api.service_usage_analytics.get_subscription_usage_analytics"
 
 
 class SubscriptionUsageClient:
     """Handle subscription usage tracking and analytics operations."""
 
+    __slots__ = ("http",)
+
     def __init__(self, http_client: AsyncHTTPClient):
         """Initialize subscription usage client.
 
@@ -23,7 +31,12 @@ class SubscriptionUsageClient:
         """
         self.http = http_client
 
-    async def get_usage(self, subscription_id: str) -> Dict[str, Any]:
+    async def _get_sid(self, endpoint: str, subscription_id: str) -> Dict[str, Any]:
+        """GET a usage endpoint for one subscription (all of them are pure reads)."""
+        return await self.http.get(endpoint, {"subscription_id": subscription_id})
+
+    @log_errors("fetching subscription usage for {subscription_id}")
+    async def get_usage(self, subscription_id: str) -> SubscriptionUsageResponse:
         """Get subscription usage details.
 
         Args:
@@ -43,15 +56,29 @@ class SubscriptionUsageClient:
             >>> for service in usage['service_breakdown']:
             ...     print(f"{service['name']}: {service['used']}/{service['total']}")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.subscription_usage_api.get_subscription_usage",
-                {"subscription_id": subscription_id}
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching subscription usage for {subscription_id}: {e}")
-            raise
+        return await self._get_sid(_EP_GET_SUBSCRIPTION_USAGE, subscription_id)
+
+    async def get_usage_bulk(self, subscription_ids: List[str]) -> Dict[str, SubscriptionUsageResponse]:
+        """Get usage for several subscriptions concurrently.
+
+        Admin/list views need usage for every subscription on an account;
+        fetching them together costs about one round-trip instead of N.
+        Concurrency is capped by the shared HTTP client (MAX_INFLIGHT).
+
+        Args:
+            subscription_ids: Subscription IDs to fetch
+
+        Returns:
+            Dictionary of subscription_id -> get_usage() response
+
+        Example:
+            >>> usage = await client.subscription_usage.get_usage_bulk(["SUB-2025-001", "SUB-2025-002"])
+            >>> print(usage["SUB-2025-001"]["remaining_services"])
+        """
+        results = await asyncio.gather(*[self.get_usage(sid) for sid in subscription_ids])
+        return dict(zip(subscription_ids, results))
 
+    @log_errors("fetching wash history for {subscription_id}")
     async def get_wash_history(self, subscription_id: str) -> Dict[str, Any]:
         """Get wash service history for subscription.
 
@@ -73,16 +100,10 @@ class SubscriptionUsageClient:
             >>> for wash in history:
             ...     print(f"{wash['service_date']}: {wash['service_name']} - {wash['vehicle']}")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.subscription_usage_api.get_wash_history",
-                {"subscription_id": subscription_id}
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching wash history for {subscription_id}: {e}")
-            raise
-
-    async def get_remaining_washes(self, subscription_id: str) -> Dict[str, Any]:
+        return await self._get_sid(_EP_GET_WASH_HISTORY, subscription_id)
+
+    @log_errors("fetching remaining washes for {subscription_id}")
+    async def get_remaining_washes(self, subscription_id: str) -> RemainingWashesResponse:
         """Get remaining wash count for subscription.
 
         Args:
@@ -102,16 +123,25 @@ class SubscriptionUsageClient:
             >>> if washes.get('reset_date'):
             ...     print(f"Resets on: {washes['reset_date']}")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.subscription_usage_api.get_remaining_washes",
-                {"subscription_id": subscription_id}
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching remaining washes for {subscription_id}: {e}")
-            raise
-
-    async def get_usage_summary(self, subscription_id: str) -> Dict[str, Any]:
+        return await self._get_sid(_EP_GET_REMAINING_WASHES, subscription_id)
+
+    async def get_remaining_washes_bulk(self, subscription_ids: List[str]) -> Dict[str, RemainingWashesResponse]:
+        """Get remaining washes for several subscriptions concurrently.
+
+        Args:
+            subscription_ids: Subscription IDs to fetch
+
+        Returns:
+            Dictionary of subscription_id -> get_remaining_washes() response
+
+        Example:
+            >>> washes = await client.subscription_usage.get_remaining_washes_bulk(["SUB-2025-001", "SUB-2025-002"])
+        """
+        results = await asyncio.gather(*[self.get_remaining_washes(sid) for sid in subscription_ids])
+        return dict(zip(subscription_ids, results))
+
+    @log_errors("fetching usage summary for {subscription_id}")
+    async def get_usage_summary(self, subscription_id: str) -> UsageSummaryResponse:
         """Get comprehensive usage summary for subscription.
 
         Args:
@@ -131,15 +161,9 @@ class SubscriptionUsageClient:
             >>> for rec in summary.get('recommendations', []):
             ...     print(f"Tip: {rec}")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.subscription_wash_cancellation.get_subscription_usage_summary",
-                {"subscription_id": subscription_id}
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching usage summary for {subscription_id}: {e}")
-            raise
+        return await self._get_sid(_EP_GET_SUBSCRIPTION_USAGE_SUMMARY, subscription_id)
 
+    @log_errors("fetching usage analytics for {subscription_id}")
     async def get_analytics(self, subscription_id: str) -> Dict[str, Any]:
         """Get detailed usage analytics for subscription.
 
@@ -160,11 +184,4 @@ class SubscriptionUsageClient:
             >>> print(f"Total savings: ₹{analytics['cost_savings']['total_saved']}")
             >>> print(f"Most used service: {analytics['service_frequency'][0]['name']}")
         """
-        try:
-            return await self.http.post(
-                "/api/method/yawlit_automotive_services.api.service_usage_analytics.get_subscription_usage_analytics",
-                {"subscription_id": subscription_id}
-            )
-        except (NotFoundError, FrappeAPIError) as e:
-            logger.error(f"Error fetching usage analytics for {subscription_id}: {e}")
-            raise
+        return await self._get_sid(_EP_GET_SUBSCRIPTION_USAGE_ANALYTICS, subscription_id)
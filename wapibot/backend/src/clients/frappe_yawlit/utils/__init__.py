@@ -7,7 +7,8 @@ from clients.frappe_yawlit.utils.exceptions import (
     NotFoundError,
     ServerError,
     NetworkError,
-    TimeoutError
+    TimeoutError,
+    ServiceUnavailableError
 )
 from clients.frappe_yawlit.utils.http_client import AsyncHTTPClient
 
@@ -19,5 +20,6 @@ __all__ = [
     "ServerError",
     "NetworkError",
     "TimeoutError",
+    "ServiceUnavailableError",
     "AsyncHTTPClient"
 ]
@@ -0,0 +1,97 @@
+"""Bounded, single-flight TTL cache for near-static Frappe reference data.
+
+Per-process with LRU eviction; concurrent misses for the same key share one
+upstream call instead of stampeding Frappe. The ttl_cache decorator in
+utils/cache.py wraps client methods with one of these.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+from clients.frappe_yawlit.utils.singleflight import SingleFlight
+
+_MISSING = object()
+
+
+class AsyncTTLCache:
+    """Bounded TTL cache whose misses load through a SingleFlight."""
+
+    def __init__(self, ttl: float = 300.0, maxsize: int = 128, keep_expired: bool = False):
+        """Initialize cache.
+
+        Args:
+            ttl: Seconds an entry stays valid
+            maxsize: Maximum entries before least-recently-used eviction
+            keep_expired: Keep expired entries (until evicted) for get_stale()
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.keep_expired = keep_expired
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        # In-flight loads only; a key is forgotten as soon as its load ends,
+        # whether it succeeded or raised
+        self._loading = SingleFlight()
+        # Bumped by invalidate() so loads started before it don't store
+        # pre-invalidation data
+        self._generation = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value, or _MISSING if absent or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            if not self.keep_expired:
+                del self._data[key]
+            return _MISSING
+        self._data.move_to_end(key)
+        return value
+
+    def get_stale(self, key: Hashable) -> Any:
+        """Return the last stored value even if expired, or _MISSING."""
+        entry = self._data.get(key)
+        return _MISSING if entry is None else entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every key for which predicate(key) is true."""
+        self._generation += 1
+        for key in [key for key in self._data if predicate(key)]:
+            del self._data[key]
+
+    def invalidate(self, key: Hashable = _MISSING) -> None:
+        """Drop one key, or everything when called without a key."""
+        self._generation += 1
+        if key is _MISSING:
+            self._data.clear()
+        else:
+            self._data.pop(key, None)
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value or load it once, even under concurrency.
+
+        Errors are not cached - the next caller retries the load.
+        """
+        value = self.get(key)
+        if value is not _MISSING:
+            return value
+        return await self._loading.do(key, lambda: self._load(key, loader))
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Run loader() and store its result unless invalidated meanwhile."""
+        value = self.get(key)
+        if value is not _MISSING:
+            return value
+        generation = self._generation
+        value = await loader()
+        if generation == self._generation:
+            self.set(key, value)
+        return value
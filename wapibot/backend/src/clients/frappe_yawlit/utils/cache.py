@@ -0,0 +1,80 @@
+"""ttl_cache: per-scope caching decorator for async Frappe client methods.
+
+Entries live in an AsyncTTLCache (utils/async_ttl_cache.py); the raw
+response caches used by AsyncHTTPClient are in utils/cache_backends.py.
+"""
+
+import functools
+import inspect
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, Type
+
+from clients.frappe_yawlit.utils.async_ttl_cache import _MISSING, AsyncTTLCache
+
+
+def host_scope(client: Any) -> Hashable:
+    """Scope for session-independent reference data: the Frappe host."""
+    return client.http.config.base_url
+
+
+def session_scope(client: Any) -> Hashable:
+    """Scope for per-customer data: the host plus the authenticated identity."""
+    return client.http.config.identity
+
+
+def ttl_cache(
+    ttl: float = 300.0,
+    maxsize: int = 128,
+    stale_on: Tuple[Type[BaseException], ...] = (),
+    scope: Callable[[Any], Hashable] = host_scope
+):
+    """Cache an async client method's result per scope and arguments.
+
+    Arguments are bound to the method's signature (defaults applied), so
+    get(x) and get(id=x) share one entry. ``scope(self)`` is part of the
+    key: the default, host_scope, shares entries between clients of the same
+    Frappe host and suits reference data only. Anything Frappe filters by
+    the caller's permissions must use session_scope.
+
+    The wrapper exposes ``invalidate(*args, **kwargs)`` - drops the entry for
+    those arguments in every scope - and ``cache_clear()``.
+
+    With ``stale_on``, a reload failing with one of those exceptions returns
+    the last good value (however old) instead of raising, if there is one.
+
+    Example:
+        >>> class BookingManageClient:
+        ...     @ttl_cache(ttl=15, scope=session_scope)
+        ...     async def get_booking_details(self, booking_id): ...
+        >>> BookingManageClient.get_booking_details.invalidate("BK-001")
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]):
+        cache = AsyncTTLCache(ttl=ttl, maxsize=maxsize, keep_expired=bool(stale_on))
+        signature = inspect.signature(func)
+
+        def args_key(args: tuple, kwargs: Dict[str, Any]) -> Hashable:
+            bound = signature.bind(None, *args, **kwargs)
+            bound.apply_defaults()
+            return tuple(bound.arguments.items())[1:]  # drop self
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            key = (scope(self), args_key(args, kwargs))
+            try:
+                return await cache.get_or_load(key, lambda: func(self, *args, **kwargs))
+            except stale_on:
+                value = cache.get_stale(key)
+                if value is _MISSING:
+                    raise
+                return value
+
+        wrapper.cache = cache
+
+        def invalidate(*args, **kwargs) -> None:
+            target = args_key(args, kwargs)
+            cache.invalidate_where(lambda key: key[1] == target)
+
+        wrapper.invalidate = invalidate
+        wrapper.cache_clear = lambda: cache.invalidate()
+        return wrapper
+
+    return decorator
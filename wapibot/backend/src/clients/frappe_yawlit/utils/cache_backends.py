@@ -0,0 +1,94 @@
+"""Byte caches with a per-entry TTL (ResponseCache backends).
+
+Used by AsyncHTTPClient for whitelisted endpoints and by the customer
+lookup and payment clients. MemoryResponseCache is the default;
+RedisResponseCache shares hits across worker processes.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Protocol
+
+
+class ResponseCache(Protocol):
+    """Backend interface for AsyncHTTPClient's response cache."""
+
+    async def get(self, key: str) -> bytes | None:
+        """Return cached response bytes, or None on a miss."""
+        ...
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store response bytes for ttl seconds."""
+        ...
+
+    async def delete(self, key: str) -> None:
+        """Drop a key if present."""
+        ...
+
+
+class MemoryResponseCache:
+    """Per-process ResponseCache with per-entry TTL and LRU eviction."""
+
+    def __init__(self, maxsize: int = 256):
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum entries before least-recently-used eviction
+        """
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, tuple[float, bytes]]" = OrderedDict()
+
+    async def get(self, key: str) -> bytes | None:
+        """Return cached bytes, or None if absent or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store bytes, evicting the least recently used entry if full."""
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        """Drop a key if present."""
+        self._data.pop(key, None)
+
+
+class RedisResponseCache:
+    """ResponseCache stored in Redis, shared by all worker processes.
+
+    Example:
+        >>> import redis.asyncio as aioredis
+        >>> cache = RedisResponseCache(aioredis.from_url(settings.celery_broker_url))
+        >>> http = AsyncHTTPClient(config, response_cache=cache)
+    """
+
+    def __init__(self, redis: Any, prefix: str = "frappe:resp:"):
+        """Initialize cache.
+
+        Args:
+            redis: redis.asyncio client (bytes responses, i.e. no decode_responses)
+            prefix: Key namespace
+        """
+        self.redis = redis
+        self.prefix = prefix
+
+    async def get(self, key: str) -> bytes | None:
+        """Return cached bytes, or None on a miss."""
+        return await self.redis.get(self.prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store bytes with a Redis-side expiry."""
+        await self.redis.set(self.prefix + key, value, px=int(ttl * 1000))
+
+    async def delete(self, key: str) -> None:
+        """Drop a key if present."""
+        await self.redis.delete(self.prefix + key)
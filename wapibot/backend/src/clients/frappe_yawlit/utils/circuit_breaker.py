@@ -0,0 +1,136 @@
+"""Per-endpoint circuit breaker for Frappe requests.
+
+During a Frappe outage every call would otherwise wait out its timeouts and
+retries, pinning pool slots. After BREAKER_FAILURE_THRESHOLD failures within
+BREAKER_WINDOW seconds an endpoint's breaker opens: calls fail immediately
+with ServiceUnavailableError for BREAKER_COOLDOWN seconds. Then a single
+probe request is let through (half-open); its outcome closes or re-opens
+the breaker.
+"""
+
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, TypeVar
+
+from clients.frappe_yawlit.utils.exceptions import (
+    FrappeAPIError, NetworkError, ServerError, ServiceUnavailableError, TimeoutError
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_WINDOW = 10.0  # seconds
+BREAKER_COOLDOWN = 30.0  # seconds
+
+
+class _EndpointState:
+    """Failure history and open/half-open state of one endpoint."""
+
+    __slots__ = ("failures", "opened_at", "probing")
+
+    def __init__(self):
+        self.failures: Deque[float] = deque()
+        self.opened_at: float | None = None
+        self.probing = False
+
+
+class CircuitBreaker:
+    """Tracks failures per endpoint path and short-circuits failing ones."""
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        window: float = BREAKER_WINDOW,
+        cooldown: float = BREAKER_COOLDOWN
+    ):
+        """Initialize with every endpoint closed.
+
+        Args:
+            failure_threshold: Failures within window that open the breaker
+            window: Seconds over which failures are counted
+            cooldown: Seconds an open breaker rejects calls before probing
+        """
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.cooldown = cooldown
+        self._states: Dict[str, _EndpointState] = {}
+
+    def before_call(self, endpoint: str) -> None:
+        """Admit a call, or raise if the endpoint's breaker is open.
+
+        Args:
+            endpoint: API endpoint path
+
+        Raises:
+            ServiceUnavailableError: Breaker open, or a half-open probe is
+                already in flight
+        """
+        state = self._states.get(endpoint)
+        if state is None or state.opened_at is None:
+            return
+        if not state.probing and time.monotonic() - state.opened_at >= self.cooldown:
+            state.probing = True
+            return
+        raise ServiceUnavailableError(f"Circuit open for {endpoint}", 503)
+
+    def record_success(self, endpoint: str) -> None:
+        """Close the endpoint's breaker and forget its failures."""
+        state = self._states.pop(endpoint, None)
+        if state is not None and state.opened_at is not None:
+            logger.info("Circuit closed for %s", endpoint)
+
+    def record_failure(self, endpoint: str) -> None:
+        """Count a failure; open (or re-open) the breaker when over threshold."""
+        state = self._states.setdefault(endpoint, _EndpointState())
+        now = time.monotonic()
+        if state.probing:
+            state.probing = False
+            state.opened_at = now
+            logger.warning("Circuit re-opened for %s after failed probe", endpoint)
+            return
+        state.failures.append(now)
+        while state.failures and now - state.failures[0] > self.window:
+            state.failures.popleft()
+        if state.opened_at is None and len(state.failures) >= self.failure_threshold:
+            state.opened_at = now
+            logger.warning(
+                "Circuit opened for %s: %d failures in %.0fs",
+                endpoint, len(state.failures), self.window
+            )
+
+    def release(self, endpoint: str) -> None:
+        """Give up a half-open probe that ended without an outcome (cancelled)."""
+        state = self._states.get(endpoint)
+        if state is not None:
+            state.probing = False
+
+    async def call(self, endpoint: str, send: Callable[[], Awaitable[T]]) -> T:
+        """Run send() through the endpoint's breaker.
+
+        Server errors, timeouts and network errors count as failures; any
+        response - including a 4xx - shows Frappe is up and closes the breaker.
+
+        Raises:
+            ServiceUnavailableError: Breaker open for this endpoint (nothing sent)
+        """
+        self.before_call(endpoint)
+        try:
+            result = await send()
+        except (ServerError, TimeoutError, NetworkError):
+            self.record_failure(endpoint)
+            raise
+        except FrappeAPIError as e:
+            if e.status_code is None:
+                # Unexpected local error - says nothing about Frappe's health
+                self.release(endpoint)
+            else:
+                self.record_success(endpoint)
+            raise
+        except BaseException:
+            self.release(endpoint)
+            raise
+        self.record_success(endpoint)
+        return result
@@ -0,0 +1,29 @@
+"""Request identity for coalescing concurrent identical Frappe reads.
+
+AsyncHTTPClient shares one in-flight call among identical read-like
+requests (see SingleFlight); these helpers decide which requests qualify
+and what makes two of them identical.
+"""
+
+import re
+from typing import Any
+
+import orjson
+
+# Frappe reads are mostly POSTs; treat get*/check* methods as idempotent
+# e.g. frappe.client.get_list, admin_dashboard.get_badge_counts
+_READ_METHOD_RE = re.compile(r"\.(?:get|check)(?:_\w+)?$")
+
+
+def is_read_like(method: str, endpoint: str) -> bool:
+    """Return True for requests that are safe to coalesce (and retry on 5xx)."""
+    return method == "GET" or bool(_READ_METHOD_RE.search(endpoint))
+
+
+def request_key(method: str, endpoint: str, data: Any, params: Any) -> bytes:
+    """Build a canonical identity for a request (stable key order)."""
+    return orjson.dumps(
+        [method, endpoint, data, params],
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        default=str
+    )
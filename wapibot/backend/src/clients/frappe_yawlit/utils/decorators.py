@@ -0,0 +1,113 @@
+"""Cross-cutting decorators for Frappe sub-client methods."""
+
+import functools
+import inspect
+import logging
+from typing import Any, Awaitable, Callable, TypeVar
+
+from clients.frappe_yawlit.utils.exceptions import FrappeAPIError
+from clients.frappe_yawlit.utils.singleflight import SingleFlight
+
+T = TypeVar("T")
+
+
+def _describe(func: Callable[..., Any], action: str) -> Callable[..., str]:
+    """Return a function rendering ``action`` for one call of ``func``."""
+    if "{" not in action:
+        return lambda *args, **kwargs: action
+    signature = inspect.signature(func)
+
+    def render(*args: Any, **kwargs: Any) -> str:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return action.format_map(bound.arguments)
+
+    return render
+
+
+def log_errors(action: str) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Log FrappeAPIError raised by an async client method, then re-raise.
+
+    Replaces the per-method ``try/except: logger.error(...); raise`` block.
+    The message is only formatted when an error actually occurs, and is
+    logged on the decorated function's module logger.
+
+    Args:
+        action: What the method was doing, e.g. "fetching vehicle types".
+            May reference call arguments by name: "cancelling {booking_id}".
+
+    Example:
+        >>> @log_errors("fetching optional addons for {service_id}")
+        ... async def get_optional_addons(self, service_id: str):
+        ...     return await self.http.post(_EP_GET_OPTIONAL_ADDONS, {"product_id": service_id})
+    """
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        log = logging.getLogger(func.__module__)
+        describe = _describe(func, action)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            try:
+                return await func(*args, **kwargs)
+            except FrappeAPIError as e:
+                log.error("Error %s: %s", describe(*args, **kwargs), e)
+                raise
+
+        return wrapper
+
+    return decorator
+
+
+def wrap_errors(action: str) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Re-raise FrappeAPIError with call context, without logging it.
+
+    For clients whose errors are logged once by the caller (call_frappe
+    node). The new exception has the same type, status code and response
+    data, a message prefixed with ``action``, and the original as
+    ``__cause__`` - so ``except NotFoundError`` still matches.
+
+    Args:
+        action: Same format as log_errors, e.g. "fetching booking details for {booking_id}"
+
+    Example:
+        >>> @wrap_errors("fetching booking details for {booking_id}")
+        ... async def get_booking_details(self, booking_id: str): ...
+        >>> # NotFoundError: fetching booking details for BKG-1: Booking not found
+    """
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        describe = _describe(func, action)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            try:
+                return await func(*args, **kwargs)
+            except FrappeAPIError as e:
+                raise type(e)(
+                    f"{describe(*args, **kwargs)}: {e}", e.status_code, e.response_data
+                ) from e
+
+        return wrapper
+
+    return decorator
+
+
+def singleflight(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Coalesce concurrent calls with identical arguments into one.
+
+    Covers the whole method (cache lookups, fallbacks, post-processing),
+    on top of AsyncHTTPClient's per-request coalescing. Arguments must be
+    hashable; every concurrent caller gets the same result object, so
+    treat it as read-only.
+
+    Example:
+        >>> @singleflight
+        ... async def check_customer_exists(self, identifier: str): ...
+    """
+    flight = SingleFlight()
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        key = (args, tuple(sorted(kwargs.items())))
+        return await flight.do(key, lambda: func(*args, **kwargs))
+
+    return wrapper
@@ -0,0 +1,42 @@
+"""Server-sent event subscription over an AsyncHTTPClient's pool."""
+
+from typing import Any, AsyncIterator, Dict
+
+import httpx
+import orjson
+
+from clients.frappe_yawlit.utils.exceptions import NetworkError
+from clients.frappe_yawlit.utils.http_errors import raise_for_response
+
+_SSE_HEADERS = {"Accept": "text/event-stream"}
+
+
+async def iter_events(
+    client: httpx.AsyncClient,
+    endpoint: str,
+    timeout: httpx.Timeout
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield the JSON ``data:`` payload of each event on an SSE stream.
+
+    Args:
+        client: Pool to open the stream on
+        endpoint: API endpoint path
+        timeout: Request timeout - should have no read timeout
+
+    Yields:
+        Parsed JSON payload of each event
+
+    Raises:
+        NetworkError: Connection failed or dropped
+        FrappeAPIError: Server rejected the subscription (e.g. 404)
+    """
+    try:
+        async with client.stream("GET", endpoint, headers=_SSE_HEADERS, timeout=timeout) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                raise_for_response(response)
+            async for line in response.aiter_lines():
+                if line.startswith("data:"):
+                    yield orjson.loads(line[5:])
+    except httpx.HTTPError as e:
+        raise NetworkError(f"Event stream error: {str(e)}") from e
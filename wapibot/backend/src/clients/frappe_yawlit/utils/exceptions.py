@@ -48,3 +48,8 @@ class NetworkError(FrappeAPIError):
 class TimeoutError(FrappeAPIError):
     """Request timeout error."""
     pass
+
+
+class ServiceUnavailableError(FrappeAPIError):
+    """Circuit breaker open - endpoint failing, request not sent (503)."""
+    pass
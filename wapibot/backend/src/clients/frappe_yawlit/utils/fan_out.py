@@ -0,0 +1,61 @@
+"""Client-side fallback for Frappe bulk endpoints.
+
+When a bulk endpoint is missing (404), the bulk methods issue the single-item
+calls concurrently instead and report the outcome in the bulk response shape.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from clients.frappe_yawlit.utils.exceptions import FrappeAPIError
+
+# Single-item calls in flight at once - well under the HTTP pool size
+FAN_OUT_CONCURRENCY = 16
+
+
+async def fan_out(
+    items: List[Dict[str, Any]],
+    call: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+    concurrency: int = FAN_OUT_CONCURRENCY
+) -> Dict[str, Any]:
+    """Run call(item) for every item concurrently and aggregate the outcomes.
+
+    A FrappeAPIError fails only its own item; any other exception propagates.
+
+    Args:
+        items: Request dicts, one per single-item call
+        call: Coroutine function performing one single-item call
+        concurrency: Maximum calls in flight at once
+
+    Returns:
+        Bulk results with:
+            - total: Items submitted
+            - successful: Calls that succeeded
+            - failed: Calls that raised FrappeAPIError
+            - results: Responses of the successful calls, in item order
+            - errors: The failed items, each with an added "error" message
+
+    Example:
+        >>> result = await fan_out(vehicles, self.add_vehicle)
+        >>> print(f"Added {result['successful']}/{result['total']}")
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(item: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
+        async with sem:
+            try:
+                return True, await call(item)
+            except FrappeAPIError as e:
+                return False, {"error": str(e), **item}
+
+    outcomes = await asyncio.gather(*[_one(item) for item in items])
+    results = [outcome for ok, outcome in outcomes if ok]
+    errors = [outcome for ok, outcome in outcomes if not ok]
+
+    return {
+        "total": len(items),
+        "successful": len(results),
+        "failed": len(errors),
+        "results": results,
+        "errors": errors
+    }
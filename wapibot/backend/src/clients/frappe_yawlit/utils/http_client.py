@@ -1,82 +1,104 @@
 """Async HTTP client for Frappe API.
 
 Provides async HTTP methods with retry logic, logging, and error handling.
+A per-endpoint circuit breaker fails calls fast while Frappe is down.
+Concurrent identical read requests are coalesced into one upstream call.
+The request path (caching, coalescing, breaker, retries) is in
+utils/http_pipeline.py; pool settings, keep-alive and SSE streaming live in
+sibling utils modules.
 """
 
-import logging
-from typing import Any, Dict, Set
+import asyncio
+from typing import Any, AsyncIterator, Dict, Final, Type
 import httpx
+from pydantic import BaseModel
 
 from clients.frappe_yawlit.config import FrappeClientConfig
-from clients.frappe_yawlit.utils.exceptions import (
-    AuthenticationError,
-    NetworkError,
-    NotFoundError,
-    ServerError,
-    TimeoutError,
-    ValidationError,
-    FrappeAPIError
-)
-
-logger = logging.getLogger(__name__)
-
-# Sensitive fields that should never be logged
-SENSITIVE_FIELDS: Set[str] = {
-    "password", "api_key", "api_secret", "token", "secret",
-    "authorization", "cookie", "session", "sid", "otp",
-    "credit_card", "cvv", "ssn", "phone_number", "email"
-}
-
-
-def _sanitize_for_logging(data: Any, depth: int = 0) -> Any:
-    """Recursively sanitize sensitive data for logging.
-
-    Args:
-        data: Data to sanitize (dict, list, or primitive)
-        depth: Recursion depth (prevents infinite loops)
-
-    Returns:
-        Sanitized data safe for logging
+from clients.frappe_yawlit.utils.cache_backends import ResponseCache
+from clients.frappe_yawlit.utils.circuit_breaker import CircuitBreaker
+from clients.frappe_yawlit.utils.event_stream import iter_events
+from clients.frappe_yawlit.utils.http_pipeline import RequestPipeline
+from clients.frappe_yawlit.utils.http_pool import pool_limits, pool_timeout, register_pool, release_pool, stream_timeout
+from clients.frappe_yawlit.utils.keepalive import KEEPALIVE_INTERVAL, keepalive_loop
+
+# Cap on concurrent in-flight requests per client (i.e. per Frappe host).
+# Keeps fan-outs (dashboard fetch_all, warmup, bulk loops) below the bench's
+# gunicorn worker count; excess calls queue here instead of timing out there.
+MAX_INFLIGHT = 16
+
+# Pre-encoded body for calls that post an empty object (e.g. unfiltered
+# list endpoints); pass to post_raw() to skip serialization entirely
+EMPTY_BODY: Final = b"{}"
+
+
+class AsyncHTTPClient(RequestPipeline):
+    """Async HTTP client for Frappe API with retry logic.
+
+    Owns a persistent connection pool - create one per process and share it
+    (YawlitClient passes a single instance to every sub-client). Close it
+    only on application shutdown.
     """
-    if depth > 5:  # Prevent deep recursion
-        return "[MAX_DEPTH]"
-
-    if isinstance(data, dict):
-        sanitized = {}
-        for key, value in data.items():
-            key_lower = str(key).lower()
-            # Check if key contains any sensitive field name
-            if any(sensitive in key_lower for sensitive in SENSITIVE_FIELDS):
-                sanitized[key] = "[REDACTED]"
-            else:
-                sanitized[key] = _sanitize_for_logging(value, depth + 1)
-        return sanitized
-    elif isinstance(data, list):
-        return [_sanitize_for_logging(item, depth + 1) for item in data]
-    else:
-        return data
-
-
-class AsyncHTTPClient:
-    """Async HTTP client for Frappe API with retry logic."""
-
-    def __init__(self, config: FrappeClientConfig, max_retries: int = 3):
+
+    def __init__(
+        self,
+        config: FrappeClientConfig,
+        max_retries: int = 3,
+        max_inflight: int = MAX_INFLIGHT,
+        response_cache: ResponseCache | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        pool_size: int | None = None,
+        retry_backoff: bool = True
+    ):
         """Initialize HTTP client with security hardening.
 
         Args:
             config: Frappe client configuration
             max_retries: Maximum number of retries for failed requests
+            max_inflight: Maximum concurrent requests to this Frappe host
+            response_cache: Backend for CACHEABLE_ENDPOINTS responses
+                (defaults to a per-process MemoryResponseCache)
+            circuit_breaker: Per-endpoint breaker (defaults to a new CircuitBreaker)
+            pool_size: Maximum open connections (defaults to http_pool.POOL_LIMITS)
+            retry_backoff: Sleep with jittered exponential backoff between
+                retries (disable for tests or latency-critical callers)
         """
-        self.config = config
-        self.max_retries = max_retries
-        self.client = httpx.AsyncClient(
-            timeout=config.timeout,
+        register_pool(config.base_url)
+        client = httpx.AsyncClient(
+            base_url=config.base_url,  # Requests pass only the endpoint path
+            timeout=pool_timeout(config.timeout),
+            http2=True,  # Multiplex concurrent calls over one TLS connection
+            limits=pool_limits(pool_size),
             follow_redirects=False,  # Security: Prevent open redirect attacks
             verify=True  # Security: Explicitly verify SSL certificates
         )
+        super().__init__(
+            config, client, max_retries, max_inflight, response_cache, circuit_breaker, retry_backoff
+        )
+        self._keepalive_task: asyncio.Task | None = None
+        self._closed = False
+
+    def start_keepalive(self, interval: float = KEEPALIVE_INTERVAL) -> None:
+        """Start pinging Frappe in the background to keep the pool warm.
+
+        Idempotent; the task is cancelled by close(). Must be called from a
+        running event loop (e.g. the FastAPI lifespan).
+
+        Args:
+            interval: Seconds between pings
+        """
+        if self._keepalive_task is None or self._keepalive_task.done():
+            self._keepalive_task = asyncio.create_task(
+                keepalive_loop(self.client, interval, self._sync_headers)
+            )
 
     async def close(self) -> None:
         """Close HTTP client session."""
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+        if not self._closed:
+            self._closed = True
+            release_pool(self.config.base_url)
         await self.client.aclose()
 
     async def __aenter__(self):
@@ -87,145 +109,69 @@ class AsyncHTTPClient:
         """Async context manager exit."""
         await self.close()
 
-    def _handle_error(self, response: httpx.Response) -> None:
-        """Handle HTTP errors and raise appropriate exceptions.
-
-        Args:
-            response: HTTP response object
-
-        Raises:
-            Appropriate FrappeAPIError subclass based on status code
-        """
-        status_code = response.status_code
-
-        # Try to parse error message from response
-        try:
-            error_data = response.json()
-            message = error_data.get("message") or error_data.get("error") or response.text
-        except Exception:
-            error_data = {}
-            message = response.text or f"HTTP {status_code} error"
-
-        # Security: Sanitize error data to prevent information leakage
-        sanitized_error_data = _sanitize_for_logging(error_data)
-
-        # Map status codes to exception types
-        if status_code in (401, 403):
-            raise AuthenticationError(message, status_code, sanitized_error_data)
-        elif status_code == 404:
-            raise NotFoundError(message, status_code, sanitized_error_data)
-        elif status_code == 422:
-            raise ValidationError(message, status_code, sanitized_error_data)
-        elif status_code >= 500:
-            raise ServerError(message, status_code, sanitized_error_data)
-        else:
-            raise FrappeAPIError(message, status_code, sanitized_error_data)
-
-    async def _request(
-        self,
-        method: str,
-        endpoint: str,
-        data: Dict[str, Any] | None = None,
-        params: Dict[str, Any] | None = None
-    ) -> Dict[str, Any]:
-        """Make HTTP request with retry logic.
+    async def get(self, endpoint: str, params: Dict[str, Any] | None = None) -> Dict[str, Any]:
+        """Make GET request.
 
         Args:
-            method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint path
-            data: Request body data
             params: Query parameters
 
         Returns:
             Parsed JSON response
-
-        Raises:
-            NetworkError: Network/connection error
-            TimeoutError: Request timeout
-            FrappeAPIError: API error response
         """
-        url = f"{self.config.base_url}{endpoint}"
-        headers = self.config.get_auth_headers()
-
-        logger.debug(f"{method} {url}")
-        if data:
-            # Security: Sanitize sensitive data before logging
-            sanitized_data = _sanitize_for_logging(data)
-            logger.debug(f"Request data: {sanitized_data}")
-
-        retries = 0
-        last_exception = None
-
-        while retries < self.max_retries:
-            try:
-                response = await self.client.request(
-                    method=method,
-                    url=url,
-                    json=data,
-                    params=params,
-                    headers=headers
-                )
-
-                # Check for HTTP errors
-                if response.status_code >= 400:
-                    self._handle_error(response)
-
-                # Parse and return response
-                result = response.json()
-                # Security: Sanitize sensitive data before logging
-                sanitized_result = _sanitize_for_logging(result)
-                logger.debug(f"Response: {sanitized_result}")
-                return result
-
-            except httpx.TimeoutException as e:
-                retries += 1
-                last_exception = e
-                logger.warning(f"Request timeout (attempt {retries}/{self.max_retries}): {url}")
-                if retries >= self.max_retries:
-                    raise TimeoutError(f"Request timed out after {self.max_retries} attempts") from e
-
-            except httpx.NetworkError as e:
-                retries += 1
-                last_exception = e
-                logger.warning(f"Network error (attempt {retries}/{self.max_retries}): {url}")
-                if retries >= self.max_retries:
-                    raise NetworkError(f"Network error after {self.max_retries} attempts: {str(e)}") from e
-
-            except FrappeAPIError:
-                # Don't retry API errors (4xx, 5xx)
-                raise
-
-            except Exception as e:
-                logger.error(f"Unexpected error in HTTP request: {e}")
-                raise FrappeAPIError(f"Unexpected error: {str(e)}") from e
-
-        # Should never reach here
-        if last_exception:
-            raise NetworkError(f"Request failed after {self.max_retries} retries") from last_exception
+        return await self._request("GET", endpoint, params=params)
 
-    async def get(self, endpoint: str, params: Dict[str, Any] | None = None) -> Dict[str, Any]:
-        """Make GET request.
+    async def post(
+        self,
+        endpoint: str,
+        data: Dict[str, Any] | Any | None = None,
+        response_model: Type[BaseModel] | None = None
+    ) -> Any:
+        """Make POST request.
 
         Args:
             endpoint: API endpoint path
-            params: Query parameters
+            data: Request body data - a dict or a payload dataclass
+            response_model: Optional Pydantic model to decode the body into
+                (fields not declared on the model are never materialized)
 
         Returns:
-            Parsed JSON response
+            Parsed JSON response, or a response_model instance
+
+        Example:
+            >>> class BookingRow(BaseModel):
+            ...     booking_id: str
+            ...     status: str | None = None
+            >>> class RecentBookings(BaseModel):
+            ...     message: list[BookingRow]
+            >>> rows = await http.post(endpoint, {"limit": 25}, response_model=RecentBookings)
         """
-        return await self._request("GET", endpoint, params=params)
+        return await self._request("POST", endpoint, data=data, response_model=response_model)
 
-    async def post(self, endpoint: str, data: Dict[str, Any] | None = None) -> Dict[str, Any]:
-        """Make POST request.
+    async def post_raw(
+        self,
+        endpoint: str,
+        body: bytes,
+        response_model: Type[BaseModel] | None = None
+    ) -> Any:
+        """Make POST request with an already JSON-encoded body.
+
+        For static payloads (EMPTY_BODY, module-level constants) that would
+        otherwise be re-serialized on every call. Retries, coalescing and
+        response caching behave exactly as for post().
 
         Args:
             endpoint: API endpoint path
-            data: Request body data
+            body: JSON-encoded request body
+            response_model: Optional Pydantic model to decode the body into
 
         Returns:
-            Parsed JSON response
+            Parsed JSON response, or a response_model instance
+
+        Example:
+            >>> bookings = await http.post_raw(endpoint, EMPTY_BODY)
         """
-        return await self._request("POST", endpoint, data=data)
+        return await self._request("POST", endpoint, data=body, response_model=response_model)
 
     async def put(self, endpoint: str, data: Dict[str, Any] | None = None) -> Dict[str, Any]:
         """Make PUT request.
@@ -249,3 +195,23 @@ class AsyncHTTPClient:
             Parsed JSON response
         """
         return await self._request("DELETE", endpoint)
+
+    def stream_events(self, endpoint: str) -> AsyncIterator[Dict[str, Any]]:
+        """Subscribe to a server-sent event stream.
+
+        Holds one long-lived GET open (no read timeout) and yields the JSON
+        ``data:`` payload of each event. Not retried - callers decide how to
+        resume or degrade when the stream drops.
+
+        Args:
+            endpoint: API endpoint path
+
+        Yields:
+            Parsed JSON payload of each event
+
+        Raises:
+            NetworkError: Connection failed or dropped
+            FrappeAPIError: Server rejected the subscription (e.g. 404)
+        """
+        self._sync_headers()
+        return iter_events(self.client, endpoint, stream_timeout(self.config.timeout))
@@ -0,0 +1,51 @@
+"""Mapping of Frappe error responses to FrappeAPIError subclasses."""
+
+from typing import Dict, Type
+
+import httpx
+import orjson
+
+from clients.frappe_yawlit.utils.sanitize import sanitize_for_logging
+from clients.frappe_yawlit.utils.exceptions import (
+    AuthenticationError,
+    NotFoundError,
+    ServerError,
+    ValidationError,
+    FrappeAPIError
+)
+
+# Status codes with a dedicated exception; other 5xx -> ServerError,
+# anything else -> FrappeAPIError
+_STATUS_ERRORS: Dict[int, Type[FrappeAPIError]] = {
+    401: AuthenticationError,
+    403: AuthenticationError,
+    404: NotFoundError,
+    422: ValidationError,
+}
+
+
+def raise_for_response(response: httpx.Response) -> None:
+    """Handle HTTP errors and raise appropriate exceptions.
+
+    Args:
+        response: HTTP response object (status >= 400, body already read)
+
+    Raises:
+        Appropriate FrappeAPIError subclass based on status code
+    """
+    status_code = response.status_code
+
+    # Try to parse error message from response
+    try:
+        error_data = orjson.loads(response.content)
+        message = error_data.get("message") or error_data.get("error") or response.text
+    except (orjson.JSONDecodeError, AttributeError):
+        # Not JSON (e.g. an nginx HTML page), or JSON that isn't an object
+        error_data = {}
+        message = response.text or f"HTTP {status_code} error"
+
+    # Security: Sanitize error data to prevent information leakage
+    sanitized_error_data = sanitize_for_logging(error_data)
+
+    exc_type = _STATUS_ERRORS.get(status_code) or (ServerError if status_code >= 500 else FrappeAPIError)
+    raise exc_type(message, status_code, sanitized_error_data)
@@ -0,0 +1,151 @@
+"""Request pipeline behind AsyncHTTPClient.
+
+Each request goes: response cache (CACHEABLE_ENDPOINTS) -> coalescing of
+identical in-flight reads (SingleFlight) -> per-endpoint circuit breaker ->
+retry loop (utils/http_retry.py). AsyncHTTPClient adds the connection pool
+lifecycle and the public get/post/... methods on top.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Mapping, Type
+
+import httpx
+import orjson
+from pydantic import BaseModel
+
+from clients.frappe_yawlit.config import FrappeClientConfig
+from clients.frappe_yawlit.utils.cache_backends import MemoryResponseCache, ResponseCache
+from clients.frappe_yawlit.utils.circuit_breaker import CircuitBreaker
+from clients.frappe_yawlit.utils.coalescing import is_read_like, request_key
+from clients.frappe_yawlit.utils.http_retry import send_with_retries
+from clients.frappe_yawlit.utils.response_caching import CACHEABLE_ENDPOINTS, response_cache_key
+from clients.frappe_yawlit.utils.sanitize import sanitize_for_logging
+from clients.frappe_yawlit.utils.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# List endpoints return large JSON arrays; ask for compressed responses
+# (br needs httpx[brotli]; httpx decodes transparently)
+ACCEPT_ENCODING = "br, gzip"
+
+
+def _decode(content: bytes, response_model: Type[BaseModel] | None) -> Any:
+    """Decode a JSON body, straight into response_model when given."""
+    if response_model is not None:
+        # pydantic-core parses the bytes directly, skipping the intermediate dict
+        return response_model.model_validate_json(content)
+    return orjson.loads(content)
+
+
+class RequestPipeline:
+    """Caching, coalescing, circuit breaking and retries for one Frappe host."""
+
+    def __init__(
+        self,
+        config: FrappeClientConfig,
+        client: httpx.AsyncClient,
+        max_retries: int,
+        max_inflight: int,
+        response_cache: ResponseCache | None,
+        circuit_breaker: CircuitBreaker | None,
+        retry_backoff: bool
+    ):
+        """Initialize pipeline state (see AsyncHTTPClient for the arguments)."""
+        self.config = config
+        self.client = client
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.response_cache = response_cache if response_cache is not None else MemoryResponseCache()
+        self._slots = asyncio.Semaphore(max_inflight)
+        self._inflight = SingleFlight()
+        self.breaker = circuit_breaker if circuit_breaker is not None else CircuitBreaker()
+        self._installed_auth: Mapping[str, str] | None = None
+        self._sync_headers()
+
+    def _sync_headers(self) -> None:
+        """Install the config's auth headers as the pool's default headers.
+
+        Requests then carry no per-call headers for httpx to merge. The
+        config rebuilds its (read-only) header mapping only when the session
+        changes, so an identity check is enough to notice login/logout.
+        """
+        auth = self.config.auth_headers
+        if auth is not self._installed_auth:
+            self.client.headers = httpx.Headers({"Accept-Encoding": ACCEPT_ENCODING, **auth})
+            self._installed_auth = auth
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Dict[str, Any] | None = None,
+        params: Dict[str, Any] | None = None,
+        response_model: Type[BaseModel] | None = None
+    ) -> Any:
+        """Make HTTP request, sharing in-flight calls for identical reads.
+
+        Responses from CACHEABLE_ENDPOINTS are served from response_cache
+        while fresh; hits skip Frappe entirely. Bytes ``data`` is sent as-is.
+        The result is shared by coalesced callers - don't mutate it.
+        """
+        if not is_read_like(method, endpoint):
+            return await self._send(method, endpoint, data, params, response_model)
+
+        cache_key = response_cache_key(method, endpoint, data, params)
+        if cache_key is not None:
+            cached = await self.response_cache.get(cache_key)
+            if cached is not None:
+                return _decode(cached, response_model)
+
+        model_name = response_model.__qualname__ if response_model else None
+        return await self._inflight.do(
+            request_key(method, endpoint, data, [params, model_name]),
+            lambda: self._send(method, endpoint, data, params, response_model, cache_key)
+        )
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: Dict[str, Any] | None = None,
+        params: Dict[str, Any] | None = None,
+        response_model: Type[BaseModel] | None = None,
+        cache_key: str | None = None
+    ) -> Any:
+        """Send one request through the endpoint's breaker and the retry loop.
+
+        A successful raw response is stored under ``cache_key`` if given.
+        """
+        self._sync_headers()
+
+        logger.debug("%s %s", method, endpoint)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if isinstance(data, bytes):
+            # Pre-encoded by the caller (post_raw); contents are not logged
+            content = data
+            if debug:
+                logger.debug("Request data: <%d bytes>", len(data))
+        else:
+            if debug and data:
+                # Security: Sanitize sensitive data before logging
+                logger.debug("Request data: %s", sanitize_for_logging(data))
+            # Serialize once with orjson; default headers carry Content-Type: application/json
+            content = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS) if data is not None else None
+
+        async def on_response(response: httpx.Response) -> Any:
+            # Raw (already decompressed) bytes - hits decode without re-fetching
+            if cache_key is not None:
+                await self.response_cache.set(cache_key, response.content, CACHEABLE_ENDPOINTS[endpoint])
+            result = _decode(response.content, response_model)
+            if debug and response_model is None:
+                # Security: Sanitize sensitive data before logging
+                logger.debug("Response: %s", sanitize_for_logging(result))
+            return result
+
+        return await self.breaker.call(endpoint, lambda: send_with_retries(
+            self.client, self._slots, method, endpoint, content, params, on_response,
+            max_retries=self.max_retries,
+            retry_server_errors=is_read_like(method, endpoint),
+            backoff=self.retry_backoff
+        ))
@@ -0,0 +1,65 @@
+"""Connection pool settings and bookkeeping for AsyncHTTPClient."""
+
+import functools
+import logging
+from typing import Dict
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# One long-lived pool per client; idle sockets kept warm for 120s so bursts
+# after short pauses skip the TCP/TLS handshake.
+POOL_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=120.0
+)
+
+# Connecting should be fast even when a Frappe call may legitimately take
+# long; fail dead hosts early instead of after the full request timeout.
+CONNECT_TIMEOUT = 5.0  # seconds
+
+# Open pools per Frappe base URL. More than one means some caller built its
+# own client instead of sharing get_yawlit_client() - each pays its own
+# TCP/TLS handshakes and keeps its own idle sockets.
+_open_pools: Dict[str, int] = {}
+
+
+def pool_limits(pool_size: int | None) -> httpx.Limits:
+    """POOL_LIMITS, or the same settings capped at pool_size connections."""
+    if pool_size is None:
+        return POOL_LIMITS
+    return httpx.Limits(
+        max_connections=pool_size,
+        max_keepalive_connections=min(pool_size, POOL_LIMITS.max_keepalive_connections),
+        keepalive_expiry=POOL_LIMITS.keepalive_expiry
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def pool_timeout(seconds: float) -> httpx.Timeout:
+    """Shared Timeout for a request timeout, with connect capped at CONNECT_TIMEOUT."""
+    return httpx.Timeout(seconds, connect=min(seconds, CONNECT_TIMEOUT))
+
+
+@functools.lru_cache(maxsize=8)
+def stream_timeout(seconds: float) -> httpx.Timeout:
+    """Shared Timeout for event streams: no read timeout, connect capped."""
+    return httpx.Timeout(seconds, connect=min(seconds, CONNECT_TIMEOUT), read=None)
+
+
+def register_pool(base_url: str) -> None:
+    """Count a newly opened pool, warning if the host already has one."""
+    if _open_pools.get(base_url):
+        logger.warning(
+            "Another AsyncHTTPClient is already open for %s - share one client "
+            "(get_yawlit_client()) instead of creating a connection pool per caller",
+            base_url
+        )
+    _open_pools[base_url] = _open_pools.get(base_url, 0) + 1
+
+
+def release_pool(base_url: str) -> None:
+    """Forget a closed pool."""
+    _open_pools[base_url] -= 1
@@ -0,0 +1,120 @@
+"""Retry loop for Frappe HTTP requests.
+
+Timeouts and network errors are retried with full-jitter exponential
+backoff. 5xx responses are retried only for read-like requests - retrying
+a failed write could apply it twice. 4xx responses are never retried.
+"""
+
+import asyncio
+import logging
+import random
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+import httpx
+
+from clients.frappe_yawlit.utils.http_errors import raise_for_response
+from clients.frappe_yawlit.utils.exceptions import NetworkError, ServerError, TimeoutError, FrappeAPIError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Full-jitter exponential backoff between retries: sleep U(0, min(cap, base*2^n))
+RETRY_BACKOFF_BASE = 0.1  # seconds
+RETRY_BACKOFF_CAP = 1.0  # seconds
+
+
+def backoff_delay(attempt: int) -> float:
+    """Return a full-jitter delay for the given (1-based) retry attempt."""
+    return random.uniform(0, min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2 ** attempt))
+
+
+async def send_with_retries(
+    client: httpx.AsyncClient,
+    slots: asyncio.Semaphore,
+    method: str,
+    endpoint: str,
+    content: bytes | None,
+    params: Dict[str, Any] | None,
+    on_response: Callable[[httpx.Response], Awaitable[T]],
+    *,
+    max_retries: int,
+    retry_server_errors: bool,
+    backoff: bool = True
+) -> T:
+    """Send a request, retrying transient failures.
+
+    Args:
+        client: Connection pool to send through
+        slots: Semaphore capping concurrent requests (held only while sending)
+        method: HTTP method (GET, POST, PUT, DELETE)
+        endpoint: API endpoint path
+        content: Encoded request body
+        params: Query parameters
+        on_response: Coroutine function turning a successful response into
+            the result (errors it raises are mapped like request errors)
+        max_retries: Maximum attempts
+        retry_server_errors: Retry 5xx responses (read-like requests only)
+        backoff: Sleep with jittered backoff between attempts
+
+    Returns:
+        Result of on_response
+
+    Raises:
+        NetworkError: Network/connection error
+        TimeoutError: Request timeout
+        FrappeAPIError: API error response
+    """
+    retries = 0
+    last_exception = None
+
+    while retries < max_retries:
+        try:
+            async with slots:
+                response = await client.request(
+                    method=method,
+                    url=endpoint,
+                    content=content,
+                    params=params
+                )
+
+            # Check for HTTP errors
+            if response.status_code >= 400:
+                raise_for_response(response)
+            return await on_response(response)
+
+        except httpx.TimeoutException as e:
+            retries += 1
+            last_exception = e
+            logger.warning("Request timeout (attempt %s/%s): %s", retries, max_retries, endpoint)
+            if retries >= max_retries:
+                raise TimeoutError(f"Request timed out after {max_retries} attempts") from e
+
+        except httpx.NetworkError as e:
+            retries += 1
+            last_exception = e
+            logger.warning("Network error (attempt %s/%s): %s", retries, max_retries, endpoint)
+            if retries >= max_retries:
+                raise NetworkError(f"Network error after {max_retries} attempts: {str(e)}") from e
+
+        except ServerError as e:
+            # Transient 5xx (e.g. 502 during a bench restart) - reads only
+            retries += 1
+            last_exception = e
+            if not retry_server_errors or retries >= max_retries:
+                raise
+            logger.warning("Server error %s (attempt %s/%s): %s", e.status_code, retries, max_retries, endpoint)
+
+        except FrappeAPIError:
+            # Don't retry client errors (4xx)
+            raise
+
+        except Exception as e:
+            logger.error("Unexpected error in HTTP request: %s", e)
+            raise FrappeAPIError(f"Unexpected error: {str(e)}") from e
+
+        if backoff:
+            await asyncio.sleep(backoff_delay(retries))
+
+    # Should never reach here
+    raise NetworkError(f"Request failed after {max_retries} retries") from last_exception
@@ -0,0 +1,39 @@
+"""Background pings that keep an idle Frappe connection pool warm.
+
+Quiet periods (admin idle, night traffic) outlast any keep-alive window;
+a cheap authenticated ping every KEEPALIVE_INTERVAL keeps the HTTP/2
+connection open so the first real call after idle skips the handshake.
+"""
+
+import asyncio
+import logging
+from typing import Callable, Final
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+KEEPALIVE_INTERVAL = 60.0  # seconds - must stay below the pool's keepalive_expiry
+_EP_PING: Final = "/api/method/frappe.auth.get_logged_user"
+
+
+async def keepalive_loop(
+    client: httpx.AsyncClient,
+    interval: float,
+    before_ping: Callable[[], None]
+) -> None:
+    """Ping a cheap endpoint forever, bypassing retries and the inflight cap.
+
+    Args:
+        client: Pool to keep warm
+        interval: Seconds between pings
+        before_ping: Called before each ping (e.g. to refresh auth headers)
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            before_ping()
+            await client.get(_EP_PING)
+        except httpx.HTTPError as e:
+            # Next real request reconnects anyway - nothing to recover
+            logger.debug("Keep-alive ping failed: %s", e)
@@ -0,0 +1,25 @@
+"""Which Frappe responses AsyncHTTPClient may cache, and under what key.
+
+The cache backends themselves (MemoryResponseCache, RedisResponseCache)
+live in utils/cache_backends.py.
+"""
+
+import hashlib
+from typing import Any, Dict
+
+from clients.frappe_yawlit.utils.coalescing import request_key
+
+# Semi-static endpoints whose raw responses may be cached, with TTL seconds.
+# frappe.client.get_list is deliberately absent: it is generic, and the one
+# reference-data caller (get_categories) is already ttl_cache'd.
+CACHEABLE_ENDPOINTS: Dict[str, float] = {
+    "/api/method/yawlit_automotive_services.customer_management.doctype.vehicle_type.vehicle_type.get_active_vehicle_types_list": 3600,
+    "/api/method/yawlit_automotive_services.api.customer_portal.get_filtered_services": 60,
+}
+
+
+def response_cache_key(method: str, endpoint: str, data: Any, params: Any) -> str | None:
+    """Return the response-cache key for a request, or None if not cacheable."""
+    if endpoint not in CACHEABLE_ENDPOINTS:
+        return None
+    return hashlib.sha1(request_key(method, endpoint, data, params)).hexdigest()
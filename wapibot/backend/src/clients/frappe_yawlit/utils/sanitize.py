@@ -0,0 +1,55 @@
+"""Redaction of sensitive fields before request/response data is logged."""
+
+import dataclasses
+import re
+from typing import Any, Set
+
+# Sensitive fields that should never be logged
+SENSITIVE_FIELDS: Set[str] = {
+    "password", "api_key", "api_secret", "token", "secret",
+    "authorization", "cookie", "session", "sid", "otp",
+    "credit_card", "cvv", "ssn", "phone_number", "email"
+}
+# One scan per key instead of one substring test per sensitive field
+_SENSITIVE_RE = re.compile("|".join(map(re.escape, SENSITIVE_FIELDS)), re.IGNORECASE)
+
+# JSON scalars - returned unchanged by sanitize_for_logging, so skipped inline
+_LEAF_TYPES = (str, int, float, bool, type(None))
+
+
+def sanitize_for_logging(data: Any, depth: int = 0) -> Any:
+    """Recursively sanitize sensitive data for logging.
+
+    Args:
+        data: Data to sanitize (dict, list, or primitive)
+        depth: Recursion depth (prevents infinite loops)
+
+    Returns:
+        Sanitized data safe for logging
+    """
+    if depth > 5:  # Prevent deep recursion
+        return "[MAX_DEPTH]"
+
+    if dataclasses.is_dataclass(data) and not isinstance(data, type):
+        # Typed payloads (clients.frappe_yawlit.payloads) - sanitize as a dict
+        return sanitize_for_logging(dataclasses.asdict(data), depth)
+
+    if isinstance(data, dict):
+        sanitized = {}
+        for key, value in data.items():
+            # Check if key contains any sensitive field name
+            if _SENSITIVE_RE.search(str(key)):
+                sanitized[key] = "[REDACTED]"
+            elif isinstance(value, _LEAF_TYPES):
+                # Leaf values need no recursive call
+                sanitized[key] = value
+            else:
+                sanitized[key] = sanitize_for_logging(value, depth + 1)
+        return sanitized
+    elif isinstance(data, list):
+        return [
+            item if isinstance(item, _LEAF_TYPES) else sanitize_for_logging(item, depth + 1)
+            for item in data
+        ]
+    else:
+        return data
@@ -0,0 +1,47 @@
+"""Request coalescing for idempotent Frappe reads.
+
+N concurrent identical requests share one in-flight call instead of
+hitting Frappe N times (Go's singleflight pattern).
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Shares one in-flight awaitable per key among concurrent callers.
+
+    Note:
+        Every caller receives the same result object - treat it as read-only.
+    """
+
+    def __init__(self):
+        """Initialize with no in-flight calls."""
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fn() unless an identical call is already in flight, then await it.
+
+        The shared call is shielded, so one caller being cancelled does not
+        cancel the request for everyone else.
+
+        Args:
+            key: Identity of the request
+            fn: Coroutine function performing the request
+
+        Returns:
+            Result of the (possibly shared) call
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+            future.add_done_callback(lambda f: self._forget(key, f))
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        """Remove a finished call and mark its exception as retrieved."""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            future.exception()
@@ -6,6 +6,7 @@ Provides async methods to send text and media messages via WAPI.in.net
 import logging
 from typing import Optional, Dict, Any, Union
 import httpx
+import orjson
 
 from core.config import settings
 from clients.wapi.schemas import (
@@ -138,10 +139,11 @@ class WAPIClient:
         logger.info(f"Sending message to {phone_number}: {message_body[:50]}...")
 
         try:
-            response = await self.client.post(endpoint, json=payload)
+            # Client headers already carry Content-Type: application/json
+            response = await self.client.post(endpoint, content=orjson.dumps(payload))
             response.raise_for_status()
 
-            result = response.json() if response.text else {}
+            result = orjson.loads(response.content) if response.content else {}
             logger.info(f"Message sent successfully to {phone_number}")
             return result
 
@@ -210,10 +212,11 @@ class WAPIClient:
         logger.info(f"Sending {media_type} to {phone_number}: {media_url}")
 
         try:
-            response = await self.client.post(endpoint, json=payload)
+            # Client headers already carry Content-Type: application/json
+            response = await self.client.post(endpoint, content=orjson.dumps(payload))
             response.raise_for_status()
 
-            result = response.json() if response.text else {}
+            result = orjson.loads(response.content) if response.content else {}
             logger.info(f"Media sent successfully to {phone_number}")
             return result
 
@@ -245,7 +248,7 @@ class WAPIClient:
             response = await self.client.get(endpoint, params=params)
             response.raise_for_status()
 
-            result = response.json() if response.text else None
+            result = orjson.loads(response.content) if response.content else None
             return result
 
         except httpx.HTTPStatusError as e:
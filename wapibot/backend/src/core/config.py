@@ -4,6 +4,7 @@ Supports Ollama, OpenRouter, and OpenAI providers.
 Switch provider by changing PRIMARY_LLM_PROVIDER in .env.txt
 """
 
+import functools
 from pathlib import Path
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import field_validator
@@ -35,6 +36,10 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
     reload: bool = True
+    # Pin the event-loop thread to one CPU (Linux only); None leaves scheduling to the OS.
+    # Default-executor workers are unpinned, but other threads the loop thread
+    # starts itself (e.g. aiosqlite connections) inherit the pin and share that core.
+    event_loop_cpu: int | None = None
 
     # Database
     database_url: str = "sqlite+aiosqlite:///./conversations.db"
@@ -185,11 +190,17 @@ class Settings(BaseSettings):
             )
         return v
 
-    @property
-    def cors_origins_list(self) -> list[str]:
-        """Parse CORS origins string into list."""
-        return [origin.strip() for origin in self.cors_origins.split(",")]
+    @functools.cached_property
+    def cors_origins_list(self) -> tuple[str, ...]:
+        """Parse CORS origins string into an immutable tuple (once per instance)."""
+        return tuple(origin.strip() for origin in self.cors_origins.split(","))
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide Settings, parsing .env.txt only on first call."""
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -0,0 +1,121 @@
+"""Cached test suite runner for the /health endpoint.
+
+Runs pytest in a child process (see core.pytest_process). Reports are
+memoized so repeated health probes within the TTL window don't re-run
+the suite. Each run is fanned out across cores with pytest-xdist, and
+tests marked ``@pytest.mark.slow`` are excluded from the probe.
+
+Collection is not reused between runs: an in-process pytest Session
+cannot be re-run safely (modules stay imported, fixtures and plugins
+keep state), and passing pre-collected node IDs to the child still
+makes it import and collect every module, so the cache is the saving.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from core.pytest_process import RunOutput, run_pytest
+
+logger = logging.getLogger(__name__)
+
+# Path: backend/src/core/health_suite.py -> backend/src
+SRC_DIR = Path(__file__).parent.parent
+TESTS_DIR = SRC_DIR / "tests"
+HEALTH_TTL = 600  # seconds - reuse the last report for 10 minutes
+HEALTH_TIMEOUT = 60  # seconds
+SLOW_TEST_THRESHOLD = 5.0  # seconds - candidates for @pytest.mark.slow
+SLOWEST_REPORTED = 5
+
+# --rootdir pins node IDs relative to src/ (the subprocess cwd)
+_SELECT_ARGS = ["-m", "not slow", "-p", "no:cacheprovider", f"--rootdir={SRC_DIR}"]
+
+
+class HealthSuiteRunner:
+    """Runs the test suite on demand and caches the result for a TTL."""
+
+    def __init__(self, ttl: float = HEALTH_TTL):
+        """Initialize runner with an empty cache.
+
+        Args:
+            ttl: Seconds a report stays valid before the suite is re-run
+        """
+        self.ttl = ttl
+        self._cache: Dict[str, Any] = {"ts": 0.0, "result": None}
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _run_args(self) -> list[str]:
+        """Build pytest args - the tests directory fanned out per file.
+
+        ``--dist=loadfile`` keeps each module on one worker so module-scoped
+        fixtures are not rebuilt per worker.
+        """
+        workers = str(os.cpu_count() or 2)
+        return [
+            str(TESTS_DIR), "-q", "--no-header", *_SELECT_ARGS,
+            "-n", workers, "--dist=loadfile",
+            f"--durations={SLOWEST_REPORTED}", "--durations-min=0"
+        ]
+
+    def _cached(self) -> Optional[Dict[str, Any]]:
+        """Return the cached report if it is still fresh."""
+        if self._cache["result"] and time.monotonic() - self._cache["ts"] < self.ttl:
+            return {**self._cache["result"], "cached": True}
+        return None
+
+    async def run(self) -> Dict[str, Any]:
+        """Return a fresh or cached test report.
+
+        Concurrent probes share a single run - only the first caller executes
+        the suite, the rest wait on the lock and read the cache.
+
+        Returns:
+            Report with exit_code, summary, slowest_tests, timestamp,
+            duration and cached flag
+
+        Raises:
+            asyncio.TimeoutError: Suite did not finish within HEALTH_TIMEOUT
+        """
+        cached = self._cached()
+        if cached:
+            return cached
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            cached = self._cached()
+            if cached:
+                return cached
+
+            start = time.monotonic()
+            output = RunOutput(SLOWEST_REPORTED)
+            exit_code = await run_pytest(
+                *self._run_args(), cwd=SRC_DIR, timeout=HEALTH_TIMEOUT, on_line=output.feed
+            )
+            summary = output.summary_text()
+
+            result = {
+                "exit_code": exit_code,
+                "summary": summary,
+                "slowest_tests": output.slowest,
+                "timestamp": datetime.now().isoformat(),
+                "duration": round(time.monotonic() - start, 3),
+            }
+            self._cache = {"ts": time.monotonic(), "result": result}
+            logger.info("Health suite finished: %s (exit %s)", summary or "no tests", exit_code)
+            for entry in result["slowest_tests"]:
+                if entry["duration"] >= SLOW_TEST_THRESHOLD:
+                    logger.warning(
+                        "🐢 Slow health test (%ss), consider @pytest.mark.slow: %s",
+                        entry["duration"], entry["test"]
+                    )
+            return {**result, "cached": False}
+
+
+# Global health suite runner instance
+health_suite = HealthSuiteRunner()
@@ -0,0 +1,81 @@
+"""Child-process pytest execution and output parsing for the health suite.
+
+pytest runs via asyncio subprocesses so the event loop never blocks and a
+timed-out run can actually be killed. Output is streamed line-by-line as
+raw bytes and reduced to the few lines the health report needs.
+"""
+
+import asyncio
+import re
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+# Final stats line, with or without pytest's '=' borders (-q drops them):
+#   b"==== 1 failed, 2 passed in 0.12s ====" / b"3 passed in 0.05s"
+_SUMMARY_RE = re.compile(rb"^=*\s*(\d+ .*\b(?:passed|failed|errors?)\b.*?)\s*=*\s*$")
+
+
+async def run_pytest(*args: str, cwd: Path, timeout: float, on_line: Callable[[bytes], None]) -> int:
+    """Run pytest in a child process, feeding each output line to on_line.
+
+    Output is consumed line-by-line as raw bytes, so memory stays O(1)
+    regardless of how much pytest prints.
+
+    Returns:
+        pytest exit code
+
+    Raises:
+        asyncio.TimeoutError: Child did not finish in time (it is killed)
+    """
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "pytest", *args,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT
+    )
+
+    async def drain() -> int:
+        async for line in proc.stdout:
+            on_line(line)
+        return await proc.wait()
+
+    try:
+        return await asyncio.wait_for(drain(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+
+
+class RunOutput:
+    """Keeps only the summary line and '--durations' rows of a run."""
+
+    def __init__(self, max_slowest: int):
+        """Initialize with no summary.
+
+        Args:
+            max_slowest: Number of '--durations' rows to keep
+        """
+        self.max_slowest = max_slowest
+        self.summary = b""
+        self.slowest: list[Dict[str, Any]] = []
+
+    def feed(self, line: bytes) -> None:
+        """Consume one output line."""
+        match = _SUMMARY_RE.match(line)
+        if match:
+            self.summary = match.group(1)
+        parts = line.split()
+        # '--durations' row: b"5.02s call     tests/x.py::test_y"
+        if len(parts) == 3 and parts[1] == b"call" and parts[0].endswith(b"s"):
+            try:
+                duration = float(parts[0][:-1])
+            except ValueError:
+                return
+            if len(self.slowest) < self.max_slowest:
+                self.slowest.append({"test": parts[2].decode(), "duration": duration})
+
+    def summary_text(self) -> str:
+        """Decode the summary line (borders already stripped by the regex)."""
+        return self.summary.decode(errors="replace")
@@ -6,6 +6,8 @@ Single terminal mode: auto-starts Redis, ngrok, Celery, and FastAPI.
 
 import asyncio
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
@@ -17,6 +19,7 @@ from db.connection import db_connection
 from db.websocket_db import websocket_db_connection
 from core.redis_subscriber import redis_subscriber
 from core.health_monitor import health_monitor
+from clients.frappe_yawlit import get_yawlit_client, close_yawlit_client
 from api.router_registry import register_all_routes
 
 # Multi-process and middleware management
@@ -40,7 +43,8 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """Application lifespan with multi-process management.
 
-    Starts: Redis, ngrok, Celery, Database, DSPy, Checkpointers, Warmup.
+    Starts: Redis, ngrok, Celery, Database, DSPy, Checkpointers, Frappe client,
+    Warmup, and /health test collection.
     Ensures cleanup even if server crashes.
     """
     logger.info("🚀 Starting WapiBot (Single Terminal Mode)")
@@ -62,6 +66,19 @@ async def lifespan(app: FastAPI):
         worker_process = start_celery_worker()
         shutdown_manager.register_celery(worker_process)
 
+        # Pin after spawning Celery/ngrok so they don't inherit the mask; keeps
+        # the loop's socket/TLS state warm in one core's cache. On Linux only
+        # the calling thread is pinned, but new threads inherit its mask, so
+        # the default executor (asyncio.to_thread, run_in_executor) resets
+        # each worker to the full CPU set before it runs anything.
+        if settings.event_loop_cpu is not None and hasattr(os, "sched_setaffinity"):
+            all_cpus = os.sched_getaffinity(0)
+            asyncio.get_running_loop().set_default_executor(
+                ThreadPoolExecutor(initializer=os.sched_setaffinity, initargs=(0, all_cpus))
+            )
+            os.sched_setaffinity(0, {settings.event_loop_cpu})
+            logger.info(f"📌 Event loop pinned to CPU {settings.event_loop_cpu}")
+
         # Configure and register shutdown handlers
         # In reload mode, don't call sys.exit() to allow uvicorn hot reload
         shutdown_manager.should_exit = not settings.reload
@@ -85,6 +102,11 @@ async def lifespan(app: FastAPI):
         await checkpointer_manager.initialize()
         logger.info("✅ Checkpointers initialized")
 
+        # One shared Frappe client (and connection pool) for the whole app
+        app.state.yawlit = get_yawlit_client()
+        app.state.yawlit.http_client.start_keepalive()
+        logger.info("✅ Frappe client initialized")
+
         # Step 5: Background tasks
         logger.info("📋 5/5: Starting Background Services...")
         asyncio.create_task(warmup_service.startup_warmup())
@@ -139,6 +161,12 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.warning(f"⚠️  Failed to shutdown checkpointer: {e}")
 
+        try:
+            await close_yawlit_client()
+            logger.info("✅ Frappe client closed")
+        except Exception as e:
+            logger.warning(f"⚠️  Failed to close Frappe client: {e}")
+
         # Force cleanup via shutdown manager (in case signal handler didn't run)
         try:
             shutdown_manager.shutdown()
@@ -161,6 +189,10 @@ register_all_routes(app)
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
 
-    uvicorn.run("main:app", host=settings.host, port=settings.port, reload=settings.reload, log_level=settings.log_level.lower())
+    uvicorn.run(
+        "main:app", host=settings.host, port=settings.port, reload=settings.reload,
+        log_level=settings.log_level.lower(), loop="asyncio" if sys.platform == "win32" else "uvloop"
+    )
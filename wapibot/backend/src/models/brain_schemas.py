@@ -111,6 +111,11 @@ class BrainStatusResponse(BaseModel):
             }
         ],
     )
+    tasks: dict = Field(
+        default_factory=dict,
+        description="Recent dream/training tasks by task_id (queued, sent or failed)",
+        examples=[{"3f2a9c": {"status": "failed", "error": "broker unreachable"}}],
+    )
 
     class Config:
         json_schema_extra = {
@@ -0,0 +1,20 @@
+"""Frappe (Yawlit backend) webhook schemas with examples."""
+
+from pydantic import BaseModel, Field
+from typing import Optional
+
+
+class SubscriptionEventPayload(BaseModel):
+    """Subscription lifecycle change pushed by Frappe."""
+
+    subscription_id: str = Field(..., examples=["SUB-2025-001"])
+    event: str = Field(..., examples=["paused"], description="paused, resumed, cancelled, renewed, ...")
+    status: str = Field(..., examples=["Paused"], description="Subscription status after the change")
+    occurred_at: Optional[str] = Field(None, examples=["2025-01-15T10:30:00"])
+
+
+class SubscriptionEventResponse(BaseModel):
+    """Acknowledgement for a subscription event."""
+
+    status: str = Field(..., examples=["ok"])
+    delivered: int = Field(..., examples=[1], description="In-process watchers notified")
@@ -1,7 +1,9 @@
 """Brain control service layer."""
 
+import asyncio
 import logging
-from typing import Dict, Any, List
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Any, List
 from core.brain_config import get_brain_settings
 from core.brain_toggles import (
     can_customize_template,
@@ -20,6 +22,9 @@ from tasks.gepa_optimization_task import run_gepa_optimization
 
 logger = logging.getLogger(__name__)
 
+# Dream/training tasks remembered for /brain/status (oldest dropped first)
+TASK_HISTORY = 100
+
 
 class BrainService:
     """Service layer for Brain Control API."""
@@ -28,17 +33,65 @@ class BrainService:
         """Initialize brain service."""
         self.settings = get_brain_settings()
         self.decision_repo = BrainDecisionRepository()
+        self.tasks: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def track(self, task_id: str) -> None:
+        """Record a task as queued so /brain/status can report it at once."""
+        self.tasks[task_id] = {"status": "queued"}
+        while len(self.tasks) > TASK_HISTORY:
+            self.tasks.popitem(last=False)
+
+    async def run_task(
+        self,
+        task_id: str,
+        trigger: Callable[..., Awaitable[Dict[str, Any]]],
+        *args: Any
+    ) -> None:
+        """Run a trigger after the response is sent, recording its outcome.
 
-    async def trigger_dream(self, force: bool = False, min_conversations: int | None = None) -> Dict[str, Any]:
-        """Trigger dream cycle."""
+        Broker errors happen after the client got its task_id, so they are
+        logged and stored under that ID instead of being raised.
+        """
+        try:
+            result = await trigger(*args, task_id=task_id)
+        except Exception as e:
+            logger.error("Brain task %s failed to enqueue: %s", task_id, e)
+            outcome = {"status": "failed", "error": str(e)}
+        else:
+            outcome = {"status": "sent", "result": result}
+        if task_id in self.tasks:
+            self.tasks[task_id] = outcome
+
+    async def trigger_dream(
+        self,
+        force: bool = False,
+        min_conversations: int | None = None,
+        task_id: str | None = None
+    ) -> Dict[str, Any]:
+        """Trigger dream cycle.
+
+        Publishing to the broker is blocking I/O, so it runs in a thread.
+        Pass task_id to pre-assign the Celery task ID returned to the caller.
+        """
         logger.info("🌙 Triggering dream cycle...")
-        result = run_dream_cycle.delay()
+        result = await asyncio.to_thread(run_dream_cycle.apply_async, task_id=task_id)
         return {"task_id": result.id, "status": "queued"}
 
-    async def trigger_training(self, optimizer: str = "gepa", num_iterations: int = 100) -> Dict[str, Any]:
-        """Trigger GEPA optimization."""
+    async def trigger_training(
+        self,
+        optimizer: str = "gepa",
+        num_iterations: int = 100,
+        task_id: str | None = None
+    ) -> Dict[str, Any]:
+        """Trigger GEPA optimization.
+
+        Publishing to the broker is blocking I/O, so it runs in a thread.
+        Pass task_id to pre-assign the Celery task ID returned to the caller.
+        """
         logger.info(f"🧠 Triggering {optimizer} optimization...")
-        result = run_gepa_optimization.delay(num_iterations)
+        result = await asyncio.to_thread(
+            run_gepa_optimization.apply_async, args=(num_iterations,), task_id=task_id
+        )
         return {"task_id": result.id, "status": "queued"}
 
     async def get_brain_status(self) -> Dict[str, Any]:
@@ -50,7 +103,8 @@ class BrainService:
             "metrics": {
                 "dream_enabled": self.settings.dream_enabled,
                 "rl_gym_enabled": self.settings.rl_gym_enabled
-            }
+            },
+            "tasks": dict(self.tasks)
         }
 
     def get_feature_toggles(self) -> Dict[str, bool]:
@@ -15,6 +15,13 @@ from sqlmodel import SQLModel
 from db.db_models import ConversationStateTable, ConversationHistoryTable
 
 
+def pytest_configure(config):
+    """Register custom markers."""
+    config.addinivalue_line(
+        "markers", "slow: long-running test, excluded from the /health probe"
+    )
+
+
 @pytest.fixture(scope="session")
 def event_loop():
     """Create event loop for async tests."""
@@ -0,0 +1,126 @@
+"""Unit tests for BookingManageClient.batch and its client-side fallback."""
+
+import asyncio
+
+import pytest
+
+from clients.frappe_yawlit.booking import manage_client
+from clients.frappe_yawlit.booking.manage_client import BatchCall, BookingManageClient
+from clients.frappe_yawlit.utils.exceptions import NotFoundError, ServerError
+
+DETAILS = manage_client._EP_GET_BOOKING_DETAILS
+ELIGIBILITY = manage_client._EP_CHECK_CANCELLATION_ELIGIBILITY
+BOOKINGS = manage_client._EP_GET_CUSTOMER_BOOKINGS
+
+
+class FakeHTTP:
+    """Records posts and answers from a per-endpoint table."""
+
+    def __init__(self, responses, batch_error=None):
+        self.responses = responses
+        self.batch_error = batch_error
+        self.posts = []
+
+    async def post(self, endpoint, payload):
+        self.posts.append((endpoint, payload))
+        if endpoint == manage_client._EP_BATCH:
+            if self.batch_error is not None:
+                raise self.batch_error
+            return {"message": {"details": {"message": "server"}}}
+        await asyncio.sleep(0)
+        return self.responses[endpoint]
+
+
+def chain():
+    """details -> eligibility, with eligibility fed from details."""
+    return [
+        BatchCall("details", DETAILS, {"booking_id": "BKG-1"}),
+        BatchCall("eligibility", ELIGIBILITY, {"reason": "travel"}, input_from=0),
+    ]
+
+
+class TestBookingBatch:
+    """Test BookingManageClient.batch."""
+
+    @pytest.mark.asyncio
+    async def test_server_batch_returns_message(self):
+        """With a batch endpoint the whole chain is one POST."""
+        http = FakeHTTP({})
+        client = BookingManageClient(http)
+
+        result = await client.batch(chain())
+
+        assert result == {"details": {"message": "server"}}
+        assert [endpoint for endpoint, _ in http.posts] == [manage_client._EP_BATCH]
+
+    @pytest.mark.asyncio
+    async def test_404_falls_back_to_client_side(self):
+        """A missing batch endpoint runs each call itself, forwarding results."""
+        http = FakeHTTP(
+            {
+                DETAILS: {"message": {"booking_id": "BKG-1", "status": "Confirmed"}},
+                ELIGIBILITY: {"message": {"can_cancel": True}},
+            },
+            batch_error=NotFoundError("no batch", status_code=404),
+        )
+        client = BookingManageClient(http)
+
+        result = await client.batch(chain())
+
+        assert result == {
+            "details": {"message": {"booking_id": "BKG-1", "status": "Confirmed"}},
+            "eligibility": {"message": {"can_cancel": True}},
+        }
+        assert http.posts[-1] == (
+            ELIGIBILITY,
+            {"booking_id": "BKG-1", "status": "Confirmed", "reason": "travel"},
+        )
+
+    @pytest.mark.asyncio
+    async def test_own_payload_wins_over_forwarded(self):
+        """Keys set on the dependent call override forwarded ones."""
+        http = FakeHTTP(
+            {DETAILS: {"message": {"booking_id": "BKG-1"}}, ELIGIBILITY: {"message": {}}},
+            batch_error=NotFoundError("no batch", status_code=404),
+        )
+        calls = chain()
+        calls[1].payload = {"booking_id": "BKG-2"}
+
+        await BookingManageClient(http).batch(calls)
+
+        assert http.posts[-1] == (ELIGIBILITY, {"booking_id": "BKG-2"})
+
+    @pytest.mark.asyncio
+    async def test_non_dict_result_is_not_forwarded(self):
+        """List results are not merged into the dependent payload."""
+        http = FakeHTTP(
+            {BOOKINGS: {"message": [{"name": "BKG-1"}]}, DETAILS: {"message": {}}},
+            batch_error=NotFoundError("no batch", status_code=404),
+        )
+        calls = [
+            BatchCall("bookings", BOOKINGS),
+            BatchCall("details", DETAILS, {"booking_id": "BKG-1"}, input_from=0),
+        ]
+
+        await BookingManageClient(http).batch(calls)
+
+        assert http.posts[-1] == (DETAILS, {"booking_id": "BKG-1"})
+
+    @pytest.mark.asyncio
+    async def test_forward_reference_rejected(self):
+        """input_from may only point at an earlier call."""
+        http = FakeHTTP({})
+        calls = [BatchCall("details", DETAILS, input_from=0)]
+
+        with pytest.raises(ValueError):
+            await BookingManageClient(http).batch(calls)
+        assert http.posts == []
+
+    @pytest.mark.asyncio
+    async def test_other_errors_are_not_swallowed(self):
+        """Only a 404 triggers the fallback; server errors propagate."""
+        http = FakeHTTP({}, batch_error=ServerError("down", status_code=500))
+
+        with pytest.raises(ServerError):
+            await BookingManageClient(http).batch(chain())
+        assert len(http.posts) == 1
@@ -0,0 +1,57 @@
+"""Unit tests for background dream/training task tracking in BrainService."""
+
+import pytest
+
+from services import brain_service
+from services.brain_service import BrainService
+
+
+class TestBrainTasks:
+    """Test BrainService.track/run_task."""
+
+    @pytest.mark.asyncio
+    async def test_successful_enqueue_is_recorded(self):
+        """A task handed to Celery is reported as sent with its result."""
+        service = BrainService()
+
+        async def trigger(force, task_id):
+            return {"task_id": task_id, "status": "queued"}
+
+        service.track("t1")
+        assert service.tasks["t1"] == {"status": "queued"}
+
+        await service.run_task("t1", trigger, True)
+
+        assert service.tasks["t1"] == {"status": "sent", "result": {"task_id": "t1", "status": "queued"}}
+
+    @pytest.mark.asyncio
+    async def test_broker_failure_is_recorded_not_raised(self):
+        """An enqueue error is stored under the task_id for /brain/status."""
+        service = BrainService()
+
+        async def trigger(task_id):
+            raise ConnectionError("broker unreachable")
+
+        service.track("t1")
+        await service.run_task("t1", trigger)
+
+        assert service.tasks["t1"] == {"status": "failed", "error": "broker unreachable"}
+
+    @pytest.mark.asyncio
+    async def test_status_reports_tasks(self):
+        """get_brain_status includes the tracked tasks."""
+        service = BrainService()
+        service.track("t1")
+
+        status = await service.get_brain_status()
+
+        assert status["tasks"] == {"t1": {"status": "queued"}}
+
+    def test_history_is_bounded(self, monkeypatch):
+        """Only the most recent TASK_HISTORY tasks are kept."""
+        monkeypatch.setattr(brain_service, "TASK_HISTORY", 2)
+        service = BrainService()
+        for task_id in ("t1", "t2", "t3"):
+            service.track(task_id)
+
+        assert list(service.tasks) == ["t2", "t3"]
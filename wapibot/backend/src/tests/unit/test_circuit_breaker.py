@@ -0,0 +1,125 @@
+"""Unit tests for the per-endpoint Frappe circuit breaker."""
+
+from unittest.mock import patch
+
+import pytest
+
+from clients.frappe_yawlit.utils.circuit_breaker import CircuitBreaker
+from clients.frappe_yawlit.utils.exceptions import ServiceUnavailableError
+
+EP = "/api/method/app.api.get_x"
+
+
+class FakeClock:
+    """Controllable replacement for time.monotonic."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Patch the breaker's clock."""
+    fake = FakeClock()
+    with patch("clients.frappe_yawlit.utils.circuit_breaker.time.monotonic", fake):
+        yield fake
+
+
+def trip(breaker: CircuitBreaker, endpoint: str = EP) -> None:
+    """Record enough failures to open the breaker."""
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure(endpoint)
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker state transitions."""
+
+    def test_closed_admits_calls(self, clock):
+        """A fresh or below-threshold endpoint admits calls."""
+        breaker = CircuitBreaker(failure_threshold=3)
+        breaker.before_call(EP)
+        breaker.record_failure(EP)
+        breaker.record_failure(EP)
+
+        breaker.before_call(EP)
+
+    def test_opens_at_threshold(self, clock):
+        """Threshold failures within the window open the breaker."""
+        breaker = CircuitBreaker(failure_threshold=3, window=10, cooldown=30)
+        trip(breaker)
+
+        with pytest.raises(ServiceUnavailableError):
+            breaker.before_call(EP)
+
+    def test_failures_outside_window_expire(self, clock):
+        """Failures older than the window are not counted."""
+        breaker = CircuitBreaker(failure_threshold=3, window=10, cooldown=30)
+        breaker.record_failure(EP)
+        breaker.record_failure(EP)
+        clock.now += 11
+        breaker.record_failure(EP)
+
+        breaker.before_call(EP)
+
+    def test_endpoints_are_independent(self, clock):
+        """One endpoint's failures don't affect another."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        trip(breaker)
+
+        breaker.before_call("/api/method/app.api.other")
+
+    def test_half_open_admits_single_probe(self, clock):
+        """After the cooldown exactly one probe is let through."""
+        breaker = CircuitBreaker(failure_threshold=2, cooldown=30)
+        trip(breaker)
+        clock.now += 30
+
+        breaker.before_call(EP)
+        with pytest.raises(ServiceUnavailableError):
+            breaker.before_call(EP)
+
+    def test_successful_probe_closes(self, clock):
+        """A probe that succeeds closes the breaker and clears failures."""
+        breaker = CircuitBreaker(failure_threshold=2, cooldown=30)
+        trip(breaker)
+        clock.now += 30
+        breaker.before_call(EP)
+        breaker.record_success(EP)
+
+        breaker.before_call(EP)
+        breaker.record_failure(EP)
+        breaker.before_call(EP)
+
+    def test_failed_probe_reopens_for_full_cooldown(self, clock):
+        """A failed probe re-opens the breaker from now."""
+        breaker = CircuitBreaker(failure_threshold=2, cooldown=30)
+        trip(breaker)
+        clock.now += 30
+        breaker.before_call(EP)
+        breaker.record_failure(EP)
+
+        clock.now += 29
+        with pytest.raises(ServiceUnavailableError):
+            breaker.before_call(EP)
+        clock.now += 1
+        breaker.before_call(EP)
+
+    def test_release_frees_probe_slot(self, clock):
+        """A cancelled probe lets the next caller probe instead."""
+        breaker = CircuitBreaker(failure_threshold=2, cooldown=30)
+        trip(breaker)
+        clock.now += 30
+        breaker.before_call(EP)
+        breaker.release(EP)
+
+        breaker.before_call(EP)
+
+    def test_release_on_closed_endpoint_is_noop(self, clock):
+        """release() for an unknown endpoint does nothing."""
+        breaker = CircuitBreaker()
+        breaker.release(EP)
+
+        breaker.before_call(EP)
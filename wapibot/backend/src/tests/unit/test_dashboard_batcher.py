@@ -0,0 +1,215 @@
+"""Unit tests for the admin dashboard batcher and prefetch cache."""
+
+import asyncio
+
+import pytest
+
+from clients.frappe_yawlit.admin.dashboard_batcher import BatchUnavailable, DashboardBatcher
+from clients.frappe_yawlit.admin.dashboard_prefetch import DashboardPrefetch
+from clients.frappe_yawlit.utils.exceptions import NotFoundError, ServerError
+
+BUNDLE = {"message": {"stats": {"total": 3}, "badges": {"new": 1}, "recent": [{"name": "BKG-1"}]}}
+
+
+class FakeBundle:
+    """Bundle endpoint stand-in recording the limits it was called with."""
+
+    def __init__(self, result=None, error=None):
+        self.result = BUNDLE if result is None else result
+        self.error = error
+        self.limits = []
+
+    async def __call__(self, limit):
+        self.limits.append(limit)
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class TestDashboardBatcher:
+    """Test DashboardBatcher.submit/load."""
+
+    @pytest.mark.asyncio
+    async def test_same_tick_sections_share_one_bundle(self):
+        """Sections submitted together are answered by one bundle call."""
+        fetch = FakeBundle()
+        batcher = DashboardBatcher(fetch)
+
+        stats, badges, recent = await asyncio.gather(
+            batcher.submit("stats"), batcher.submit("badges"), batcher.submit("recent", 5)
+        )
+
+        assert fetch.limits == [5]
+        assert stats == {"message": {"total": 3}}
+        assert badges == {"message": {"new": 1}}
+        assert recent == {"message": [{"name": "BKG-1"}]}
+
+    @pytest.mark.asyncio
+    async def test_section_missing_from_bundle_falls_back(self):
+        """A section the server left out is fetched from its own endpoint."""
+        batcher = DashboardBatcher(FakeBundle())
+
+        async def direct():
+            return {"message": "direct"}
+
+        stats, quotes = await asyncio.gather(
+            batcher.load("stats", None, direct), batcher.load("quotes", None, direct)
+        )
+
+        assert stats == {"message": {"total": 3}}
+        assert quotes == {"message": "direct"}
+        assert batcher.supported
+
+    @pytest.mark.asyncio
+    async def test_single_section_falls_back_to_direct(self):
+        """A lone request skips the bundle and uses its own endpoint."""
+        fetch = FakeBundle()
+        batcher = DashboardBatcher(fetch)
+
+        async def direct():
+            return {"message": "direct"}
+
+        assert await batcher.load("stats", None, direct) == {"message": "direct"}
+        assert fetch.limits == []
+        assert batcher.supported
+
+    @pytest.mark.asyncio
+    async def test_load_resolves_from_bundle(self):
+        """load() returns the bundled section when others join the tick."""
+        batcher = DashboardBatcher(FakeBundle())
+
+        async def direct():
+            raise AssertionError("direct endpoint should not be called")
+
+        stats, badges = await asyncio.gather(
+            batcher.load("stats", None, direct), batcher.load("badges", None, direct)
+        )
+
+        assert stats == {"message": {"total": 3}}
+        assert badges == {"message": {"new": 1}}
+
+    @pytest.mark.asyncio
+    async def test_missing_bundle_endpoint_disables_batching(self):
+        """A 404 falls back to direct calls and stops further batching."""
+        fetch = FakeBundle(error=NotFoundError("no bundle", status_code=404))
+        batcher = DashboardBatcher(fetch)
+
+        async def direct():
+            return {"message": "direct"}
+
+        results = await asyncio.gather(
+            batcher.load("stats", None, direct), batcher.load("badges", None, direct)
+        )
+
+        assert results == [{"message": "direct"}] * 2
+        assert not batcher.supported
+        assert batcher.submit("stats") is None
+        assert len(fetch.limits) == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_are_fresh_per_waiter(self):
+        """Every waiter gets its own exception chained to the original."""
+        original = ServerError("bundle failed", status_code=500)
+        batcher = DashboardBatcher(FakeBundle(error=original))
+
+        results = await asyncio.gather(
+            batcher.submit("stats"), batcher.submit("badges"), return_exceptions=True
+        )
+
+        assert all(isinstance(error, ServerError) for error in results)
+        assert results[0] is not results[1]
+        assert all(error.__cause__ is original for error in results)
+
+    @pytest.mark.asyncio
+    async def test_recent_limit_mismatch_not_batched(self):
+        """A second "recent" with a different limit must go direct."""
+        batcher = DashboardBatcher(FakeBundle())
+        first = batcher.submit("recent", 5)
+        other = batcher.submit("stats")
+
+        assert batcher.submit("recent", 10) is None
+        assert batcher.submit("recent", 5) is not None
+        await asyncio.gather(first, other)
+
+    @pytest.mark.asyncio
+    async def test_lone_submit_raises_batch_unavailable(self):
+        """A single-section tick resolves with BatchUnavailable."""
+        batcher = DashboardBatcher(FakeBundle())
+
+        with pytest.raises(BatchUnavailable):
+            await batcher.submit("stats")
+
+
+class TestDashboardPrefetch:
+    """Test DashboardPrefetch.start/take/invalidate."""
+
+    @pytest.mark.asyncio
+    async def test_take_returns_prefetched_task_once(self):
+        """A prefetched section is handed out once."""
+        prefetch = DashboardPrefetch()
+
+        async def load():
+            return {"message": "stats"}
+
+        prefetch.start({("stats", None): load})
+        task = prefetch.take("stats", None)
+
+        assert await task == {"message": "stats"}
+        assert prefetch.take("stats", None) is None
+
+    @pytest.mark.asyncio
+    async def test_limit_is_part_of_key(self):
+        """A prefetch for one recent-bookings limit doesn't serve another."""
+        prefetch = DashboardPrefetch()
+
+        async def load():
+            return {"message": []}
+
+        prefetch.start({("recent", 5): load})
+
+        assert prefetch.take("recent", 10) is None
+        assert prefetch.take("recent", 5) is not None
+
+    @pytest.mark.asyncio
+    async def test_expired_prefetch_is_not_served(self):
+        """Results older than the TTL are discarded."""
+        prefetch = DashboardPrefetch(ttl=0)
+
+        async def load():
+            return {"message": "stale"}
+
+        prefetch.start({("stats", None): load})
+        await asyncio.sleep(0.01)
+
+        assert prefetch.take("stats", None) is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_sections(self):
+        """invalidate() removes every key for the named sections."""
+        prefetch = DashboardPrefetch()
+
+        async def load():
+            return {"message": None}
+
+        prefetch.start({("recent", 5): load, ("recent", 10): load, ("stats", None): load})
+        prefetch.invalidate(["recent"])
+
+        assert prefetch.take("recent", 5) is None
+        assert prefetch.take("recent", 10) is None
+        assert prefetch.take("stats", None) is not None
+
+    @pytest.mark.asyncio
+    async def test_take_inside_prefetch_task_is_none(self):
+        """Loaders calling back into the getter must fetch, not await themselves."""
+        prefetch = DashboardPrefetch()
+        seen = []
+
+        async def load():
+            seen.append(prefetch.take("stats", None))
+            return {"message": "stats"}
+
+        prefetch.start({("stats", None): load})
+        await asyncio.sleep(0)
+
+        assert seen == [None]
+        assert await prefetch.take("stats", None) == {"message": "stats"}
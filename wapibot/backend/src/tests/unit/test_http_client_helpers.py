@@ -0,0 +1,226 @@
+"""Unit tests for AsyncHTTPClient helpers: log redaction, coalescing keys and retries."""
+
+from dataclasses import dataclass
+
+import httpx
+import orjson
+import pytest
+import pytest_asyncio
+
+from clients.frappe_yawlit.config import FrappeClientConfig
+from clients.frappe_yawlit.utils.circuit_breaker import CircuitBreaker
+from clients.frappe_yawlit.utils.coalescing import is_read_like, request_key
+from clients.frappe_yawlit.utils.exceptions import NotFoundError, ServerError
+from clients.frappe_yawlit.utils.http_client import AsyncHTTPClient
+from clients.frappe_yawlit.utils.response_caching import CACHEABLE_ENDPOINTS, response_cache_key
+from clients.frappe_yawlit.utils.sanitize import sanitize_for_logging
+
+BASE_URL = "https://frappe.test"
+READ_EP = "/api/method/yawlit_automotive_services.api.booking.get_booking_details"
+WRITE_EP = "/api/method/yawlit_automotive_services.api.booking_management.reschedule_booking"
+
+
+class TestSanitizeForLogging:
+    """Test sanitize_for_logging."""
+
+    def test_redacts_by_key_substring_case_insensitive(self):
+        """Keys containing a sensitive name are redacted whatever their case."""
+        result = sanitize_for_logging(
+            {"Customer_Email": "a@b.c", "API_KEY": "k", "user_password": "p", "name": "John"}
+        )
+
+        assert result == {
+            "Customer_Email": "[REDACTED]",
+            "API_KEY": "[REDACTED]",
+            "user_password": "[REDACTED]",
+            "name": "John",
+        }
+
+    def test_nested_dicts_and_lists(self):
+        """Redaction reaches into nested containers."""
+        result = sanitize_for_logging(
+            {"items": [{"token": "t", "qty": 1}, "plain", [{"otp": "1234"}]], "meta": {"sid": "s"}}
+        )
+
+        assert result == {
+            "items": [{"token": "[REDACTED]", "qty": 1}, "plain", [{"otp": "[REDACTED]"}]],
+            "meta": {"sid": "[REDACTED]"},
+        }
+
+    def test_does_not_mutate_input(self):
+        """The caller's payload is left untouched."""
+        data = {"secret": "s", "nested": {"cookie": "c"}}
+
+        sanitize_for_logging(data)
+
+        assert data == {"secret": "s", "nested": {"cookie": "c"}}
+
+    def test_dataclass_payload(self):
+        """Typed payloads are sanitized as dicts."""
+
+        @dataclass
+        class Payload:
+            phone_number: str
+            booking_id: str
+
+        assert sanitize_for_logging(Payload("9876543210", "BKG-1")) == {
+            "phone_number": "[REDACTED]",
+            "booking_id": "BKG-1",
+        }
+
+    def test_depth_limit(self):
+        """Very deep structures are cut off instead of recursing forever."""
+        data = {"a": {"b": {"c": {"d": {"e": {"f": {"g": "deep"}}}}}}}
+
+        result = sanitize_for_logging(data)
+
+        assert result["a"]["b"]["c"]["d"]["e"] == {"f": "[MAX_DEPTH]"}
+
+    def test_scalars_pass_through(self):
+        """Non-container values are returned as-is."""
+        assert sanitize_for_logging("text") == "text"
+        assert sanitize_for_logging(None) is None
+
+
+class TestCoalescing:
+    """Test is_read_like, request_key and response_cache_key."""
+
+    @pytest.mark.parametrize(
+        "method,endpoint",
+        [
+            ("GET", WRITE_EP),
+            ("POST", "/api/method/frappe.client.get"),
+            ("POST", "/api/method/frappe.client.get_list"),
+            ("POST", "/api/method/yawlit_automotive_services.api.cancellation.check_cancellation_eligibility"),
+        ],
+    )
+    def test_read_like(self, method, endpoint):
+        """GETs and get*/check* methods may be coalesced and retried."""
+        assert is_read_like(method, endpoint)
+
+    @pytest.mark.parametrize(
+        "endpoint",
+        [
+            WRITE_EP,
+            "/api/method/yawlit_automotive_services.api.booking.update_booking",
+            "/api/method/yawlit_automotive_services.api.get_helpers.create_booking",
+            "/api/method/yawlit_automotive_services.api.booking.getter",
+            "/api/method/yawlit_automotive_services.api.payment.forget_card",
+        ],
+    )
+    def test_not_read_like(self, endpoint):
+        """Writes - including ones with "get" elsewhere in the path - are not."""
+        assert not is_read_like("POST", endpoint)
+
+    def test_request_key_ignores_key_order(self):
+        """Identical requests with differently ordered bodies share a key."""
+        first = request_key("POST", READ_EP, {"a": 1, "b": {"x": 1, "y": 2}}, None)
+        second = request_key("POST", READ_EP, {"b": {"y": 2, "x": 1}, "a": 1}, None)
+
+        assert first == second
+        assert first != request_key("POST", READ_EP, {"a": 2, "b": {"x": 1, "y": 2}}, None)
+
+    def test_response_cache_key(self):
+        """Only CACHEABLE_ENDPOINTS get a cache key."""
+        endpoint = next(iter(CACHEABLE_ENDPOINTS))
+
+        assert response_cache_key("POST", READ_EP, {}, None) is None
+        assert response_cache_key("POST", endpoint, {"a": 1}, None) == response_cache_key(
+            "POST", endpoint, {"a": 1}, None
+        )
+        assert response_cache_key("POST", endpoint, {"a": 1}, None) != response_cache_key(
+            "POST", endpoint, {"a": 2}, None
+        )
+
+
+class Server:
+    """MockTransport handler answering with a queue of status codes."""
+
+    def __init__(self, *statuses):
+        self.statuses = list(statuses)
+        self.calls = 0
+
+    def __call__(self, request):
+        self.calls += 1
+        status = self.statuses.pop(0) if self.statuses else 200
+        body = {"message": "ok"} if status < 400 else {"message": f"HTTP {status}"}
+        return httpx.Response(status, content=orjson.dumps(body))
+
+
+@pytest_asyncio.fixture
+async def make_client():
+    """Build AsyncHTTPClients backed by a MockTransport; closes them afterwards."""
+    clients = []
+
+    async def build(server):
+        config = FrappeClientConfig(base_url=BASE_URL, api_key="key", api_secret="secret")
+        http = AsyncHTTPClient(
+            config, max_retries=3, circuit_breaker=CircuitBreaker(failure_threshold=100), retry_backoff=False
+        )
+        await http.client.aclose()
+        http.client = httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(server))
+        clients.append(http)
+        return http
+
+    yield build
+    for http in clients:
+        await http.close()
+
+
+class TestRetryClassification:
+    """Test which failures AsyncHTTPClient retries."""
+
+    @pytest.mark.asyncio
+    async def test_read_retries_server_error(self, make_client):
+        """A transient 5xx on a read is retried."""
+        server = Server(502, 200)
+        http = await make_client(server)
+
+        assert await http.post(READ_EP, {"booking_id": "BKG-1"}) == {"message": "ok"}
+        assert server.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_read_gives_up_after_max_retries(self, make_client):
+        """Persistent 5xx on a read raises after max_retries attempts."""
+        server = Server(500, 500, 500, 500)
+        http = await make_client(server)
+
+        with pytest.raises(ServerError):
+            await http.post(READ_EP, {"booking_id": "BKG-1"})
+        assert server.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_write_does_not_retry_server_error(self, make_client):
+        """A 5xx on a write is raised at once - it may have been applied."""
+        server = Server(502, 200)
+        http = await make_client(server)
+
+        with pytest.raises(ServerError):
+            await http.post(WRITE_EP, {"booking_id": "BKG-1"})
+        assert server.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_client_error_not_retried(self, make_client):
+        """4xx responses are never retried."""
+        server = Server(404, 200)
+        http = await make_client(server)
+
+        with pytest.raises(NotFoundError):
+            await http.post(READ_EP, {"booking_id": "BKG-1"})
+        assert server.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_network_error_retried_for_writes(self, make_client):
+        """Connection failures are retried for any method (nothing was sent)."""
+        attempts = []
+
+        def flaky(request):
+            attempts.append(request)
+            if len(attempts) == 1:
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(200, content=orjson.dumps({"message": "ok"}))
+
+        http = await make_client(flaky)
+
+        assert await http.post(WRITE_EP, {"booking_id": "BKG-1"}) == {"message": "ok"}
+        assert len(attempts) == 2
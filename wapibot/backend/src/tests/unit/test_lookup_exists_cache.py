@@ -0,0 +1,182 @@
+"""Unit tests for the customer existence cache and its invalidation on profile writes."""
+
+import pytest
+
+from clients.frappe_yawlit.customer.lookup_client import (
+    EXISTS_CACHE_TTL,
+    NOT_FOUND_CACHE_TTL,
+    CustomerLookupClient,
+)
+from clients.frappe_yawlit.customer.profile_client import CustomerProfileClient
+from clients.frappe_yawlit.utils.cache_backends import MemoryResponseCache
+from clients.frappe_yawlit.utils.exceptions import NotFoundError, ServerError, TimeoutError
+
+EMAIL = "john@example.com"
+FOUND = {"message": {"name": "john@example.com", "customer_uuid": "CUST-1", "enabled": 1}}
+
+
+class FakeHTTP:
+    """Answers every post from a queue of results or exceptions."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.posts = 0
+
+    async def post(self, endpoint, payload):
+        self.posts += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class RecordingCache(MemoryResponseCache):
+    """Memory cache that remembers the TTL of every set()."""
+
+    def __init__(self):
+        super().__init__()
+        self.ttls = []
+
+    async def set(self, key, value, ttl):
+        self.ttls.append(ttl)
+        await super().set(key, value, ttl)
+
+
+class TestExistsCache:
+    """Test CustomerLookupClient.check_customer_exists caching."""
+
+    @pytest.mark.asyncio
+    async def test_found_customer_is_cached(self):
+        """A hit is served from the cache on the next check."""
+        http, cache = FakeHTTP(FOUND), RecordingCache()
+        client = CustomerLookupClient(http, cache=cache)
+
+        first = await client.check_customer_exists(EMAIL)
+        second = await client.check_customer_exists(EMAIL)
+
+        assert first == second == {"exists": True, "data": FOUND["message"]}
+        assert http.posts == 1
+        assert cache.ttls == [EXISTS_CACHE_TTL]
+
+    @pytest.mark.asyncio
+    async def test_not_found_is_cached_briefly(self):
+        """A 404 is cached as a miss with the shorter TTL."""
+        http, cache = FakeHTTP(NotFoundError("missing", status_code=404)), RecordingCache()
+        client = CustomerLookupClient(http, cache=cache)
+
+        assert await client.check_customer_exists(EMAIL) == {"exists": False}
+        assert await client.check_customer_exists(EMAIL) == {"exists": False}
+        assert http.posts == 1
+        assert cache.ttls == [NOT_FOUND_CACHE_TTL]
+
+    @pytest.mark.asyncio
+    async def test_empty_message_is_cached_as_miss(self):
+        """get_value returning no row is a cached miss."""
+        http, cache = FakeHTTP({"message": None}), RecordingCache()
+        client = CustomerLookupClient(http, cache=cache)
+
+        assert await client.check_customer_exists(EMAIL) == {"exists": False}
+        assert cache.ttls == [NOT_FOUND_CACHE_TTL]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("error", [ServerError("down", status_code=500), TimeoutError("slow")])
+    async def test_failed_lookup_is_not_cached(self, error):
+        """Server errors and timeouts read as a miss but are retried next time."""
+        http, cache = FakeHTTP(error, FOUND), RecordingCache()
+        client = CustomerLookupClient(http, cache=cache)
+
+        assert await client.check_customer_exists(EMAIL) == {"exists": False}
+        assert await client.check_customer_exists(EMAIL) == {"exists": True, "data": FOUND["message"]}
+        assert http.posts == 2
+        assert cache.ttls == [EXISTS_CACHE_TTL]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_new_lookup(self):
+        """invalidate() drops the cached result for an identifier."""
+        http = FakeHTTP({"message": None}, FOUND)
+        client = CustomerLookupClient(http)
+
+        assert await client.check_customer_exists(EMAIL) == {"exists": False}
+        await client.invalidate(EMAIL)
+
+        assert (await client.check_customer_exists(EMAIL))["exists"] is True
+        assert http.posts == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_keys_do_not_contain_identifier(self):
+        """Emails and phones are hashed before they reach the cache."""
+        cache = RecordingCache()
+        client = CustomerLookupClient(FakeHTTP(FOUND), cache=cache)
+
+        await client.check_customer_exists(EMAIL)
+
+        assert cache._data
+        assert all(EMAIL not in key for key in cache._data)
+
+
+class ProfileHTTP:
+    """Serves get_value lookups, get_customer_profile and update_profile."""
+
+    def __init__(self, profile):
+        self.profile = profile
+        self.lookups = 0
+
+    async def post(self, endpoint, payload=None):
+        if endpoint.endswith("get_customer_profile"):
+            return {"message": dict(self.profile)}
+        if endpoint.endswith(("update_profile", "complete_profile")):
+            self.profile.update(payload["data"])
+            return {"message": "ok"}
+        self.lookups += 1
+        phone = payload["filters"]["phone_number"]
+        if phone == self.profile["phone_number"]:
+            return {"message": {"customer_uuid": "CUST-1", "customer_name": "John Doe"}}
+        return {"message": None}
+
+
+class TestProfileWritesInvalidate:
+    """Test that CustomerProfileClient writes drop stale existence results."""
+
+    @pytest.mark.asyncio
+    async def test_update_profile_invalidates_old_and_new_phone(self):
+        """Changing a phone number refreshes lookups for both numbers."""
+        http = ProfileHTTP({"phone_number": "9876543210", "email": EMAIL, "customer_uuid": "CUST-1"})
+        lookup = CustomerLookupClient(http)
+        profile = CustomerProfileClient(http, lookup)
+
+        assert (await lookup.check_customer_exists("9876543210"))["exists"] is True
+        assert (await lookup.check_customer_exists("9876543211"))["exists"] is False
+
+        await profile.update_profile({"phone_number": "9876543211"})
+
+        assert (await lookup.check_customer_exists("9876543210"))["exists"] is False
+        assert (await lookup.check_customer_exists("9876543211"))["exists"] is True
+        assert http.lookups == 4
+
+    @pytest.mark.asyncio
+    async def test_complete_profile_invalidates_cached_miss(self):
+        """A phone cached as unknown is found right after registration."""
+        http = ProfileHTTP({"phone_number": "", "email": "", "customer_uuid": "CUST-1"})
+        lookup = CustomerLookupClient(http)
+        profile = CustomerProfileClient(http, lookup)
+
+        assert (await lookup.check_customer_exists("9876543210"))["exists"] is False
+        await profile.complete_profile({"phone_number": "9876543210"})
+
+        assert (await lookup.check_customer_exists("9876543210"))["exists"] is True
+
+    @pytest.mark.asyncio
+    async def test_unrelated_update_skips_profile_read(self):
+        """Updates that don't touch identifiers don't fetch the profile."""
+        http = ProfileHTTP({"phone_number": "9876543210"})
+        calls = []
+        original = http.post
+
+        async def post(endpoint, payload=None):
+            calls.append(endpoint)
+            return await original(endpoint, payload)
+
+        http.post = post
+        await CustomerProfileClient(http, CustomerLookupClient(http)).update_profile({"customer_name": "J"})
+
+        assert len(calls) == 1
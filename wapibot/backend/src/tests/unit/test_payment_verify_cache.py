@@ -0,0 +1,121 @@
+"""Unit tests for payment verification coalescing and caching."""
+
+import asyncio
+
+import pytest
+
+from clients.frappe_yawlit.payment.payment_client import PaymentClient
+from clients.frappe_yawlit.utils.cache_backends import MemoryResponseCache
+
+PAYMENT = {"order_id": "order_xyz123", "payment_id": "pay_abc456", "signature": "sig-1"}
+
+
+class FakeHTTP:
+    """Counts posts and answers with a fixed verification result."""
+
+    def __init__(self, verified=True, delay=0.0):
+        self.verified = verified
+        self.delay = delay
+        self.posts = []
+
+    async def post(self, endpoint, payload):
+        self.posts.append((endpoint, dict(payload)))
+        await asyncio.sleep(self.delay)
+        return {"message": {"verified": self.verified, "booking_id": "BKG-1"}}
+
+
+class TestPaymentVerifyCache:
+    """Test PaymentClient.verify_payment / verify_subscription_payment caching."""
+
+    @pytest.mark.asyncio
+    async def test_verified_result_is_cached(self):
+        """A redelivered verification is answered from the cache."""
+        http = FakeHTTP()
+        client = PaymentClient(http)
+
+        first = await client.verify_payment(PAYMENT)
+        second = await client.verify_payment(dict(PAYMENT))
+
+        assert first == second == {"message": {"verified": True, "booking_id": "BKG-1"}}
+        assert len(http.posts) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_verification_is_not_cached(self):
+        """Unverified results are fetched again next time."""
+        http = FakeHTTP(verified=False)
+        client = PaymentClient(http)
+
+        await client.verify_payment(PAYMENT)
+        await client.verify_payment(PAYMENT)
+
+        assert len(http.posts) == 2
+
+    @pytest.mark.asyncio
+    async def test_signature_is_part_of_key(self):
+        """A different signature never reuses another request's result."""
+        http = FakeHTTP()
+        client = PaymentClient(http)
+
+        await client.verify_payment(PAYMENT)
+        await client.verify_payment({**PAYMENT, "signature": "sig-2"})
+
+        assert len(http.posts) == 2
+
+    @pytest.mark.asyncio
+    async def test_endpoint_is_part_of_key(self):
+        """Booking and subscription verifications are cached separately."""
+        http = FakeHTTP()
+        client = PaymentClient(http)
+
+        await client.verify_payment(PAYMENT)
+        await client.verify_subscription_payment(PAYMENT)
+
+        assert len(http.posts) == 2
+        assert http.posts[0][0] != http.posts[1][0]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_post(self):
+        """Concurrent verifications of one payment make a single request."""
+        http = FakeHTTP(verified=False, delay=0.01)
+        client = PaymentClient(http)
+
+        results = await asyncio.gather(*[client.verify_payment(PAYMENT) for _ in range(4)])
+
+        assert len(http.posts) == 1
+        assert all(result == results[0] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_clients_do_not_share_in_flight_calls(self):
+        """Each client instance coalesces only its own calls."""
+        first_http, second_http = FakeHTTP(delay=0.01), FakeHTTP(delay=0.01)
+        first = PaymentClient(first_http, cache=MemoryResponseCache())
+        second = PaymentClient(second_http, cache=MemoryResponseCache())
+
+        await asyncio.gather(first.verify_payment(PAYMENT), second.verify_payment(PAYMENT))
+
+        assert len(first_http.posts) == 1
+        assert len(second_http.posts) == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_cache_deduplicates_across_clients(self):
+        """A cache shared between clients (as with Redis) serves both."""
+        cache = MemoryResponseCache()
+        first_http, second_http = FakeHTTP(), FakeHTTP()
+
+        await PaymentClient(first_http, cache=cache).verify_payment(PAYMENT)
+        await PaymentClient(second_http, cache=cache).verify_payment(PAYMENT)
+
+        assert len(first_http.posts) == 1
+        assert second_http.posts == []
+
+    @pytest.mark.asyncio
+    async def test_missing_ids_bypass_cache(self):
+        """Without order_id and payment_id every call goes to Frappe."""
+        http = FakeHTTP()
+        client = PaymentClient(http)
+        partial = {"order_id": "order_xyz123", "signature": "sig-1"}
+
+        await client.verify_payment(partial)
+        await client.verify_payment(partial)
+
+        assert len(http.posts) == 2
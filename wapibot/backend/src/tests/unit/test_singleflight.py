@@ -0,0 +1,160 @@
+"""Unit tests for SingleFlight request coalescing and the singleflight decorator."""
+
+import asyncio
+
+import pytest
+
+from clients.frappe_yawlit.utils.decorators import singleflight
+from clients.frappe_yawlit.utils.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test SingleFlight.do."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_run(self):
+        """Concurrent callers with one key share a single call and result."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"message": "ok"}
+
+        results = await asyncio.gather(*[flight.do("k", fetch) for _ in range(5)])
+
+        assert calls == 1
+        assert all(result is results[0] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        """Distinct keys are not coalesced."""
+        flight = SingleFlight()
+        seen = []
+
+        async def fetch(key):
+            seen.append(key)
+            await asyncio.sleep(0)
+            return key
+
+        results = await asyncio.gather(flight.do("a", lambda: fetch("a")), flight.do("b", lambda: fetch("b")))
+
+        assert results == ["a", "b"]
+        assert sorted(seen) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_key_forgotten_after_completion(self):
+        """A later call for the same key runs again."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flight.do("k", fetch) == 1
+        assert await flight.do("k", fetch) == 2
+        assert flight._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_error_reaches_every_caller_and_is_not_kept(self):
+        """All waiters see the error; the key is freed for a retry."""
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            flight.do("k", fail), flight.do("k", fail), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert flight._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """The shared call is shielded from one caller's cancellation."""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "done"
+
+        first = asyncio.create_task(flight.do("k", fetch))
+        second = asyncio.create_task(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await second == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    @pytest.mark.asyncio
+    async def test_call_completes_when_every_caller_cancels(self):
+        """Cancelling all callers leaves the shared call running to completion."""
+        flight = SingleFlight()
+        finished = asyncio.Event()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            finished.set()
+            return "done"
+
+        caller = asyncio.create_task(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        caller.cancel()
+
+        await asyncio.wait_for(finished.wait(), timeout=1)
+        await asyncio.sleep(0)
+        assert flight._inflight == {}
+
+
+class TestSingleflightDecorator:
+    """Test the @singleflight method decorator."""
+
+    @pytest.mark.asyncio
+    async def test_identical_arguments_coalesce(self):
+        """Concurrent calls with the same arguments run the method once."""
+        calls = []
+
+        class Client:
+            @singleflight
+            async def lookup(self, identifier):
+                calls.append(identifier)
+                await asyncio.sleep(0.01)
+                return {"id": identifier}
+
+        client = Client()
+        results = await asyncio.gather(
+            client.lookup("a"), client.lookup("a"), client.lookup("b")
+        )
+
+        assert calls.count("a") == 1
+        assert calls.count("b") == 1
+        assert results[0] is results[1]
+
+    @pytest.mark.asyncio
+    async def test_instances_do_not_share_calls(self):
+        """self is part of the key, so two clients never share a result."""
+        calls = 0
+
+        class Client:
+            @singleflight
+            async def lookup(self, identifier):
+                nonlocal calls
+                calls += 1
+                await asyncio.sleep(0.01)
+                return self
+
+        first, second = Client(), Client()
+        results = await asyncio.gather(first.lookup("a"), second.lookup("a"))
+
+        assert calls == 2
+        assert results == [first, second]
@@ -0,0 +1,65 @@
+"""Unit tests for SubscriptionPlansClient.calculate_price request bodies."""
+
+import asyncio
+
+import pytest
+
+from clients.frappe_yawlit.payloads import SubscriptionPricePayload
+from clients.frappe_yawlit.subscription.plans_client import SubscriptionPlansClient
+
+
+class FakeHTTP:
+    """Records raw bodies posted through post_raw."""
+
+    def __init__(self):
+        self.bodies = []
+
+    async def post_raw(self, endpoint, body):
+        self.bodies.append(body)
+        await asyncio.sleep(0.01)
+        return {"message": {"total_price": 999}}
+
+
+class TestCalculatePrice:
+    """Test SubscriptionPlansClient.calculate_price."""
+
+    @pytest.mark.asyncio
+    async def test_unset_optionals_are_omitted(self):
+        """Only the keys the caller set are sent - no explicit nulls."""
+        http = FakeHTTP()
+
+        await SubscriptionPlansClient(http).calculate_price("PLAN-1", 2)
+
+        assert http.bodies == [b'{"plan_id":"PLAN-1","vehicle_count":2}']
+
+    @pytest.mark.asyncio
+    async def test_set_optionals_are_sent(self):
+        """Coupon, addons and billing frequency are sent when given."""
+        http = FakeHTTP()
+
+        await SubscriptionPlansClient(http).calculate_price(
+            "PLAN-1", 2, coupon_code="SAVE20", addon_services=["WAX"], billing_frequency="Annual"
+        )
+
+        assert http.bodies == [
+            b'{"plan_id":"PLAN-1","vehicle_count":2,"coupon_code":"SAVE20",'
+            b'"addon_services":["WAX"],"billing_frequency":"Annual"}'
+        ]
+
+    @pytest.mark.asyncio
+    async def test_identical_quotes_share_one_request(self):
+        """Concurrent identical quotes are coalesced on the body bytes."""
+        http = FakeHTTP()
+        client = SubscriptionPlansClient(http)
+
+        await asyncio.gather(
+            client.calculate_price("PLAN-1", 2), client.calculate_price("PLAN-1", 2, addon_services=[])
+        )
+
+        assert len(http.bodies) == 1
+
+    def test_to_body_drops_empty_fields(self):
+        """to_body() leaves out None and empty optional fields."""
+        payload = SubscriptionPricePayload("PLAN-1", 2, None, [], None)
+
+        assert payload.to_body() == {"plan_id": "PLAN-1", "vehicle_count": 2}
@@ -0,0 +1,297 @@
+"""Unit tests for the Frappe client async TTL cache."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from clients.frappe_yawlit.utils.async_ttl_cache import _MISSING, AsyncTTLCache
+from clients.frappe_yawlit.utils.cache import session_scope, ttl_cache
+from clients.frappe_yawlit.utils.cache_backends import MemoryResponseCache
+
+
+def fake_http(session: str = "", base_url: str = "https://frappe.test"):
+    """Stand-in for AsyncHTTPClient exposing only what cache scopes read."""
+    return SimpleNamespace(config=SimpleNamespace(base_url=base_url, identity=(base_url, session)))
+
+
+class FakeClient:
+    """Base for decorated test clients: sub-clients hold ``self.http``."""
+
+    def __init__(self, http=None):
+        self.http = http or fake_http()
+
+
+class TestAsyncTTLCache:
+    """Test AsyncTTLCache behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_load_once(self):
+        """Concurrent callers for one key share a single load."""
+        cache = AsyncTTLCache(ttl=60)
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"message": "ok"}
+
+        results = await asyncio.gather(*[cache.get_or_load("k", loader) for _ in range(5)])
+
+        assert calls == 1
+        assert all(r == {"message": "ok"} for r in results)
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_reloads(self):
+        """Entries past their TTL are loaded again."""
+        cache = AsyncTTLCache(ttl=0)
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        await cache.get_or_load("k", loader)
+        assert await cache.get_or_load("k", loader) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_load_is_not_cached_or_leaked(self):
+        """A raising loader leaves nothing behind; the next call retries."""
+        cache = AsyncTTLCache(ttl=60)
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("frappe down")
+            return "ok"
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_load("k", loader)
+        assert cache._loading._inflight == {}
+        assert cache.get("k") is _MISSING
+
+        assert await cache.get_or_load("k", loader) == "ok"
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_during_load_discards_result(self):
+        """A load that started before invalidate() does not repopulate the key."""
+        cache = AsyncTTLCache(ttl=60)
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def loader():
+            started.set()
+            await release.wait()
+            return "stale"
+
+        task = asyncio.create_task(cache.get_or_load("k", loader))
+        await started.wait()
+        cache.invalidate("k")
+        release.set()
+
+        assert await task == "stale"
+        assert cache.get("k") is _MISSING
+
+    def test_lru_eviction(self):
+        """Oldest entry is evicted once maxsize is exceeded."""
+        cache = AsyncTTLCache(ttl=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache._data) == 2
+
+
+class TestTTLCacheDecorator:
+    """Test the ttl_cache method decorator."""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_reload(self):
+        """cache_clear() drops cached results."""
+        calls = 0
+
+        class Client(FakeClient):
+            @ttl_cache(ttl=60)
+            async def get_categories(self):
+                nonlocal calls
+                calls += 1
+                return calls
+
+        client = Client()
+        assert await client.get_categories() == 1
+        assert await client.get_categories() == 1
+
+        Client.get_categories.cache_clear()
+        assert await client.get_categories() == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_with_args_drops_one_entry(self):
+        """invalidate(arg) reloads that argument only."""
+        calls = []
+
+        class Client(FakeClient):
+            @ttl_cache(ttl=60)
+            async def get_plan(self, plan_id):
+                calls.append(plan_id)
+                return plan_id
+
+        client = Client()
+        await client.get_plan("A")
+        await client.get_plan("B")
+        Client.get_plan.invalidate("A")
+        await client.get_plan("A")
+        await client.get_plan("B")
+
+        assert calls == ["A", "B", "A"]
+
+    @pytest.mark.asyncio
+    async def test_positional_and_keyword_calls_share_entry(self):
+        """Arguments are bound to the signature, defaults included."""
+        calls = 0
+
+        class Client(FakeClient):
+            @ttl_cache(ttl=60)
+            async def get_plan(self, plan_id, detailed=False):
+                nonlocal calls
+                calls += 1
+                return plan_id
+
+        client = Client()
+        await client.get_plan("A")
+        await client.get_plan(plan_id="A")
+        await client.get_plan("A", False)
+        assert calls == 1
+
+        Client.get_plan.invalidate(plan_id="A")
+        await client.get_plan("A")
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_session_scope_isolates_sessions(self):
+        """One session never receives another session's cached result."""
+        calls = []
+
+        class Client(FakeClient):
+            @ttl_cache(ttl=60, scope=session_scope)
+            async def get_booking_details(self, booking_id):
+                calls.append(self.http.config.identity[1])
+                return {"owner": self.http.config.identity[1]}
+
+        alice = Client(fake_http("sid:alice"))
+        bob = Client(fake_http("sid:bob"))
+
+        assert (await alice.get_booking_details("BK-1"))["owner"] == "sid:alice"
+        assert (await bob.get_booking_details("BK-1"))["owner"] == "sid:bob"
+        assert (await alice.get_booking_details("BK-1"))["owner"] == "sid:alice"
+        assert calls == ["sid:alice", "sid:bob"]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_entry_in_every_scope(self):
+        """invalidate(arg) evicts the entry for all sessions."""
+        calls = 0
+
+        class Client(FakeClient):
+            @ttl_cache(ttl=60, scope=session_scope)
+            async def get_booking_details(self, booking_id):
+                nonlocal calls
+                calls += 1
+                return calls
+
+        alice = Client(fake_http("sid:alice"))
+        bob = Client(fake_http("sid:bob"))
+        await alice.get_booking_details("BK-1")
+        await bob.get_booking_details("BK-1")
+
+        Client.get_booking_details.invalidate("BK-1")
+        await alice.get_booking_details("BK-1")
+        await bob.get_booking_details("BK-1")
+        assert calls == 4
+
+    @pytest.mark.asyncio
+    async def test_default_scope_separates_hosts(self):
+        """Reference data is shared per Frappe host, not across hosts."""
+        calls = 0
+
+        class Client(FakeClient):
+            @ttl_cache(ttl=60)
+            async def get_categories(self):
+                nonlocal calls
+                calls += 1
+                return calls
+
+        await Client(fake_http("sid:a", "https://one.test")).get_categories()
+        await Client(fake_http("sid:b", "https://one.test")).get_categories()
+        await Client(fake_http("sid:a", "https://two.test")).get_categories()
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_on_serves_last_good_value(self):
+        """A listed error on reload returns the expired value instead."""
+        calls = 0
+
+        class Client(FakeClient):
+            @ttl_cache(ttl=0, stale_on=(ConnectionError,))
+            async def get_plans(self):
+                nonlocal calls
+                calls += 1
+                if calls > 1:
+                    raise ConnectionError("breaker open")
+                return ["PLAN-1"]
+
+        client = Client()
+        assert await client.get_plans() == ["PLAN-1"]
+        assert await client.get_plans() == ["PLAN-1"]
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_on_without_value_raises(self):
+        """With nothing cached yet, the error propagates."""
+        class Client(FakeClient):
+            @ttl_cache(ttl=60, stale_on=(ConnectionError,))
+            async def get_plans(self):
+                raise ConnectionError("breaker open")
+
+        with pytest.raises(ConnectionError):
+            await Client().get_plans()
+
+    @pytest.mark.asyncio
+    async def test_other_errors_are_not_masked_by_stale_on(self):
+        """Errors outside stale_on propagate even with a stale value."""
+        calls = 0
+
+        class Client(FakeClient):
+            @ttl_cache(ttl=0, stale_on=(ConnectionError,))
+            async def get_plans(self):
+                nonlocal calls
+                calls += 1
+                if calls > 1:
+                    raise ValueError("bad response")
+                return ["PLAN-1"]
+
+        client = Client()
+        await client.get_plans()
+        with pytest.raises(ValueError):
+            await client.get_plans()
+
+
+class TestMemoryResponseCache:
+    """Test the default response-bytes cache backend."""
+
+    @pytest.mark.asyncio
+    async def test_hit_until_expiry(self):
+        """Entries are served until their own TTL lapses."""
+        cache = MemoryResponseCache()
+        await cache.set("fresh", b'{"message": []}', ttl=60)
+        await cache.set("stale", b"{}", ttl=0)
+
+        assert await cache.get("fresh") == b'{"message": []}'
+        assert await cache.get("stale") is None
+        assert await cache.get("missing") is None
@@ -0,0 +1,110 @@
+"""Unit tests for WAPI and Frappe webhook HMAC signature checks."""
+
+import hashlib
+import hmac
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+import api.v1.wapi_webhook as wapi_webhook
+from api.v1.frappe_webhook import verify_frappe_signature
+from clients.frappe_yawlit.config import FrappeClientConfig
+
+SECRET = b"webhook-secret"
+BODY = b'{"event": "message", "data": {"text": "hi"}}'
+
+
+def sign(body: bytes, secret: bytes = SECRET) -> str:
+    """Reference HMAC-SHA256 hex digest."""
+    return hmac.new(secret, body, hashlib.sha256).hexdigest()
+
+
+def keyed_proto(secret: bytes = SECRET):
+    """Pre-keyed HMAC prototype, as wapi_webhook builds at import."""
+    return hmac.new(secret, b"", hashlib.sha256)
+
+
+class TestWapiSignature:
+    """Test verify_webhook_signature."""
+
+    def test_valid_signature(self):
+        """A correct hex digest is accepted."""
+        with patch.object(wapi_webhook, "_HMAC_PROTO", keyed_proto()):
+            assert wapi_webhook.verify_webhook_signature(BODY, sign(BODY))
+
+    def test_uppercase_hex_accepted(self):
+        """Hex case does not matter - raw digests are compared."""
+        with patch.object(wapi_webhook, "_HMAC_PROTO", keyed_proto()):
+            assert wapi_webhook.verify_webhook_signature(BODY, sign(BODY).upper())
+
+    def test_tampered_body_rejected(self):
+        """A signature for a different body is rejected."""
+        with patch.object(wapi_webhook, "_HMAC_PROTO", keyed_proto()):
+            assert not wapi_webhook.verify_webhook_signature(BODY + b" ", sign(BODY))
+
+    def test_wrong_secret_rejected(self):
+        """A signature made with another secret is rejected."""
+        with patch.object(wapi_webhook, "_HMAC_PROTO", keyed_proto()):
+            assert not wapi_webhook.verify_webhook_signature(BODY, sign(BODY, b"other"))
+
+    def test_missing_or_malformed_header_rejected(self):
+        """Empty, non-hex and truncated headers are rejected without raising."""
+        with patch.object(wapi_webhook, "_HMAC_PROTO", keyed_proto()):
+            assert not wapi_webhook.verify_webhook_signature(BODY, "")
+            assert not wapi_webhook.verify_webhook_signature(BODY, "not-hex")
+            assert not wapi_webhook.verify_webhook_signature(BODY, sign(BODY)[:-2])
+
+    def test_prototype_is_not_consumed(self):
+        """Repeated checks copy the keyed prototype instead of mutating it."""
+        with patch.object(wapi_webhook, "_HMAC_PROTO", keyed_proto()):
+            for _ in range(3):
+                assert wapi_webhook.verify_webhook_signature(BODY, sign(BODY))
+
+    def test_no_secret_allows_request(self):
+        """Without a configured secret verification is skipped (development)."""
+        with patch.object(wapi_webhook, "_HMAC_PROTO", None):
+            assert wapi_webhook.verify_webhook_signature(BODY, "")
+
+
+class TestFrappeSignature:
+    """Test FrappeClientConfig.sign and verify_frappe_signature."""
+
+    def make_config(self, secret: str | None = "api-secret") -> FrappeClientConfig:
+        """Config with the given API secret (None = not configured)."""
+        config = FrappeClientConfig(base_url="https://frappe.test", api_key="key", api_secret="placeholder")
+        config.api_secret = secret
+        return config
+
+    def test_sign_matches_reference_hmac(self):
+        """sign() is HMAC-SHA256 of the body keyed with the API secret."""
+        config = self.make_config()
+
+        assert config.sign(BODY) == sign(BODY, b"api-secret")
+        assert config.sign(b"other") == sign(b"other", b"api-secret")
+
+    def test_sign_without_secret_raises(self):
+        """sign() refuses to run without an API secret."""
+        config = self.make_config(secret=None)
+
+        with pytest.raises(ValueError):
+            config.sign(BODY)
+
+    def test_verify_accepts_valid_signature(self):
+        """A body signed with the API secret is accepted."""
+        client = SimpleNamespace(config=self.make_config())
+        with patch("api.v1.frappe_webhook.get_yawlit_client", return_value=client):
+            assert verify_frappe_signature(BODY, sign(BODY, b"api-secret"))
+
+    def test_verify_rejects_bad_or_missing_signature(self):
+        """Wrong and empty signatures are rejected."""
+        client = SimpleNamespace(config=self.make_config())
+        with patch("api.v1.frappe_webhook.get_yawlit_client", return_value=client):
+            assert not verify_frappe_signature(BODY, sign(BODY, b"other"))
+            assert not verify_frappe_signature(BODY, "")
+
+    def test_verify_rejects_when_secret_missing(self):
+        """Without an API secret every webhook is rejected (fail closed)."""
+        client = SimpleNamespace(config=self.make_config(secret=None))
+        with patch("api.v1.frappe_webhook.get_yawlit_client", return_value=client):
+            assert not verify_frappe_signature(BODY, sign(BODY, b"api-secret"))
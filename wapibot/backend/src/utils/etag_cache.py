@@ -0,0 +1,67 @@
+"""Short-TTL response cache with ETag support for polled GET endpoints.
+
+Dashboards poll endpoints like /brain/status every few seconds. The payload
+is rebuilt and serialized at most once per TTL, and clients that send a
+matching If-None-Match get an empty 304 instead of the body.
+"""
+
+import hashlib
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+import orjson
+from fastapi import Response
+
+
+class ETagCache:
+    """Caches one serialized JSON payload plus its ETag for a TTL.
+
+    Example:
+        >>> _status_cache = ETagCache(ttl=5)
+        >>> @router.get("/status")
+        ... async def status(if_none_match: str | None = Header(None)):
+        ...     return await _status_cache.respond(build_status, if_none_match)
+    """
+
+    def __init__(self, ttl: float = 5.0):
+        """Initialize an empty cache.
+
+        Args:
+            ttl: Seconds the payload is reused; also sent as Cache-Control max-age
+        """
+        self.ttl = ttl
+        self._ts = 0.0
+        self._body = b""
+        self._etag = ""
+
+    async def _refresh(self, produce: Callable[[], Awaitable[Any]]) -> None:
+        """Rebuild the payload if the cached copy is stale."""
+        if self._body and time.monotonic() - self._ts < self.ttl:
+            return
+        self._body = orjson.dumps(await produce())
+        self._etag = f'"{hashlib.blake2b(self._body, digest_size=8).hexdigest()}"'
+        self._ts = time.monotonic()
+
+    async def respond(
+        self,
+        produce: Callable[[], Awaitable[Any]],
+        if_none_match: Optional[str] = None
+    ) -> Response:
+        """Return 304 if the client's ETag matches, else the cached JSON body.
+
+        Args:
+            produce: Coroutine function building the JSON-serializable payload
+            if_none_match: Value of the request's If-None-Match header
+
+        Returns:
+            Response with ETag and Cache-Control headers
+        """
+        await self._refresh(produce)
+        headers = {"ETag": self._etag, "Cache-Control": f"max-age={int(self.ttl)}"}
+
+        if if_none_match:
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            if self._etag in tags or "*" in tags:
+                return Response(status_code=304, headers=headers)
+
+        return Response(content=self._body, media_type="application/json", headers=headers)
@@ -4,9 +4,12 @@ Provides helpers for getting/setting nested fields using dot notation.
 Supports the atomic node architecture.
 """
 
-from typing import Any, Optional
+import logging
+from typing import Any
 from workflows.shared.state import BookingState
 
+logger = logging.getLogger(__name__)
+
 
 def get_nested_field(state: BookingState, field_path: str) -> Any:
     """Get nested field value using dot notation.
@@ -22,6 +25,10 @@ def get_nested_field(state: BookingState, field_path: str) -> Any:
         >>> get_nested_field(state, "customer.first_name")
         "Hrijul"
     """
+    if "." not in field_path:
+        # Top-level field (the common case) - plain dict lookup, no split
+        return state.get(field_path) if isinstance(state, dict) else None
+
     parts = field_path.split(".")
     current = state
 
@@ -45,9 +52,6 @@ def set_nested_field(state: BookingState, field_path: str, value: Any) -> None:
     Example:
         >>> set_nested_field(state, "customer.first_name", "Hrijul")
     """
-    import logging
-    logger = logging.getLogger(__name__)
-
     parts = field_path.split(".")
     current = state
 
@@ -60,9 +64,10 @@ def set_nested_field(state: BookingState, field_path: str, value: Any) -> None:
     # Set final field
     current[parts[-1]] = value
 
-    # DEBUG: Verify the value was actually set
-    logger.debug(f"SET_NESTED_FIELD: {field_path} = {str(value)[:100]}...")
-    logger.debug(f"SET_NESTED_FIELD: Verification - state['{field_path}'] = {str(state.get(field_path))[:100]}...")
+    # DEBUG: Verify the value was actually set (skip the str() calls otherwise)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("SET_NESTED_FIELD: %s = %s...", field_path, str(value)[:100])
+        logger.debug("SET_NESTED_FIELD: Verification - %s = %s...", field_path, str(get_nested_field(state, field_path))[:100])
 
 
 def field_exists(state: BookingState, field_path: str) -> bool:
@@ -1,5 +1,6 @@
 """Main brain node group - Routes to appropriate brain mode."""
 
+import functools
 import logging
 from langgraph.graph import StateGraph
 from models.brain_state import BrainState
@@ -87,3 +88,16 @@ def create_brain_workflow() -> StateGraph:
 
     logger.info("Main brain workflow created")
     return workflow.compile()
+
+
+@functools.lru_cache(maxsize=1)
+def get_brain_workflow():
+    """Get the compiled brain workflow, built once per process.
+
+    Safe to share: mode and enabled flags are read from get_brain_settings()
+    at routing time, so toggles still apply without rebuilding the graph.
+
+    Returns:
+        Compiled LangGraph workflow
+    """
+    return create_brain_workflow()
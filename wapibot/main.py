@@ -23,12 +23,14 @@ def main():
     from core.config import settings
 
     # Run FastAPI server (lifespan handles Redis, ngrok, Celery startup)
+    # uvloop (libuv) cuts per-request socket overhead; not available on Windows
     uvicorn.run(
         "main:app",
         host=settings.host,
         port=settings.port,
         reload=settings.reload,
-        log_level=settings.log_level.lower()
+        log_level=settings.log_level.lower(),
+        loop="asyncio" if sys.platform == "win32" else "uvloop"
     )
 
 